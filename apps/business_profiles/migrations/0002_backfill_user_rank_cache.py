@@ -0,0 +1,22 @@
+# Generated manually to backfill User.rank_cache from existing business profiles
+
+from django.db import migrations
+
+
+def backfill_rank_cache(apps, schema_editor):
+    BusinessProfile = apps.get_model("business_profiles", "BusinessProfile")
+    User = apps.get_model("users", "User")
+    for user_id, certifications in BusinessProfile.objects.values_list("user_id", "certifications").iterator():
+        User.objects.filter(pk=user_id).update(rank_cache=len(certifications) if certifications else 0)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("business_profiles", "0001_initial"),
+        ("users", "0003_user_rank_cache"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_rank_cache, migrations.RunPython.noop),
+    ]
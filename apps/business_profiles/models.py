@@ -5,6 +5,7 @@ One-to-one relationship with User model.
 """
 
 from django.conf import settings
+from django.contrib.auth import get_user_model
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 
@@ -76,3 +77,36 @@ class BusinessProfile(models.Model):
     def certification_count(self):
         return len(self.certifications) if self.certifications else 0
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored name so save() can tell when it was renamed
+        if "company_name" in field_names:
+            instance._loaded_company_name = instance.company_name
+        return instance
+
+    def save(self, *args, **kwargs):
+        renamed = getattr(self, "_loaded_company_name", self.company_name) != self.company_name
+        super().save(*args, **kwargs)
+        # Keep the denormalized rank on User in sync for buyer request filtering
+        self._set_user_rank_cache(self.certification_count)
+        if renamed:
+            self._touch_catalogs()
+            self._loaded_company_name = self.company_name
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        self._set_user_rank_cache(None)
+        return result
+
+    def _set_user_rank_cache(self, rank):
+        get_user_model().objects.filter(pk=self.user_id).update(rank_cache=rank)
+        if BusinessProfile.user.is_cached(self):
+            self.user.rank_cache = rank
+
+    def _touch_catalogs(self):
+        # Public catalog caches are keyed on updated_at and embed company_name as seller_name
+        from apps.catalogs.models import ProductCatalog
+
+        ProductCatalog.objects.filter(product__business=self).touch()
+
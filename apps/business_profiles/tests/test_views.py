@@ -140,6 +140,25 @@ class TestUpdateCertifications:
         assert response.data["success"] is True
         assert set(response.data["data"]["certifications"]) == {"Halal", "ISO"}
 
+    def test_update_certifications_syncs_user_rank_cache(self, api_client, umkm_user):
+        """Test certifications update keeps the denormalized user rank in sync."""
+        profile = BusinessProfileFactory(user=umkm_user, certifications=[])
+        umkm_user.refresh_from_db()
+        assert umkm_user.rank_cache == 0
+
+        api_client.force_authenticate(user=umkm_user)
+        url = reverse(
+            "business_profiles:business-profile-certifications",
+            kwargs={"profile_id": profile.id},
+        )
+        api_client.patch(url, {"certifications": ["Halal", "ISO"]}, format="json")
+        umkm_user.refresh_from_db()
+        assert umkm_user.rank_cache == 2
+
+        profile.delete()
+        umkm_user.refresh_from_db()
+        assert umkm_user.rank_cache is None
+
     def test_update_certifications_invalid(self, api_client, umkm_user):
         """Test updating with invalid certification."""
         profile = BusinessProfileFactory(user=umkm_user)
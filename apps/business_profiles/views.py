@@ -385,7 +385,7 @@ class DashboardSummaryView(APIView):
             total_business_profiles = BusinessProfile.objects.count()
             total_products = Product.objects.count()
             total_catalogs = ProductCatalog.objects.count()
-            total_published_catalogs = ProductCatalog.objects.filter(is_published=True).count()
+            total_published_catalogs = ProductCatalog.published.count()
             total_buyer_requests = BuyerRequest.objects.count()
 
             # AI usage stats
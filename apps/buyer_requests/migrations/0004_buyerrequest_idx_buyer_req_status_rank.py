@@ -0,0 +1,21 @@
+# Generated by Django 5.0.14 on 2026-10-17 16:04
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("buyer_requests", "0003_buyerprofile_annual_import_volume_description_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="buyerrequest",
+            index=models.Index(
+                fields=["status", "min_rank_required"], name="idx_buyer_req_status_rank"
+            ),
+        ),
+    ]
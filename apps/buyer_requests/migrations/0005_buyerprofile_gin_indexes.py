@@ -0,0 +1,40 @@
+# Generated manually: PostgreSQL-only GIN indexes for BuyerProfile list filters
+
+from django.db import migrations
+
+CREATE_INDEXES = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm;",
+    "CREATE INDEX IF NOT EXISTS bp_pref_categories_gin ON buyer_profiles "
+    "USING GIN (preferred_product_categories jsonb_path_ops);",
+    "CREATE INDEX IF NOT EXISTS bp_source_countries_gin ON buyer_profiles "
+    "USING GIN (source_countries jsonb_path_ops);",
+    "CREATE INDEX IF NOT EXISTS bp_name_trgm ON buyer_profiles USING GIN (company_name gin_trgm_ops);",
+]
+
+DROP_INDEXES = [
+    "DROP INDEX IF EXISTS bp_pref_categories_gin;",
+    "DROP INDEX IF EXISTS bp_source_countries_gin;",
+    "DROP INDEX IF EXISTS bp_name_trgm;",
+]
+
+
+def _run_on_postgres(statements):
+    def run(apps, schema_editor):
+        # GIN/pg_trgm are PostgreSQL-specific; other backends (SQLite in tests) skip them
+        if schema_editor.connection.vendor != "postgresql":
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("buyer_requests", "0004_buyerrequest_idx_buyer_req_status_rank"),
+    ]
+
+    operations = [
+        migrations.RunPython(_run_on_postgres(CREATE_INDEXES), _run_on_postgres(DROP_INDEXES)),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.0.14 on 2026-10-17 16:14
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def create_trigram_index(apps, schema_editor):
+    # pg_trgm is PostgreSQL-specific; other backends (SQLite in tests) skip it
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS br_cat_trgm_ix ON buyer_requests USING GIN (product_category gin_trgm_ops);"
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS br_cat_trgm_ix;")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("buyer_requests", "0005_buyerprofile_gin_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="buyerrequest",
+            index=models.Index(
+                fields=["status", "destination_country", "min_rank_required"],
+                name="br_status_dest_rank_ix",
+            ),
+        ),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
@@ -117,6 +117,9 @@ class BuyerProfile(models.Model):
         ordering = ["-created_at"]
         indexes = [
             models.Index(fields=["company_name"]),
+            # GIN indexes on preferred_product_categories/source_countries (jsonb @> lookups)
+            # and a pg_trgm index on company_name (icontains search) are PostgreSQL-only,
+            # see migration 0005_buyerprofile_gin_indexes
         ]
 
     def __str__(self):
@@ -198,6 +201,15 @@ class BuyerRequest(models.Model):
             models.Index(fields=["status"]),
             models.Index(fields=["product_category"]),
             models.Index(fields=["destination_country"]),
+            # UMKM list view filters on status + min_rank_required together
+            models.Index(fields=["status", "min_rank_required"], name="idx_buyer_req_status_rank"),
+            # List view status + destination_country (+ rank for UMKM) filter combination
+            models.Index(
+                fields=["status", "destination_country", "min_rank_required"],
+                name="br_status_dest_rank_ix",
+            ),
+            # pg_trgm GIN index on product_category (icontains filter) is PostgreSQL-only,
+            # see migration 0006_buyerrequest_br_status_dest_rank_ix
             # GIN index for JSONB keyword_tags (PostgreSQL specific)
             # Note: Django doesn't support GIN indexes directly, will need raw SQL in migration
         ]
@@ -9,11 +9,13 @@ Includes:
 from rest_framework import serializers
 from apps.business_profiles.models import BusinessProfile
 from apps.users.models import User
+from core.exceptions import ConflictException
+from core.serializers import CachedFieldsMixin
 
 from .models import BuyerRequest, BuyerProfile, RequestStatus
 
 
-class BuyerRequestSerializer(serializers.ModelSerializer):
+class BuyerRequestSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for BuyerRequest (READ operations).
     
@@ -54,7 +56,7 @@ class BuyerRequestSerializer(serializers.ModelSerializer):
             return obj.buyer_user.full_name
 
 
-class CreateBuyerRequestSerializer(serializers.Serializer):
+class CreateBuyerRequestSerializer(BuyerRequestSerializer):
     """
     Serializer for creating BuyerRequest.
     
@@ -107,6 +109,9 @@ class CreateBuyerRequestSerializer(serializers.Serializer):
         min_value=0,
     )
 
+    class Meta(BuyerRequestSerializer.Meta):
+        read_only_fields = BuyerRequestSerializer.Meta.read_only_fields + ["status"]
+
     def create(self, validated_data):
         """Create BuyerRequest with buyer_user from request."""
         buyer_user = self.context["request"].user
@@ -116,7 +121,7 @@ class CreateBuyerRequestSerializer(serializers.Serializer):
         )
 
 
-class UpdateBuyerRequestSerializer(serializers.Serializer):
+class UpdateBuyerRequestSerializer(BuyerRequestSerializer):
     """
     Serializer for updating BuyerRequest.
     
@@ -135,15 +140,18 @@ class UpdateBuyerRequestSerializer(serializers.Serializer):
     )
     min_rank_required = serializers.IntegerField(required=False, min_value=0)
 
+    class Meta(BuyerRequestSerializer.Meta):
+        read_only_fields = BuyerRequestSerializer.Meta.read_only_fields + ["status"]
+
     def update(self, instance, validated_data):
         """Update BuyerRequest fields."""
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
-        instance.save()
+        instance.save(update_fields=[*validated_data, "updated_at"])
         return instance
 
 
-class UpdateBuyerRequestStatusSerializer(serializers.Serializer):
+class UpdateBuyerRequestStatusSerializer(BuyerRequestSerializer):
     """
     Serializer for updating BuyerRequest status only.
     
@@ -159,10 +167,13 @@ class UpdateBuyerRequestStatusSerializer(serializers.Serializer):
         },
     )
 
+    class Meta(BuyerRequestSerializer.Meta):
+        read_only_fields = [field for field in BuyerRequestSerializer.Meta.fields if field != "status"]
+
     def update(self, instance, validated_data):
         """Update BuyerRequest status."""
         instance.status = validated_data["status"]
-        instance.save()
+        instance.save(update_fields=["status", "updated_at"])
         return instance
 
 
@@ -186,7 +197,7 @@ class MatchedCatalogSerializer(serializers.Serializer):
     primary_image_url = serializers.URLField(allow_null=True)
 
 
-class MatchedUMSerializer(serializers.Serializer):
+class MatchedUMSerializer(CachedFieldsMixin, serializers.Serializer):
     """
     Serializer for matched UMKM with catalog details in buyer request.
     
@@ -205,7 +216,7 @@ class MatchedUMSerializer(serializers.Serializer):
     catalog = MatchedCatalogSerializer()
 
 
-class BuyerProfileSerializer(serializers.ModelSerializer):
+class BuyerProfileSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for BuyerProfile (READ operations).
     """
@@ -248,7 +259,7 @@ class BuyerProfileSerializer(serializers.ModelSerializer):
         return obj.user.buyer_requests.count()
 
 
-class CreateBuyerProfileSerializer(serializers.Serializer):
+class CreateBuyerProfileSerializer(BuyerProfileSerializer):
     """
     Serializer for creating BuyerProfile.
     """
@@ -322,7 +333,6 @@ class CreateBuyerProfileSerializer(serializers.Serializer):
         
         # Check if profile already exists
         if hasattr(user, "buyer_profile"):
-            from core.exceptions import ConflictException
             raise ConflictException("Buyer profile already exists for this user")
         
         return BuyerProfile.objects.create(
@@ -331,7 +341,7 @@ class CreateBuyerProfileSerializer(serializers.Serializer):
         )
 
 
-class UpdateBuyerProfileSerializer(serializers.Serializer):
+class UpdateBuyerProfileSerializer(BuyerProfileSerializer):
     """
     Serializer for updating BuyerProfile.
     """
@@ -358,6 +368,6 @@ class UpdateBuyerProfileSerializer(serializers.Serializer):
         """Update BuyerProfile fields."""
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
-        instance.save()
+        instance.save(update_fields=[*validated_data, "updated_at"])
         return instance
 
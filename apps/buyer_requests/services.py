@@ -12,18 +12,33 @@ Returns multiple catalogs per UMKM if they have multiple matching catalogs.
 """
 
 import logging
+import re
 from typing import Dict, List, Optional
 import json
 
-from django.db.models import Q, QuerySet
+from django.db.models import FloatField, Q, QuerySet
+from django.db.models.functions import Cast
 from apps.business_profiles.models import BusinessProfile
 from apps.export_analysis.models import ExportAnalysis
-from apps.products.models import Product, ProductEnrichment
+from apps.products.models import Product
 from apps.catalogs.models import ProductCatalog
 from core.services.ai_service import KolosalAIService
 
 logger = logging.getLogger(__name__)
 
+# Decimal catalog columns cast to float by the database, so building the
+# match dicts does not allocate a Decimal per field. Prices are stored as
+# integer cents (MoneyCentsField), hence the division.
+CATALOG_FLOAT_ANNOTATIONS = {
+    "moq_f": Cast("min_order_quantity", FloatField()),
+    "exw_f": Cast("base_price_exw", FloatField()) / 100.0,
+    "fob_f": Cast("base_price_fob", FloatField()) / 100.0,
+    "cif_f": Cast("base_price_cif", FloatField()) / 100.0,
+}
+
+# Word tokenizer for spec keyword matching
+WORD_RE = re.compile(r"\w+")
+
 
 class BuyerRequestMatchingService:
     """
@@ -97,12 +112,10 @@ class BuyerRequestMatchingService:
         Output: Array of matched catalogs with catalog details
         """
         # Get published catalogs (via product relationship)
-        catalogs = ProductCatalog.objects.filter(
-            is_published=True
-        ).select_related(
-            "product__business__user",
+        catalogs = ProductCatalog.published.select_related(
+            "product__business",
             "product__enrichment"
-        ).prefetch_related("images")
+        ).annotate(**CATALOG_FLOAT_ANNOTATIONS)
         
         # Determine category_id from product_category
         category_id = None
@@ -127,11 +140,8 @@ class BuyerRequestMatchingService:
         for catalog in catalogs:
             umkm_id = catalog.product.business.user_id
 
-            # Get primary image URL
-            primary_image = catalog.images.filter(is_primary=True).first()
-            if not primary_image:
-                primary_image = catalog.images.first()
-            image_url = primary_image.url if primary_image else None
+            # Denormalized primary (or first) image URL, no image query needed
+            image_url = catalog.primary_image_url or None
 
             matched_catalogs.append({
                 "catalog_id": catalog.id,
@@ -143,12 +153,12 @@ class BuyerRequestMatchingService:
                     "marketing_description": catalog.marketing_description,
                     "technical_specs": catalog.technical_specs,
                     "tags": catalog.tags,
-                    "min_order_quantity": float(catalog.min_order_quantity),
+                    "min_order_quantity": catalog.moq_f,
                     "unit_type": catalog.unit_type,
                     "available_stock": catalog.available_stock,
-                    "base_price_exw": float(catalog.base_price_exw),
-                    "base_price_fob": float(catalog.base_price_fob) if catalog.base_price_fob else None,
-                    "base_price_cif": float(catalog.base_price_cif) if catalog.base_price_cif else None,
+                    "base_price_exw": catalog.exw_f,
+                    "base_price_fob": catalog.fob_f or None,
+                    "base_price_cif": catalog.cif_f or None,
                     "lead_time_days": catalog.lead_time_days,
                     "primary_image_url": image_url,
                 }
@@ -169,12 +179,10 @@ class BuyerRequestMatchingService:
         # Get published catalogs matching category (via product relationship)
         # product_category in BuyerRequest is a string, category_id in Product is an integer
         # Try to match by converting product_category to int if possible
-        catalogs = ProductCatalog.objects.filter(
-            is_published=True
-        ).select_related(
-            "product__business__user",
+        catalogs = ProductCatalog.published.select_related(
+            "product__business",
             "product__enrichment"
-        ).prefetch_related("images")
+        ).annotate(**CATALOG_FLOAT_ANNOTATIONS)
         
         # Filter by category - try to match category_id as integer
         # If product_category is numeric, use exact match; otherwise get all and filter later
@@ -199,29 +207,24 @@ class BuyerRequestMatchingService:
 
             # Check HS code match if available
             if buyer_request.hs_code_target:
-                try:
-                    enrichment = catalog.product.enrichment
-                    if enrichment and enrichment.hs_code_recommendation:
-                        hs_code = enrichment.hs_code_recommendation
-                        target_hs = buyer_request.hs_code_target
-
-                        # Exact match = 100
-                        if hs_code == target_hs:
-                            base_score = 100
-                        # Partial match (starts with) = 75
-                        elif hs_code.startswith(target_hs[:6]) or target_hs.startswith(hs_code[:6]):
-                            base_score = 75
-                        # Same category but different HS = 25
-                        else:
-                            base_score = 25
-                except ProductEnrichment.DoesNotExist:
-                    pass
-
-            # Get primary image URL
-            primary_image = catalog.images.filter(is_primary=True).first()
-            if not primary_image:
-                primary_image = catalog.images.first()
-            image_url = primary_image.url if primary_image else None
+                # enrichment is select_related; a missing row is cached as absent
+                enrichment = getattr(catalog.product, "enrichment", None)
+                if enrichment and enrichment.hs_code_recommendation:
+                    hs_code = enrichment.hs_code_recommendation
+                    target_hs = buyer_request.hs_code_target
+
+                    # Exact match = 100
+                    if hs_code == target_hs:
+                        base_score = 100
+                    # Partial match (starts with) = 75
+                    elif hs_code.startswith(target_hs[:6]) or target_hs.startswith(hs_code[:6]):
+                        base_score = 75
+                    # Same category but different HS = 25
+                    else:
+                        base_score = 25
+
+            # Denormalized primary (or first) image URL, no image query needed
+            image_url = catalog.primary_image_url or None
 
             matched_catalogs.append({
                 "catalog_id": catalog.id,
@@ -234,12 +237,12 @@ class BuyerRequestMatchingService:
                     "marketing_description": catalog.marketing_description,
                     "technical_specs": catalog.technical_specs,
                     "tags": catalog.tags,
-                    "min_order_quantity": float(catalog.min_order_quantity),
+                    "min_order_quantity": catalog.moq_f,
                     "unit_type": catalog.unit_type,
                     "available_stock": catalog.available_stock,
-                    "base_price_exw": float(catalog.base_price_exw),
-                    "base_price_fob": float(catalog.base_price_fob) if catalog.base_price_fob else None,
-                    "base_price_cif": float(catalog.base_price_cif) if catalog.base_price_cif else None,
+                    "base_price_exw": catalog.exw_f,
+                    "base_price_fob": catalog.fob_f or None,
+                    "base_price_cif": catalog.cif_f or None,
                     "lead_time_days": catalog.lead_time_days,
                     "primary_image_url": image_url,
                 }
@@ -251,7 +254,8 @@ class BuyerRequestMatchingService:
         self,
         spec_requirements: str,
         keyword_tags: List[str],
-        base_matches: List[Dict]
+        base_matches: List[Dict],
+        ai_keywords: Optional[List[str]] = None,
     ) -> Dict[int, int]:
         """
         PBI-BE-M6-10: AI Smart Matching - Spec Requirements (Updated for Catalogs)
@@ -262,21 +266,31 @@ class BuyerRequestMatchingService:
         Text similarity scoring: keyword overlap, semantic matching
         Bonus score for matching keyword_tags
         Output: spec_match_score (0-100) per catalog
+
+        ai_keywords: keywords already extracted for this spec;
+        when omitted, they are extracted here with a single AI call.
         """
         # Extract keywords from spec using AI
-        try:
-            prompt = f"Ekstrak kata kunci penting dari spesifikasi berikut (berikan hanya kata kunci, pisahkan dengan koma):\n\n{spec_requirements}"
-            system_prompt = "Kamu adalah ahli yang mengekstrak kata kunci dari spesifikasi produk. Berikan hanya kata kunci yang relevan, pisahkan dengan koma."
-            
-            ai_keywords_text = self.ai_service._call_ai(prompt, system_prompt)
-            ai_keywords = [k.strip().lower() for k in ai_keywords_text.split(",") if k.strip()]
-        except Exception as e:
-            logger.error(f"Error extracting keywords from spec: {e}")
-            ai_keywords = []
+        if ai_keywords is None:
+            try:
+                ai_keywords = self.ai_service.extract_keywords(spec_requirements)
+            except Exception as e:
+                logger.error(f"Error extracting keywords from spec: {e}")
+                ai_keywords = []
 
         # Combine with keyword_tags
         all_keywords = set(ai_keywords + [tag.lower() for tag in keyword_tags])
 
+        # No keywords (and therefore no keyword_tags): every catalog gets the default
+        if not all_keywords:
+            return {match["catalog_id"]: 50 for match in base_matches}
+
+        # Plain words are matched by set intersection with the catalog tokens;
+        # phrases and keywords with punctuation keep substring matching
+        total_keywords = len(all_keywords)
+        single_keywords = frozenset(k for k in all_keywords if WORD_RE.fullmatch(k))
+        multi_keywords = [k for k in all_keywords if k not in single_keywords]
+
         spec_scores = {}
         
         for match in base_matches:
@@ -293,11 +307,9 @@ class BuyerRequestMatchingService:
             combined_text = f"{export_desc} {marketing_desc} {technical_specs} {tags_text}"
 
             # Count keyword matches
-            matches = sum(1 for keyword in all_keywords if keyword in combined_text)
-            if all_keywords:
-                score = min(100, int((matches / len(all_keywords)) * 100))
-            else:
-                score = 50  # Default if no keywords
+            tokens = set(WORD_RE.findall(combined_text))
+            matches = len(single_keywords & tokens) + sum(1 for keyword in multi_keywords if keyword in combined_text)
+            score = min(100, int((matches / total_keywords) * 100))
 
             # Bonus for keyword_tags match in catalog tags
             if keyword_tags and tags_list:
@@ -481,3 +493,14 @@ class BuyerRequestMatchingService:
         final_score = weighted_base + weighted_spec + weighted_capability + weighted_volume + weighted_buyer
         return int(round(final_score))
 
+
+# Singleton instance
+_matching_service = None
+
+
+def get_matching_service() -> BuyerRequestMatchingService:
+    """Get or create BuyerRequestMatchingService singleton."""
+    global _matching_service
+    if _matching_service is None:
+        _matching_service = BuyerRequestMatchingService()
+    return _matching_service
@@ -0,0 +1,118 @@
+"""
+Tests for Module 6A Serializers (Buyer Requests)
+"""
+
+import pytest
+from rest_framework import serializers
+
+from apps.buyer_requests.models import BuyerRequest
+from apps.buyer_requests.serializers import (
+    BuyerRequestSerializer,
+    MatchedUMSerializer,
+    UpdateBuyerRequestSerializer,
+    UpdateBuyerRequestStatusSerializer,
+)
+from apps.products.tests.factories import UserFactory
+from apps.users.models import UserRole
+
+
+class TestCachedFields:
+    """Serializer fields are built once per class and copied per instance"""
+
+    def test_fields_built_once_per_class(self, monkeypatch):
+        BuyerRequestSerializer().fields  # warm the cache
+        calls = []
+        original = serializers.ModelSerializer.get_fields
+
+        def counting_get_fields(self):
+            calls.append(self)
+            return original(self)
+
+        monkeypatch.setattr(serializers.ModelSerializer, "get_fields", counting_get_fields)
+
+        BuyerRequestSerializer().fields
+        BuyerRequestSerializer().fields
+
+        assert calls == []
+
+    def test_instances_do_not_share_bound_fields(self):
+        first = BuyerRequestSerializer()
+        second = BuyerRequestSerializer()
+
+        assert first.fields["buyer_email"] is not second.fields["buyer_email"]
+        assert first.fields["buyer_email"].parent is first
+        assert second.fields["buyer_email"].parent is second
+
+    def test_nested_serializer_output_unchanged(self):
+        match = {
+            "umkm_id": 1,
+            "company_name": "UMKM",
+            "email": "umkm@example.com",
+            "full_name": "Budi",
+            "match": "match",
+            "contact_info": {"company_name": "UMKM", "address": "Jl. Merdeka"},
+            "catalog": {
+                "id": 7,
+                "display_name": "Teak Chair",
+                "export_description": None,
+                "marketing_description": None,
+                "technical_specs": {},
+                "tags": ["teak"],
+                "min_order_quantity": 10.0,
+                "unit_type": "pcs",
+                "available_stock": 5,
+                "base_price_exw": 20.0,
+                "base_price_fob": None,
+                "base_price_cif": None,
+                "lead_time_days": 14,
+                "primary_image_url": None,
+            },
+        }
+
+        first = MatchedUMSerializer([match], many=True).data
+        second = MatchedUMSerializer([match], many=True).data
+
+        assert first == second
+        assert first[0]["catalog"]["display_name"] == "Teak Chair"
+
+
+@pytest.mark.django_db
+class TestPartialUpdates:
+    """Updates only write the columns that changed"""
+
+    def test_update_leaves_other_columns_untouched(self):
+        buyer_request = BuyerRequest.objects.create(
+            buyer_user=UserFactory(role=UserRole.BUYER),
+            product_category="Furniture",
+            spec_requirements="Teak wood chairs",
+            target_volume=100,
+            destination_country="US",
+        )
+        # Concurrent change the stale instance does not know about
+        BuyerRequest.objects.filter(id=buyer_request.id).update(spec_requirements="Rattan chairs")
+
+        serializer = UpdateBuyerRequestSerializer(buyer_request, data={"target_volume": 250}, partial=True)
+        assert serializer.is_valid()
+        serializer.save()
+
+        buyer_request.refresh_from_db()
+        assert buyer_request.target_volume == 250
+        assert buyer_request.spec_requirements == "Rattan chairs"
+
+    def test_status_update_writes_status_only(self):
+        buyer_request = BuyerRequest.objects.create(
+            buyer_user=UserFactory(role=UserRole.BUYER),
+            product_category="Furniture",
+            spec_requirements="Teak wood chairs",
+            target_volume=100,
+            destination_country="US",
+        )
+        BuyerRequest.objects.filter(id=buyer_request.id).update(target_volume=500)
+
+        serializer = UpdateBuyerRequestStatusSerializer(buyer_request, data={"status": "Closed"})
+        assert serializer.is_valid()
+        serializer.save()
+
+        buyer_request.refresh_from_db()
+        assert buyer_request.status == "Closed"
+        assert buyer_request.target_volume == 500
@@ -0,0 +1,166 @@
+"""
+Tests for Module 6A Services (AI Smart Matching)
+"""
+
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from apps.buyer_requests.services import BuyerRequestMatchingService, get_matching_service
+from apps.catalogs.models import ProductCatalog, ProductCatalogImage
+from apps.products.tests.factories import ProductFactory
+from core.services.ai_service import KolosalAIService
+
+
+@pytest.fixture
+def matching_service(settings):
+    """Matching service with a dummy AI key (no network calls are made)."""
+    settings.KOLOSAL_API_KEY = "test-key"
+    return BuyerRequestMatchingService()
+
+
+class TestKeywordExtraction:
+    """Test PBI-BE-M6-10: keyword extraction used by spec matching"""
+
+    def test_parse_numbered_keywords(self):
+        """Numbered lines are mapped back to their spec position"""
+        text = "1. Kayu Jati, finishing natural\n2) rotan\n7. out of range"
+        result = KolosalAIService._parse_numbered_keywords(text, 3)
+
+        assert result == [["kayu jati", "finishing natural"], ["rotan"], []]
+
+    def test_single_spec_uses_plain_prompt(self, matching_service):
+        """One spec keeps the plain comma-list prompt, so no keyword is taken for a number"""
+        with patch.object(matching_service.ai_service, "_call_ai", return_value="1-ply, Katun") as mock_call:
+            result = matching_service.ai_service.extract_keywords_batch(["Kain katun 1-ply"])
+
+        assert result == [["1-ply", "katun"]]
+        assert mock_call.call_count == 1
+        assert "1. " not in mock_call.call_args[0][0]
+
+    def test_batch_uses_one_ai_call(self, matching_service):
+        """Keywords for several specs come from a single AI call"""
+        with patch.object(
+            matching_service.ai_service, "_call_ai", return_value="1. kopi, organik\n2. rotan, anyaman"
+        ) as mock_call:
+            result = matching_service.ai_service.extract_keywords_batch(["Kopi arabika organik", "Tas rotan anyaman"])
+
+        assert mock_call.call_count == 1
+        assert result == [["kopi", "organik"], ["rotan", "anyaman"]]
+
+    def test_spec_match_uses_injected_keywords(self, matching_service):
+        """Pre-extracted keywords skip the AI call"""
+        base_matches = [
+            {"catalog_id": 1, "catalog": {"export_description": "Organic arabica coffee", "tags": []}},
+        ]
+        with patch.object(matching_service.ai_service, "_call_ai") as mock_call:
+            scores = matching_service._match_spec_requirements(
+                "Kopi", [], base_matches, ai_keywords=["organic", "arabica"]
+            )
+
+        mock_call.assert_not_called()
+        assert scores == {1: 100}
+
+    def test_spec_match_without_keywords_returns_default(self, matching_service):
+        """No keywords at all gives every catalog the default score"""
+        base_matches = [{"catalog_id": 1, "catalog": {}}, {"catalog_id": 2, "catalog": {}}]
+
+        scores = matching_service._match_spec_requirements("", [], base_matches, ai_keywords=[])
+
+        assert scores == {1: 50, 2: 50}
+
+    def test_spec_match_words_and_phrases(self, matching_service):
+        """Single words match whole tokens; phrases still match as substrings"""
+        base_matches = [
+            {
+                "catalog_id": 1,
+                "catalog": {"export_description": "Hand-woven rattan basket", "tags": ["natural dye"]},
+            },
+        ]
+
+        scores = matching_service._match_spec_requirements(
+            "", [], base_matches, ai_keywords=["rattan", "hand-woven", "natural dye", "rat"]
+        )
+
+        assert scores == {1: 75}
+
+
+@pytest.mark.django_db
+class TestCategoryMatching:
+    """Test category-only matching against published catalogs"""
+
+    def test_match_returns_float_prices(self, matching_service):
+        """Decimal columns come back as floats; empty optional prices as None"""
+        product = ProductFactory(category_id=4)
+        catalog = ProductCatalog.objects.create(
+            product=product,
+            is_published=True,
+            display_name="Teak Chair",
+            min_order_quantity=Decimal("10.50"),
+            base_price_exw=Decimal("25.00"),
+            base_price_fob=Decimal("27.25"),
+        )
+        ProductCatalog.objects.create(
+            product=ProductFactory(category_id=4),
+            is_published=False,
+            display_name="Draft Chair",
+            base_price_exw=Decimal("1.00"),
+        )
+
+        matches = matching_service.match_buyer_request(SimpleNamespace(product_category="Furniture"))
+
+        assert [m["catalog_id"] for m in matches] == [catalog.id]
+        assert matches[0]["umkm_id"] == product.business.user_id
+        data = matches[0]["catalog"]
+        assert data["min_order_quantity"] == 10.5
+        assert data["base_price_exw"] == 25.0
+        assert data["base_price_fob"] == 27.25
+        assert data["base_price_cif"] is None
+
+    def test_hs_code_match_without_enrichment(self, matching_service):
+        """Catalogs whose product has no enrichment keep the category score"""
+        catalog = ProductCatalog.objects.create(
+            product=ProductFactory(category_id=4),
+            is_published=True,
+            display_name="Teak Table",
+            base_price_exw=Decimal("40.00"),
+        )
+
+        matches = matching_service._match_category_and_hs_code(
+            SimpleNamespace(product_category="4", hs_code_target="94036000")
+        )
+
+        assert [(m["catalog_id"], m["base_score"]) for m in matches] == [(catalog.id, 50)]
+
+    def test_match_primary_image_without_image_queries(self, matching_service, django_assert_num_queries):
+        """The primary image URL comes from the catalog row, not one query per match"""
+        for idx in range(3):
+            catalog = ProductCatalog.objects.create(
+                product=ProductFactory(category_id=4),
+                is_published=True,
+                display_name=f"Teak Bench {idx}",
+                base_price_exw=Decimal("15.00"),
+            )
+            ProductCatalogImage.objects.create(catalog=catalog, image_url=f"https://example.com/{idx}-1.jpg")
+            ProductCatalogImage.objects.create(
+                catalog=catalog, image_url=f"https://example.com/{idx}-2.jpg", sort_order=1, is_primary=True
+            )
+
+        with django_assert_num_queries(1):
+            matches = matching_service.match_buyer_request(SimpleNamespace(product_category="Furniture"))
+
+        assert sorted(m["catalog"]["primary_image_url"] for m in matches) == [
+            f"https://example.com/{idx}-2.jpg" for idx in range(3)
+        ]
+
+
+class TestMatchingServiceSingleton:
+    """The matching service (and its AI client) is built once per process"""
+
+    def test_get_matching_service_reuses_instance(self, settings, monkeypatch):
+        settings.KOLOSAL_API_KEY = "test-key"
+        monkeypatch.setattr("apps.buyer_requests.services._matching_service", None)
+
+        assert get_matching_service() is get_matching_service()
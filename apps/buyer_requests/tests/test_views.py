@@ -0,0 +1,438 @@
+"""
+Tests for Module 6A Views (Buyer Requests)
+"""
+
+from decimal import Decimal
+
+import json
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.buyer_requests.models import BuyerProfile, BuyerRequest
+from apps.buyer_requests.serializers import MatchedUMSerializer
+from apps.buyer_requests.views import BuyerRequestMatchedUMKMView
+from apps.business_profiles.models import BusinessProfile
+from apps.catalogs.models import ProductCatalog
+from apps.products.tests.factories import ProductFactory, UserFactory
+from apps.users.models import UserRole
+
+
+@pytest.mark.django_db
+class TestBuyerRequestListView:
+    """Test PBI-BE-M6-04: GET /buyer-requests"""
+
+    def setup_method(self):
+        self.client = APIClient()
+        self.admin = UserFactory(role=UserRole.ADMIN)
+
+    def _create_requests(self, count):
+        for idx in range(count):
+            buyer = UserFactory(role=UserRole.BUYER)
+            BuyerProfile.objects.create(user=buyer, company_name=f"Importer {idx}")
+            BuyerRequest.objects.create(
+                buyer_user=buyer,
+                product_category="Furniture",
+                spec_requirements="Teak wood chairs",
+                target_volume=100,
+                destination_country="US",
+            )
+
+    def test_list_query_count_independent_of_page_size(self, django_assert_num_queries):
+        """Buyer users and profiles are joined, not fetched per row"""
+        self._create_requests(5)
+        self.client.force_authenticate(user=self.admin)
+
+        # count + page
+        with django_assert_num_queries(2):
+            response = self.client.get("/api/v1/buyers/requests/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert {r["buyer_company_name"] for r in response.data["results"]} == {
+            f"Importer {idx}" for idx in range(5)
+        }
+
+    def test_count_cached_across_pages_and_refreshed_on_first_page(self):
+        """Later pages reuse the count computed on page 1"""
+        cache.clear()
+        self._create_requests(3)
+        self.client.force_authenticate(user=self.admin)
+
+        first = self.client.get("/api/v1/buyers/requests/", {"limit": 2})
+        self._create_requests(1)
+        second = self.client.get("/api/v1/buyers/requests/", {"limit": 2, "page": 2})
+        refreshed = self.client.get("/api/v1/buyers/requests/", {"limit": 2})
+
+        assert first.data["count"] == 3
+        assert second.data["count"] == 3
+        assert refreshed.data["count"] == 4
+
+    def test_stream_returns_all_rows_unpaginated(self):
+        """?stream=1 streams every row in the standard response shape"""
+        self._create_requests(12)
+        self.client.force_authenticate(user=self.admin)
+
+        response = self.client.get("/api/v1/buyers/requests/", {"stream": "1"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        body = json.loads(b"".join(response.streaming_content))
+        assert body["success"] is True
+        assert body["message"] == "Buyer requests retrieved successfully"
+        assert len(body["data"]) == 12
+        assert body["data"][0]["buyer_company_name"].startswith("Importer")
+
+    def test_umkm_sees_open_requests_within_rank(self):
+        """UMKM users only see open requests their certification count qualifies for"""
+        self._create_requests(2)
+        BuyerRequest.objects.filter(buyer_user__buyer_profile__company_name="Importer 1").update(
+            min_rank_required=2
+        )
+        umkm = UserFactory(role=UserRole.UMKM)
+        BusinessProfile.objects.create(
+            user=umkm,
+            company_name="UMKM",
+            address="Jl. Merdeka",
+            production_capacity_per_month=1000,
+            year_established=2015,
+            certifications=["Halal"],
+        )
+        self.client.force_authenticate(user=umkm)
+
+        response = self.client.get("/api/v1/buyers/requests/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [r["buyer_company_name"] for r in response.data["results"]] == ["Importer 0"]
+
+    def test_umkm_without_business_profile_sees_nothing(self):
+        """UMKM users without a business profile get an empty list"""
+        self._create_requests(1)
+        self.client.force_authenticate(user=UserFactory(role=UserRole.UMKM))
+
+        response = self.client.get("/api/v1/buyers/requests/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["results"] == []
+
+
+@pytest.mark.django_db
+class TestBuyerRequestWrites:
+    """Test PBI-BE-M6-03/06: POST and PUT /buyer-requests"""
+
+    def setup_method(self):
+        self.client = APIClient()
+        self.buyer = UserFactory(role=UserRole.BUYER)
+        BuyerProfile.objects.create(user=self.buyer, company_name="Importer")
+        self.client.force_authenticate(user=self.buyer)
+
+    def test_create_returns_read_representation(self):
+        response = self.client.post(
+            "/api/v1/buyers/requests/",
+            {
+                "product_category": "Furniture",
+                "spec_requirements": "Teak wood chairs",
+                "target_volume": 100,
+                "destination_country": "US",
+                "status": "Closed",
+            },
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        data = response.data["data"]
+        assert data["buyer_company_name"] == "Importer"
+        assert data["buyer_email"] == self.buyer.email
+        assert data["status"] == "Open"  # status is not writable on create
+        assert data["keyword_tags"] == []
+
+    def test_create_does_not_build_matching_service(self, monkeypatch):
+        """Matching runs on-demand, so creating a request never touches the AI client"""
+
+        def fail(*args, **kwargs):
+            raise AssertionError("matching service built on the write path")
+
+        monkeypatch.setattr("apps.buyer_requests.services._matching_service", None)
+        monkeypatch.setattr("apps.buyer_requests.services.BuyerRequestMatchingService.__init__", fail)
+
+        response = self.client.post(
+            "/api/v1/buyers/requests/",
+            {
+                "product_category": "Furniture",
+                "spec_requirements": "Teak wood chairs",
+                "target_volume": 100,
+                "destination_country": "US",
+            },
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+
+    def test_create_forbidden_for_non_buyer(self):
+        """Only Buyers may create requests; other roles can still list"""
+        self.client.force_authenticate(user=UserFactory(role=UserRole.UMKM))
+
+        create = self.client.post("/api/v1/buyers/requests/", {}, format="json")
+        listing = self.client.get("/api/v1/buyers/requests/")
+
+        assert create.status_code == status.HTTP_403_FORBIDDEN
+        assert create.data["success"] is False
+        assert listing.status_code == status.HTTP_200_OK
+
+    def test_create_validation_messages(self):
+        response = self.client.post("/api/v1/buyers/requests/", {"target_volume": 0}, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        errors = response.data["errors"]
+        assert errors["product_category"] == ["Product category is required"]
+        assert errors["target_volume"] == ["Target volume must be at least 1"]
+
+    def test_update_returns_read_representation(self):
+        buyer_request = BuyerRequest.objects.create(
+            buyer_user=self.buyer,
+            product_category="Furniture",
+            spec_requirements="Teak wood chairs",
+            target_volume=100,
+            destination_country="US",
+        )
+
+        response = self.client.put(
+            f"/api/v1/buyers/requests/{buyer_request.id}/",
+            {"target_volume": 250, "status": "Closed"},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.data["data"]
+        assert data["target_volume"] == 250
+        assert data["status"] == "Open"
+        assert data["buyer_company_name"] == "Importer"
+
+
+@pytest.mark.django_db
+class TestBuyerRequestStatusView:
+    """Test PBI-BE-M6-07: PATCH /buyer-requests/:id/status"""
+
+    def setup_method(self):
+        self.client = APIClient()
+        self.buyer = UserFactory(role=UserRole.BUYER)
+        self.buyer_request = BuyerRequest.objects.create(
+            buyer_user=self.buyer,
+            product_category="Furniture",
+            spec_requirements="Teak wood chairs",
+            target_volume=100,
+            destination_country="US",
+        )
+
+    def _patch(self, request_id, data):
+        return self.client.patch(f"/api/v1/buyers/requests/{request_id}/status/", data, format="json")
+
+    def test_owner_can_update_status(self):
+        self.client.force_authenticate(user=self.buyer)
+
+        response = self._patch(self.buyer_request.id, {"status": "Closed"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["data"]["status"] == "Closed"
+
+    def test_other_buyer_forbidden(self):
+        self.client.force_authenticate(user=UserFactory(role=UserRole.BUYER))
+
+        response = self._patch(self.buyer_request.id, {"status": "Closed"})
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert response.data["message"] == "You can only update your own requests"
+
+    def test_missing_request_not_found(self):
+        self.client.force_authenticate(user=self.buyer)
+
+        response = self._patch(self.buyer_request.id + 1000, {"status": "Closed"})
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestBuyerRequestMatchedUMKMView:
+    """Test PBI-BE-M6-13: GET /buyer-requests/:id/matched-umkm"""
+
+    def setup_method(self):
+        self.client = APIClient()
+        self.buyer = UserFactory(role=UserRole.BUYER)
+        self.buyer_request = BuyerRequest.objects.create(
+            buyer_user=self.buyer,
+            product_category="Furniture",
+            spec_requirements="Teak wood chairs",
+            target_volume=100,
+            destination_country="US",
+        )
+
+    def _publish_catalog(self, business, name):
+        return ProductCatalog.objects.create(
+            product=ProductFactory(business=business, category_id=4),
+            is_published=True,
+            display_name=name,
+            base_price_exw=Decimal("20.00"),
+        )
+
+    def test_matched_umkm_query_count(self, settings):
+        """UMKM users and profiles are fetched in bulk, not per match"""
+        settings.KOLOSAL_API_KEY = "test-key"
+        cache.clear()
+        for idx in range(3):
+            business = BusinessProfile.objects.create(
+                user=UserFactory(role=UserRole.UMKM),
+                company_name=f"UMKM {idx}",
+                address="Jl. Merdeka",
+                production_capacity_per_month=1000,
+                year_established=2015,
+            )
+            self._publish_catalog(business, f"Chair {idx}")
+            self._publish_catalog(business, f"Table {idx}")
+
+        self.client.force_authenticate(user=self.buyer)
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(f"/api/v1/buyers/requests/{self.buyer_request.id}/matched-umkm/")
+
+        user_queries = [q for q in ctx.captured_queries if 'FROM "users_user"' in q["sql"]]
+        profile_queries = [q for q in ctx.captured_queries if 'FROM "business_profiles_businessprofile"' in q["sql"]]
+        assert len(user_queries) == 1
+        assert profile_queries == []
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["data"]) == 6
+        assert {m["company_name"] for m in response.data["data"]} == {"UMKM 0", "UMKM 1", "UMKM 2"}
+        # Returned as built, but still exactly the documented serializer shape
+        assert response.data["data"] == MatchedUMSerializer(response.data["data"], many=True).data
+
+    def test_matched_umkm_cached_until_catalogs_change(self, settings, monkeypatch):
+        """Repeat calls reuse cached matches; publishing a catalog invalidates them"""
+        settings.KOLOSAL_API_KEY = "test-key"
+        cache.clear()
+        business = BusinessProfile.objects.create(
+            user=UserFactory(role=UserRole.UMKM),
+            company_name="UMKM",
+            address="Jl. Merdeka",
+            production_capacity_per_month=1000,
+            year_established=2015,
+        )
+        self._publish_catalog(business, "Chair")
+        self.client.force_authenticate(user=self.buyer)
+        url = f"/api/v1/buyers/requests/{self.buyer_request.id}/matched-umkm/"
+
+        calls = []
+        original = BuyerRequestMatchedUMKMView.build_matches
+
+        def counting_build_matches(view, buyer_request):
+            calls.append(buyer_request.id)
+            return original(view, buyer_request)
+
+        monkeypatch.setattr(BuyerRequestMatchedUMKMView, "build_matches", counting_build_matches)
+
+        first = self.client.get(url)
+        second = self.client.get(url)
+        self._publish_catalog(business, "Table")
+        third = self.client.get(url)
+
+        assert len(calls) == 2
+        assert first.data["data"] == second.data["data"]
+        assert len(third.data["data"]) == 2
+
+    def test_matched_umkm_forbidden_for_other_buyer(self, settings):
+        """Buyers can only view matches for their own requests"""
+        settings.KOLOSAL_API_KEY = "test-key"
+        self.client.force_authenticate(user=UserFactory(role=UserRole.BUYER))
+
+        response = self.client.get(f"/api/v1/buyers/requests/{self.buyer_request.id}/matched-umkm/")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db
+class TestBuyerListView:
+    """Test GET /buyers"""
+
+    def test_list_profiles_reads_only_joined_user_columns(self, django_assert_num_queries):
+        """Narrowed columns do not trigger deferred-field loads"""
+        for idx in range(3):
+            BuyerProfile.objects.create(user=UserFactory(role=UserRole.BUYER), company_name=f"Importer {idx}")
+        client = APIClient()
+        client.force_authenticate(user=UserFactory(role=UserRole.UMKM))
+
+        # count + page + one total_requests count per profile
+        with django_assert_num_queries(5):
+            response = client.get("/api/v1/buyers/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [p["company_name"] for p in response.data["results"]] == ["Importer 0", "Importer 1", "Importer 2"]
+        assert all(p["user_email"] for p in response.data["results"])
+
+
+@pytest.mark.django_db
+class TestBuyerProfileWrites:
+    """Test POST /buyers/profile and PUT /buyers/profile/:id"""
+
+    def setup_method(self):
+        self.client = APIClient()
+        self.buyer = UserFactory(role=UserRole.BUYER)
+        self.client.force_authenticate(user=self.buyer)
+
+    def test_create_and_update_return_read_representation(self):
+        created = self.client.post(
+            "/api/v1/buyers/profile/",
+            {
+                "company_name": "Importer",
+                "contact_info": {"phone": "123"},
+                "preferred_product_categories": ["Furniture"],
+                "source_countries": ["ID"],
+            },
+            format="json",
+        )
+
+        assert created.status_code == status.HTTP_201_CREATED
+        assert created.data["data"]["user_email"] == self.buyer.email
+        assert created.data["data"]["total_requests"] == 0
+
+        updated = self.client.put(
+            f"/api/v1/buyers/profile/{created.data['data']['id']}/",
+            {"company_name": "Importer Co"},
+            format="json",
+        )
+
+        assert updated.status_code == status.HTTP_200_OK
+        assert updated.data["data"]["company_name"] == "Importer Co"
+        assert updated.data["data"]["user"] == self.buyer.id
+
+    def test_profile_endpoints_forbidden_for_non_buyer(self):
+        self.client.force_authenticate(user=UserFactory(role=UserRole.UMKM))
+
+        assert self.client.post("/api/v1/buyers/profile/", {}, format="json").status_code == 403
+        assert self.client.get("/api/v1/buyers/profile/me/").status_code == 403
+
+
+@pytest.mark.django_db
+class TestBuyerDetailView:
+    """Test GET /buyers/:id and GET /buyers/profile/me"""
+
+    def setup_method(self):
+        self.client = APIClient()
+        self.buyer = UserFactory(role=UserRole.BUYER)
+        self.client.force_authenticate(user=self.buyer)
+
+    def test_detail_and_missing_profile(self):
+        profile = BuyerProfile.objects.create(user=self.buyer, company_name="Importer")
+
+        found = self.client.get(f"/api/v1/buyers/{profile.id}/")
+        missing = self.client.get(f"/api/v1/buyers/{profile.id + 1000}/")
+
+        assert found.status_code == status.HTTP_200_OK
+        assert found.data["data"]["user_email"] == self.buyer.email
+        assert missing.status_code == status.HTTP_404_NOT_FOUND
+        assert missing.data["message"] == "Buyer profile not found"
+
+    def test_my_profile_missing(self):
+        response = self.client.get("/api/v1/buyers/profile/me/")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -12,26 +12,31 @@ Implements:
 """
 
 import logging
+from django.core.cache import cache
+from django.db.models import Count, Max, Q
 from django.shortcuts import get_object_or_404
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework.pagination import PageNumberPagination
 from drf_spectacular.utils import extend_schema
 
-from apps.users.models import UserRole
+from apps.catalogs.models import ProductCatalog
+from apps.users.models import User, UserRole
 from core.responses import (
     created_response,
     success_response,
+    streaming_success_response,
     error_response,
     not_found_response,
     forbidden_response,
     validation_error_response,
 )
 from core.exceptions import NotFoundException, ForbiddenException, ConflictException
+from core.pagination import CachedCountPagination
+from core.permissions import IsBuyer
 
-from .models import BuyerRequest, BuyerProfile
+from .models import BuyerRequest, BuyerProfile, RequestStatus
 from .serializers import (
     BuyerRequestSerializer,
     CreateBuyerRequestSerializer,
@@ -42,12 +47,105 @@ from .serializers import (
     CreateBuyerProfileSerializer,
     UpdateBuyerProfileSerializer,
 )
-from .services import BuyerRequestMatchingService
+from .services import get_matching_service
 
 logger = logging.getLogger(__name__)
 
+MATCHED_UMKM_CACHE_TIMEOUT = 300  # seconds
+
+# Columns read by BuyerRequestSerializer, including the joined buyer user/profile
+BUYER_REQUEST_LIST_FIELDS = (
+    "id",
+    "buyer_user__email",
+    "buyer_user__full_name",
+    "buyer_user__buyer_profile__company_name",
+    "product_category",
+    "hs_code_target",
+    "spec_requirements",
+    "target_volume",
+    "destination_country",
+    "keyword_tags",
+    "min_rank_required",
+    "status",
+    "created_at",
+    "updated_at",
+)
+
+# Columns read by BuyerProfileSerializer, including the joined user
+BUYER_PROFILE_LIST_FIELDS = (
+    "id",
+    "user__email",
+    "user__full_name",
+    "company_name",
+    "company_description",
+    "contact_info",
+    "preferred_product_categories",
+    "preferred_product_categories_description",
+    "source_countries",
+    "source_countries_description",
+    "business_type",
+    "business_type_description",
+    "annual_import_volume",
+    "annual_import_volume_description",
+    "created_at",
+    "updated_at",
+)
+
+
+def _published_catalog_version():
+    """Version stamp for the published catalog set: count + latest update."""
+    version = ProductCatalog.published.aggregate(
+        count=Count("id"), latest=Max("updated_at")
+    )
+    latest = version["latest"].timestamp() if version["latest"] else 0
+    return f"{version['count']}:{latest}"
+
+
+def _enrich_matches(matches, umkm_users):
+    """Yield matched catalogs with UMKM details, skipping UMKM without a business profile."""
+    for match in matches:
+        umkm_user = umkm_users.get(match["umkm_id"])
+        business_profile = getattr(umkm_user, "business_profile", None)
+        if business_profile is None:
+            continue
+
+        # Build enriched match with catalog details
+        yield {
+            "umkm_id": umkm_user.id,
+            "company_name": business_profile.company_name,
+            "email": umkm_user.email,
+            "full_name": umkm_user.full_name,
+            "match": "match",  # Category match (simplified)
+            "contact_info": {
+                "company_name": business_profile.company_name,
+                "address": business_profile.address,
+            },
+            "catalog": match["catalog"],  # Include full catalog details
+        }
+
+
+def _get_buyer_request(
+    request, request_id, queryset=None, forbidden_message="You can only access your own requests"
+):
+    """
+    Get a buyer request by id, enforcing that Buyers only reach their own.
 
-class BuyerRequestPagination(PageNumberPagination):
+    Raises NotFoundException if it does not exist and ForbiddenException if
+    a Buyer requests someone else's.
+    """
+    if queryset is None:
+        queryset = BuyerRequest.objects.all()
+    buyer_request = queryset.filter(id=request_id).first()
+    if buyer_request is None:
+        raise NotFoundException("Buyer request not found")
+
+    # Buyer: unlimited access to own requests
+    if request.user.role == UserRole.BUYER and buyer_request.buyer_user_id != request.user.id:
+        raise ForbiddenException(forbidden_message)
+    return buyer_request
+
+
+class BuyerRequestPagination(CachedCountPagination):
     """Pagination for buyer requests list."""
     page_size = 10
     page_size_query_param = 'limit'
@@ -63,6 +161,12 @@ class BuyerRequestListCreateView(APIView):
     permission_classes = [IsAuthenticated]
     pagination_class = BuyerRequestPagination
 
+    def get_permissions(self):
+        # Any authenticated role can list; only Buyers can create
+        if self.request.method == "POST":
+            return [IsAuthenticated(), IsBuyer()]
+        return super().get_permissions()
+
     @extend_schema(
         summary="List buyer requests",
         description="Get list of buyer requests. Buyer sees own requests, UMKM sees matching open requests, Admin sees all.",
@@ -72,37 +176,43 @@ class BuyerRequestListCreateView(APIView):
     def get(self, request):
         """GET /buyer-requests - List buyer requests with role-based filtering."""
         user = request.user
-        queryset = BuyerRequest.objects.all()
+        queryset = BuyerRequest.objects.select_related("buyer_user", "buyer_user__buyer_profile").only(
+            *BUYER_REQUEST_LIST_FIELDS
+        )
 
         # Role-based filtering
+        filters = Q()
         if user.role == UserRole.BUYER:
             # Buyer: return only own requests
-            queryset = queryset.filter(buyer_user=user)
+            filters &= Q(buyer_user=user)
         elif user.role == UserRole.UMKM:
             # UMKM: return 'Open' requests matching capabilities
-            queryset = queryset.filter(status="Open")
-            # Filter by min_rank_required (for now, use certification_count as rank)
-            try:
-                from apps.business_profiles.models import BusinessProfile
-                business_profile = BusinessProfile.objects.get(user=user)
-                rank = business_profile.certification_count
-                queryset = queryset.filter(min_rank_required__lte=rank)
-            except:
+            # Filter by min_rank_required (rank_cache mirrors the business profile's certification_count)
+            rank = user.rank_cache
+            if rank is None:
                 queryset = queryset.none()  # No business profile = no matches
+            else:
+                filters &= Q(status=RequestStatus.OPEN) & Q(min_rank_required__lte=rank)
         # Admin: return all (no filter)
 
         # Query params filtering
         status_filter = request.query_params.get("status")
         if status_filter:
-            queryset = queryset.filter(status=status_filter)
+            filters &= Q(status=status_filter)
 
         category_filter = request.query_params.get("category")
         if category_filter:
-            queryset = queryset.filter(product_category__icontains=category_filter)
+            filters &= Q(product_category__icontains=category_filter)
 
         destination_filter = request.query_params.get("destination_country")
         if destination_filter:
-            queryset = queryset.filter(destination_country=destination_filter)
+            filters &= Q(destination_country=destination_filter)
+
+        queryset = queryset.filter(filters)
+
+        # Large exports: stream all rows instead of paginating
+        if request.query_params.get("stream") == "1":
+            return streaming_success_response(queryset, BuyerRequestSerializer, message="Buyer requests retrieved successfully")
 
         # Pagination
         paginator = self.pagination_class()
@@ -124,10 +234,6 @@ class BuyerRequestListCreateView(APIView):
     )
     def post(self, request):
         """POST /buyer-requests - Create new buyer request."""
-        # Validate user role
-        if request.user.role != UserRole.BUYER:
-            return forbidden_response("Only Buyer users can create requests")
-
         serializer = CreateBuyerRequestSerializer(data=request.data, context={"request": request})
         
         if not serializer.is_valid():
@@ -135,18 +241,12 @@ class BuyerRequestListCreateView(APIView):
 
         buyer_request = serializer.save()
 
-        # Auto-trigger AI Smart Matching (async in background if needed)
-        try:
-            matching_service = BuyerRequestMatchingService()
-            # Store matches (could be done async)
-            # For now, matches are calculated on-demand when requested
-            logger.info(f"Buyer request {buyer_request.id} created, AI matching will run on-demand")
-        except Exception as e:
-            logger.error(f"Error in AI matching for request {buyer_request.id}: {e}")
-
-        response_serializer = BuyerRequestSerializer(buyer_request)
+        # AI Smart Matching runs on-demand in the matched-umkm endpoint, so the
+        # write path does not build the matching service (and its AI client)
+        logger.info(f"Buyer request {buyer_request.id} created, AI matching will run on-demand")
+
         return created_response(
-            data=response_serializer.data,
+            data=serializer.data,
             message="Buyer request created successfully"
         )
 
@@ -160,28 +260,22 @@ class BuyerRequestDetailView(APIView):
 
     permission_classes = [IsAuthenticated]
 
-    def get_object(self, request_id, user):
+    def get_object(self, request, request_id):
         """Get buyer request and validate access."""
-        try:
-            buyer_request = BuyerRequest.objects.get(id=request_id)
-        except BuyerRequest.DoesNotExist:
-            raise NotFoundException("Buyer request not found")
-        
+        buyer_request = _get_buyer_request(
+            request,
+            request_id,
+            queryset=BuyerRequest.objects.select_related("buyer_user", "buyer_user__buyer_profile"),
+        )
+
         # Access control
-        if user.role == UserRole.BUYER:
-            # Buyer: unlimited access to own requests
-            if buyer_request.buyer_user_id != user.id:
-                raise ForbiddenException("You can only access your own requests")
-        elif user.role == UserRole.UMKM:
+        if request.user.role == UserRole.UMKM:
             # UMKM: access only if meets min_rank_required
-            try:
-                from apps.business_profiles.models import BusinessProfile
-                business_profile = BusinessProfile.objects.get(user=user)
-                rank = business_profile.certification_count
-                if buyer_request.min_rank_required > rank:
-                    raise ForbiddenException("You do not meet the minimum rank requirement")
-            except BusinessProfile.DoesNotExist:
+            rank = request.user.rank_cache
+            if rank is None:
                 raise ForbiddenException("Business profile not found")
+            if buyer_request.min_rank_required > rank:
+                raise ForbiddenException("You do not meet the minimum rank requirement")
         # Admin: full access
 
         return buyer_request
@@ -194,7 +288,7 @@ class BuyerRequestDetailView(APIView):
     )
     def get(self, request, request_id):
         """GET /buyer-requests/:id - Get buyer request detail."""
-        buyer_request = self.get_object(request_id, request.user)
+        buyer_request = self.get_object(request, request_id)
         serializer = BuyerRequestSerializer(buyer_request)
         return success_response(data=serializer.data, message="Buyer request retrieved successfully")
 
@@ -207,11 +301,7 @@ class BuyerRequestDetailView(APIView):
     )
     def put(self, request, request_id):
         """PUT /buyer-requests/:id - Update buyer request."""
-        buyer_request = self.get_object(request_id, request.user)
-        
-        # Validate ownership for Buyer
-        if request.user.role == UserRole.BUYER and buyer_request.buyer_user_id != request.user.id:
-            return forbidden_response("You can only update your own requests")
+        buyer_request = self.get_object(request, request_id)
 
         serializer = UpdateBuyerRequestSerializer(buyer_request, data=request.data, partial=True)
         
@@ -220,15 +310,10 @@ class BuyerRequestDetailView(APIView):
 
         updated_request = serializer.save()
 
-        # Re-trigger AI Smart Matching if criteria changed
-        try:
-            matching_service = BuyerRequestMatchingService()
-            logger.info(f"Buyer request {updated_request.id} updated, AI matching will recalculate on-demand")
-        except Exception as e:
-            logger.error(f"Error in AI matching for request {updated_request.id}: {e}")
+        # Matching recalculates on-demand against the updated criteria
+        logger.info(f"Buyer request {updated_request.id} updated, AI matching will recalculate on-demand")
 
-        response_serializer = BuyerRequestSerializer(updated_request)
-        return success_response(data=response_serializer.data, message="Buyer request updated successfully")
+        return success_response(data=serializer.data, message="Buyer request updated successfully")
 
     @extend_schema(
         summary="Delete buyer request",
@@ -238,11 +323,7 @@ class BuyerRequestDetailView(APIView):
     )
     def delete(self, request, request_id):
         """DELETE /buyer-requests/:id - Delete buyer request."""
-        buyer_request = self.get_object(request_id, request.user)
-        
-        # Validate ownership for Buyer
-        if request.user.role == UserRole.BUYER and buyer_request.buyer_user_id != request.user.id:
-            return forbidden_response("You can only delete your own requests")
+        buyer_request = self.get_object(request, request_id)
 
         request_id = buyer_request.id
         buyer_request.delete()
@@ -268,23 +349,20 @@ class BuyerRequestStatusView(APIView):
     )
     def patch(self, request, request_id):
         """PATCH /buyer-requests/:id/status - Update buyer request status."""
-        try:
-            buyer_request = BuyerRequest.objects.get(id=request_id)
-        except BuyerRequest.DoesNotExist:
-            return not_found_response("Buyer request not found")
-
-        # Validate ownership
-        if request.user.role == UserRole.BUYER and buyer_request.buyer_user_id != request.user.id:
-            return forbidden_response("You can only update your own requests")
+        buyer_request = _get_buyer_request(
+            request,
+            request_id,
+            queryset=BuyerRequest.objects.select_related("buyer_user", "buyer_user__buyer_profile"),
+            forbidden_message="You can only update your own requests",
+        )
 
         serializer = UpdateBuyerRequestStatusSerializer(buyer_request, data=request.data)
         
         if not serializer.is_valid():
             return validation_error_response(serializer.errors)
 
-        updated_request = serializer.save()
-        response_serializer = BuyerRequestSerializer(updated_request)
-        return success_response(data=response_serializer.data, message="Status updated successfully")
+        serializer.save()
+        return success_response(data=serializer.data, message="Status updated successfully")
 
 
 class BuyerRequestMatchedUMKMView(APIView):
@@ -302,51 +380,43 @@ class BuyerRequestMatchedUMKMView(APIView):
     )
     def get(self, request, request_id):
         """GET /buyer-requests/:id/matched-umkm - Get matched catalogs with UMKM info."""
-        try:
-            buyer_request = BuyerRequest.objects.get(id=request_id)
-        except BuyerRequest.DoesNotExist:
-            return not_found_response("Buyer request not found")
+        buyer_request = _get_buyer_request(
+            request, request_id, forbidden_message="You can only view matches for your own requests"
+        )
+
+        # Cached per request version and published-catalog version; updating the
+        # request or publishing/unpublishing/editing catalogs changes the key
+        cache_key = (
+            f"matched_umkm:{buyer_request.id}:{buyer_request.updated_at.timestamp()}:"
+            f"{_published_catalog_version()}"
+        )
+        data = cache.get(cache_key)
+        if data is None:
+            data = self.build_matches(buyer_request)
+            cache.set(cache_key, data, MATCHED_UMKM_CACHE_TIMEOUT)
 
-        # Validate ownership for Buyer
-        if request.user.role == UserRole.BUYER and buyer_request.buyer_user_id != request.user.id:
-            return forbidden_response("You can only view matches for your own requests")
+        return success_response(data=data, message="Matched catalogs retrieved successfully")
 
+    def build_matches(self, buyer_request):
+        """Run matching and enrich each matched catalog with its UMKM details."""
         # Calculate matches (now returns catalogs with UMKM info)
-        matching_service = BuyerRequestMatchingService()
-        matches = matching_service.match_buyer_request(buyer_request)
+        matches = get_matching_service().match_buyer_request(buyer_request)
 
         # Enrich with UMKM details
-        from apps.users.models import User
-        from apps.business_profiles.models import BusinessProfile
-
-        enriched_matches = []
-        for match in matches:
-            try:
-                umkm_user = User.objects.get(id=match["umkm_id"])
-                business_profile = BusinessProfile.objects.get(user=umkm_user)
-                
-                # Build enriched match with catalog details
-                enriched_match = {
-                    "umkm_id": umkm_user.id,
-                    "company_name": business_profile.company_name,
-                    "email": umkm_user.email,
-                    "full_name": umkm_user.full_name,
-                    "match": "match",  # Category match (simplified)
-                    "contact_info": {
-                        "company_name": business_profile.company_name,
-                        "address": business_profile.address,
-                    },
-                    "catalog": match["catalog"],  # Include full catalog details
-                }
-                enriched_matches.append(enriched_match)
-            except (User.DoesNotExist, BusinessProfile.DoesNotExist):
-                continue
-
-        serializer = MatchedUMSerializer(enriched_matches, many=True)
-        return success_response(data=serializer.data, message="Matched catalogs retrieved successfully")
-
-
-class BuyerProfilePagination(PageNumberPagination):
+        # Fetch all matched UMKM users with their business profiles in one query
+        umkm_ids = {match["umkm_id"] for match in matches}
+        umkm_users = {
+            umkm_user.id: umkm_user
+            for umkm_user in User.objects.filter(id__in=umkm_ids).select_related("business_profile")
+        }
+
+        # The dicts already match MatchedUMSerializer's shape with JSON-safe values
+        # (the matching service casts prices to float), so skip re-serializing them;
+        # the result is materialized once here for caching
+        return list(_enrich_matches(matches, umkm_users))
+
+
+class BuyerProfilePagination(CachedCountPagination):
     """Pagination for buyer profiles list."""
     page_size = 10
     page_size_query_param = 'limit'
@@ -358,7 +428,7 @@ class BuyerProfileCreateView(APIView):
     Create buyer profile.
     """
 
-    permission_classes = [IsAuthenticated]
+    permission_classes = [IsAuthenticated, IsBuyer]
 
     @extend_schema(
         summary="Create buyer profile",
@@ -369,23 +439,18 @@ class BuyerProfileCreateView(APIView):
     )
     def post(self, request):
         """POST /buyers/profile - Create buyer profile."""
-        # Validate user role
-        if request.user.role != UserRole.BUYER:
-            return forbidden_response("Only Buyer users can create profiles")
-
         serializer = CreateBuyerProfileSerializer(data=request.data, context={"request": request})
         
         if not serializer.is_valid():
             return validation_error_response(serializer.errors)
 
         try:
-            buyer_profile = serializer.save()
+            serializer.save()
         except ConflictException as e:
             return error_response(str(e), status_code=status.HTTP_409_CONFLICT)
 
-        response_serializer = BuyerProfileSerializer(buyer_profile)
         return created_response(
-            data=response_serializer.data,
+            data=serializer.data,
             message="Buyer profile created successfully"
         )
 
@@ -396,7 +461,7 @@ class BuyerMyProfileView(APIView):
     Convenience endpoint for buyers to get their profile without knowing the ID.
     """
 
-    permission_classes = [IsAuthenticated]
+    permission_classes = [IsAuthenticated, IsBuyer]
 
     @extend_schema(
         summary="Get my buyer profile",
@@ -406,13 +471,8 @@ class BuyerMyProfileView(APIView):
     )
     def get(self, request):
         """GET /buyers/profile/me - Get current buyer's own profile."""
-        # Validate user role
-        if request.user.role != UserRole.BUYER:
-            return forbidden_response("Only Buyer users can access this endpoint")
-
-        try:
-            buyer_profile = BuyerProfile.objects.get(user=request.user)
-        except BuyerProfile.DoesNotExist:
+        buyer_profile = BuyerProfile.objects.select_related("user").filter(user=request.user).first()
+        if buyer_profile is None:
             return not_found_response("Buyer profile not found. Please create your profile first.")
 
         serializer = BuyerProfileSerializer(buyer_profile)
@@ -435,9 +495,8 @@ class BuyerProfileUpdateView(APIView):
     )
     def put(self, request, profile_id):
         """PUT /buyers/profile/:id - Update buyer profile."""
-        try:
-            buyer_profile = BuyerProfile.objects.get(id=profile_id)
-        except BuyerProfile.DoesNotExist:
+        buyer_profile = BuyerProfile.objects.select_related("user").filter(id=profile_id).first()
+        if buyer_profile is None:
             return not_found_response("Buyer profile not found")
 
         # Validate ownership
@@ -449,9 +508,8 @@ class BuyerProfileUpdateView(APIView):
         if not serializer.is_valid():
             return validation_error_response(serializer.errors)
 
-        updated_profile = serializer.save()
-        response_serializer = BuyerProfileSerializer(updated_profile)
-        return success_response(data=response_serializer.data, message="Profile updated successfully")
+        serializer.save()
+        return success_response(data=serializer.data, message="Profile updated successfully")
 
 
 class BuyerListView(APIView):
@@ -472,7 +530,7 @@ class BuyerListView(APIView):
         """GET /buyers - List buyer profiles with filters."""
         # All authenticated users can view buyer profiles
 
-        queryset = BuyerProfile.objects.all()
+        queryset = BuyerProfile.objects.select_related("user").only(*BUYER_PROFILE_LIST_FIELDS)
 
         # Query params filtering
         product_category = request.query_params.get("product_category")
@@ -499,6 +557,10 @@ class BuyerListView(APIView):
         elif sort_by == "created_at":
             queryset = queryset.order_by("-created_at")
 
+        # Large exports: stream all rows instead of paginating
+        if request.query_params.get("stream") == "1":
+            return streaming_success_response(queryset, BuyerProfileSerializer, message="Buyer profiles retrieved successfully")
+
         # Pagination
         paginator = self.pagination_class()
         page = paginator.paginate_queryset(queryset, request)
@@ -526,9 +588,8 @@ class BuyerDetailView(APIView):
     )
     def get(self, request, buyer_id):
         """GET /buyers/:id - Get buyer profile detail."""
-        try:
-            buyer_profile = BuyerProfile.objects.get(id=buyer_id)
-        except BuyerProfile.DoesNotExist:
+        buyer_profile = BuyerProfile.objects.select_related("user").filter(id=buyer_id).first()
+        if buyer_profile is None:
             return not_found_response("Buyer profile not found")
 
         serializer = BuyerProfileSerializer(buyer_profile)
@@ -37,6 +37,7 @@ class ProductCatalogAdmin(admin.ModelAdmin):
         "updated_at",
     )
     list_filter = ("is_published", "unit_type", "created_at")
+    list_select_related = ("product__business__user",)
     search_fields = ("display_name", "product__name_local", "marketing_description")
     readonly_fields = ("published_at", "created_at", "updated_at")
     inlines = [ProductCatalogImageInline, CatalogVariantTypeInline]
@@ -68,6 +69,7 @@ class ProductCatalogAdmin(admin.ModelAdmin):
 class ProductCatalogImageAdmin(admin.ModelAdmin):
     list_display = ("catalog", "image_url", "sort_order", "is_primary", "created_at")
     list_filter = ("is_primary", "created_at")
+    list_select_related = ("catalog",)
     search_fields = ("catalog__display_name", "alt_text")
 
 
@@ -75,6 +77,7 @@ class ProductCatalogImageAdmin(admin.ModelAdmin):
 class CatalogVariantTypeAdmin(admin.ModelAdmin):
     list_display = ("catalog", "type_code", "type_name", "sort_order", "created_at")
     list_filter = ("type_code", "created_at")
+    list_select_related = ("catalog",)
     search_fields = ("catalog__display_name", "type_name")
     inlines = [CatalogVariantOptionInline]
 
@@ -83,4 +86,5 @@ class CatalogVariantTypeAdmin(admin.ModelAdmin):
 class CatalogVariantOptionAdmin(admin.ModelAdmin):
     list_display = ("variant_type", "option_name", "sort_order", "is_available", "created_at")
     list_filter = ("is_available", "created_at")
+    list_select_related = ("variant_type",)
     search_fields = ("variant_type__type_name", "option_name")
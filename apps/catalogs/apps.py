@@ -5,3 +5,11 @@ class CatalogsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.catalogs"
     verbose_name = "Product Catalogs"
+
+    def ready(self):
+        from rest_framework import serializers
+
+        from .fields import MoneyCentsField
+
+        # ModelSerializers render cents columns as the Decimal amounts they hold
+        serializers.ModelSerializer.serializer_field_mapping[MoneyCentsField] = serializers.DecimalField
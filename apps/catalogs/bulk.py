@@ -0,0 +1,92 @@
+"""
+Bulk loading helpers for large catalog imports.
+
+Very large variant option batches are streamed with PostgreSQL COPY through
+django-bulk-load; everything else goes through Django's bulk_create.
+"""
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+try:
+    from django_bulk_load import bulk_insert_models
+except ImportError:
+    bulk_insert_models = None
+
+# Above this many rows COPY beats multi-row INSERTs
+COPY_THRESHOLD = 5000
+
+# Rows per multi-row INSERT statement for bulk_create
+BULK_BATCH_SIZE = 500
+
+
+def load_variants(objs):
+    """Insert unsaved CatalogVariantOption instances in bulk."""
+    if bulk_insert_models and len(objs) > COPY_THRESHOLD and connection.vendor == "postgresql":
+        bulk_insert_models(objs)
+        return objs
+
+    from .models import CatalogVariantOption
+
+    return CatalogVariantOption.objects.bulk_create(objs, batch_size=BULK_BATCH_SIZE)
+
+
+def load_catalogs(items):
+    """
+    Insert catalogs from validated ProductCatalogCreateSerializer dicts, with
+    their nested "images" and "variant_types", using one bulk insert per table.
+
+    bulk_create skips save() and the image/variant sync hooks, so published_at,
+    primary_image_url and variant_matrix are filled in here the same way.
+    """
+    from .models import CatalogVariantOption, CatalogVariantType, ProductCatalog, ProductCatalogImage
+
+    now = timezone.now()
+    rows = []
+    for item in items:
+        item = dict(item)
+        images = [ProductCatalogImage(**image) for image in item.pop("images", [])]
+        variant_types = sorted((dict(vt) for vt in item.pop("variant_types", [])), key=lambda vt: vt["sort_order"])
+        for image in [image for image in images if image.is_primary][:-1]:
+            image.is_primary = False
+
+        catalog = ProductCatalog(**item)
+        if catalog.is_published:
+            catalog.published_at = now
+        thumbnail = min(images, key=lambda image: (not image.is_primary, image.sort_order), default=None)
+        catalog.primary_image_url = thumbnail.url if thumbnail else ""
+        catalog.variant_matrix = {
+            vt["type_name"]: [
+                option["option_name"]
+                for option in sorted(vt.get("options", []), key=lambda option: option["sort_order"])
+                if option["is_available"]
+            ]
+            for vt in variant_types
+        }
+        rows.append((catalog, images, variant_types))
+
+    with transaction.atomic():
+        catalogs = ProductCatalog.objects.bulk_create([row[0] for row in rows], batch_size=BULK_BATCH_SIZE)
+        images = []
+        type_objs = []
+        type_items = []
+        for catalog, catalog_images, variant_types in rows:
+            for image in catalog_images:
+                image.catalog = catalog
+                images.append(image)
+            for vt in variant_types:
+                type_objs.append(
+                    CatalogVariantType(catalog=catalog, **{k: v for k, v in vt.items() if k != "options"})
+                )
+                type_items.append(vt)
+
+        ProductCatalogImage.objects.bulk_create(images, batch_size=BULK_BATCH_SIZE)
+        type_objs = CatalogVariantType.objects.bulk_create(type_objs, batch_size=BULK_BATCH_SIZE)
+        load_variants(
+            [
+                CatalogVariantOption(variant_type=variant_type, **option)
+                for variant_type, vt in zip(type_objs, type_items)
+                for option in vt.get("options", [])
+            ]
+        )
+    return catalogs
@@ -0,0 +1,71 @@
+"""
+Custom model fields for Product Catalog Module
+"""
+
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+
+from django import forms
+from django.core.exceptions import ValidationError
+from django.core.validators import DecimalValidator
+from django.db import models
+from django.utils.functional import cached_property
+
+WHOLE_CENTS = Decimal(1)
+
+
+class MoneyCentsField(models.BigIntegerField):
+    """
+    Money amount stored as integer cents, read and written as a 2-place Decimal.
+
+    Prices are compared, summed and indexed as plain integers in the database
+    while Python code and the API keep seeing Decimal("12.34"). Exposes
+    max_digits/decimal_places so forms and DRF serializers build DecimalFields.
+    """
+
+    description = "Money amount stored as integer cents"
+    decimal_places = 2
+
+    def __init__(self, *args, max_digits=12, **kwargs):
+        self.max_digits = max_digits
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.max_digits != 12:
+            kwargs["max_digits"] = self.max_digits
+        return name, path, args, kwargs
+
+    @cached_property
+    def validators(self):
+        # Digit limits of the Decimal value instead of BigIntegerField's raw range
+        return [*self.default_validators, *self._validators, DecimalValidator(self.max_digits, self.decimal_places)]
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        return Decimal(int(value)).scaleb(-self.decimal_places)
+
+    def to_python(self, value):
+        if value is None or isinstance(value, Decimal):
+            return value
+        try:
+            return Decimal(str(value))
+        except InvalidOperation:
+            raise ValidationError(self.error_messages["invalid"], code="invalid", params={"value": value})
+
+    def get_prep_value(self, value):
+        value = models.Field.get_prep_value(self, value)
+        if value is None:
+            return value
+        cents = self.to_python(value).scaleb(self.decimal_places)
+        return int(cents.quantize(WHOLE_CENTS, rounding=ROUND_HALF_UP))
+
+    def formfield(self, **kwargs):
+        return super().formfield(
+            **{
+                "form_class": forms.DecimalField,
+                "max_digits": self.max_digits,
+                "decimal_places": self.decimal_places,
+                **kwargs,
+            }
+        )
@@ -0,0 +1,19 @@
+# Generated by Django 5.0.14 on 2026-10-17 15:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalogs', '0007_merge_20251207_1519'),
+        ('catalogs', '0008_remove_catalogpricingresult_catalog_and_more'),
+        ('products', '0002_alter_product_category_id'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='productcatalog',
+            index=models.Index(fields=['is_published', 'product'], name='idx_catalog_pub_prod'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.14 on 2026-10-17 16:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalogs', '0009_productcatalog_idx_catalog_pub_prod'),
+        ('products', '0002_alter_product_category_id'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='productcatalog',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['-updated_at'], name='cat_pub_updated_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated manually: PostgreSQL-only GIN index for the public catalog tag filter
+
+from django.db import migrations
+
+
+def create_gin_index(apps, schema_editor):
+    # GIN/jsonb_path_ops are PostgreSQL-specific; other backends (SQLite in tests) skip it
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS cat_tags_gin ON product_catalogs USING GIN (tags jsonb_path_ops);'
+    )
+
+
+def drop_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS cat_tags_gin;')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalogs', '0010_productcatalog_cat_pub_updated_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_gin_index, drop_gin_index),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.14 on 2026-10-17 16:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalogs', '0011_productcatalog_tags_gin'),
+        ('products', '0002_alter_product_category_id'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='productcatalog',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['base_price_exw'], name='cat_pub_price_exw_idx'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.0.14 on 2026-10-17 16:16
+
+from django.db import migrations, models
+
+
+def demote_duplicate_primary_images(apps, schema_editor):
+    """Keep only the first (sort_order, id) primary image per catalog before adding the constraint"""
+    ProductCatalogImage = apps.get_model('catalogs', 'ProductCatalogImage')
+    seen_catalogs = set()
+    duplicate_ids = []
+    primaries = ProductCatalogImage.objects.filter(is_primary=True).order_by('catalog_id', 'sort_order', 'id')
+    for image_id, catalog_id in primaries.values_list('id', 'catalog_id'):
+        if catalog_id in seen_catalogs:
+            duplicate_ids.append(image_id)
+        seen_catalogs.add(catalog_id)
+    ProductCatalogImage.objects.filter(id__in=duplicate_ids).update(is_primary=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalogs', '0012_productcatalog_cat_pub_price_exw_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(demote_duplicate_primary_images, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='productcatalogimage',
+            index=models.Index(fields=['catalog', 'sort_order'], name='cat_img_catalog_sort_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='productcatalogimage',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_primary', True)), fields=('catalog',), name='one_primary_image_per_catalog'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.0.14 on 2026-10-17 17:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalogs', '0013_productcatalogimage_one_primary_image_per_catalog'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='catalogvariantoption',
+            name='sort_order',
+            field=models.PositiveSmallIntegerField(default=0, help_text='Display order'),
+        ),
+        migrations.AlterField(
+            model_name='catalogvarianttype',
+            name='sort_order',
+            field=models.PositiveSmallIntegerField(default=0, help_text='Display order'),
+        ),
+        migrations.AlterField(
+            model_name='productcatalog',
+            name='lead_time_days',
+            field=models.PositiveSmallIntegerField(default=14, help_text='Production lead time in days'),
+        ),
+        migrations.AlterField(
+            model_name='productcatalogimage',
+            name='sort_order',
+            field=models.PositiveSmallIntegerField(default=0, help_text='Display order (lower = first)'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.0.14 on 2026-10-17 17:05
+
+from django.db import migrations, models
+
+
+def backfill_primary_image_url(apps, schema_editor):
+    """Copy each catalog's primary (or first) image URL onto the catalog"""
+    ProductCatalog = apps.get_model('catalogs', 'ProductCatalog')
+    ProductCatalogImage = apps.get_model('catalogs', 'ProductCatalogImage')
+    thumbnails = {}
+    for image in ProductCatalogImage.objects.order_by('catalog_id', '-is_primary', 'sort_order', 'id'):
+        if image.catalog_id not in thumbnails:
+            thumbnails[image.catalog_id] = image.image.url if image.image else image.image_url
+    for catalog_id, url in thumbnails.items():
+        ProductCatalog.objects.filter(pk=catalog_id).update(primary_image_url=url)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalogs', '0014_smallint_sort_order_lead_time'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='productcatalog',
+            name='primary_image_url',
+            field=models.URLField(blank=True, editable=False, help_text='URL of the primary (or first) image, for list thumbnails', max_length=500),
+        ),
+        migrations.RunPython(backfill_primary_image_url, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.0.14 on 2026-10-17 17:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalogs', '0015_productcatalog_primary_image_url'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='catalogvarianttype',
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name='catalogvarianttype',
+            constraint=models.UniqueConstraint(fields=('catalog', 'type_name'), name='uq_variant_type_name_per_catalog'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='catalogvariantoption',
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name='catalogvariantoption',
+            constraint=models.UniqueConstraint(fields=('variant_type', 'option_name'), name='uq_variant_option_name_per_type'),
+        ),
+    ]
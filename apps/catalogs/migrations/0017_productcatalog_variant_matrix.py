@@ -0,0 +1,35 @@
+# Generated by Django 5.0.14 on 2026-10-17 17:40
+
+from django.db import migrations, models
+
+
+def backfill_variant_matrix(apps, schema_editor):
+    """Build each catalog's {type_name: [available option names]} matrix"""
+    ProductCatalog = apps.get_model('catalogs', 'ProductCatalog')
+    CatalogVariantType = apps.get_model('catalogs', 'CatalogVariantType')
+    matrices = {}
+    rows = CatalogVariantType.objects.order_by(
+        'catalog_id', 'sort_order', 'id', 'options__sort_order', 'options__id'
+    ).values_list('catalog_id', 'type_name', 'options__option_name', 'options__is_available')
+    for catalog_id, type_name, option_name, is_available in rows:
+        options = matrices.setdefault(catalog_id, {}).setdefault(type_name, [])
+        if option_name is not None and is_available:
+            options.append(option_name)
+    for catalog_id, matrix in matrices.items():
+        ProductCatalog.objects.filter(pk=catalog_id).update(variant_matrix=matrix)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalogs', '0016_variant_name_unique_constraints'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='productcatalog',
+            name='variant_matrix',
+            field=models.JSONField(blank=True, default=dict, editable=False, help_text='Variant type names mapped to their available option names'),
+        ),
+        migrations.RunPython(backfill_variant_matrix, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.0.14 on 2026-10-17 17:55
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+def create_search_trigger(apps, schema_editor):
+    # tsvector triggers and GIN are PostgreSQL-specific; other backends (SQLite in tests) skip them
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        # Only writes touching the searched columns recompute the vector
+        "CREATE TRIGGER cat_search_vector_update "
+        "BEFORE INSERT OR UPDATE OF display_name, marketing_description, export_description ON product_catalogs "
+        "FOR EACH ROW EXECUTE FUNCTION tsvector_update_trigger("
+        "search_vector, 'pg_catalog.english', display_name, marketing_description, export_description);"
+    )
+    # Fire the trigger once for existing rows
+    schema_editor.execute('UPDATE product_catalogs SET display_name = display_name;')
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS cat_search_vector_gin ON product_catalogs USING GIN (search_vector);'
+    )
+
+
+def drop_search_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS cat_search_vector_gin;')
+    schema_editor.execute('DROP TRIGGER IF EXISTS cat_search_vector_update ON product_catalogs;')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalogs', '0017_productcatalog_variant_matrix'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='productcatalog',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_trigger, drop_search_trigger),
+    ]
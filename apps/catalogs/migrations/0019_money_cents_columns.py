@@ -0,0 +1,114 @@
+# Generated by Django 5.0.14 on 2026-10-17 18:10
+
+import apps.catalogs.fields
+from apps.catalogs.fields import MoneyCentsField
+from django.db import migrations
+
+MONEY_COLUMNS = {
+    'productcatalog': ['base_price_exw', 'base_price_fob', 'base_price_cif'],
+    'productpricingresult': [
+        'cogs_per_unit_idr',
+        'exchange_rate_used',
+        'exw_price_usd',
+        'fob_price_usd',
+        'cif_price_usd',
+    ],
+}
+
+
+def _money_fields(apps):
+    """Yield (model, decimal field, cents field) for every converted column"""
+    for model_name, field_names in MONEY_COLUMNS.items():
+        model = apps.get_model('catalogs', model_name)
+        for name in field_names:
+            decimal_field = model._meta.get_field(name)
+            cents_field = MoneyCentsField(
+                null=decimal_field.null, blank=decimal_field.blank, help_text=decimal_field.help_text
+            )
+            cents_field.set_attributes_from_name(name)
+            cents_field.model = model
+            yield model, decimal_field, cents_field
+
+
+def decimal_to_cents(apps, schema_editor):
+    quote = schema_editor.quote_name
+    for model, decimal_field, cents_field in _money_fields(apps):
+        table, column = quote(model._meta.db_table), quote(decimal_field.column)
+        if schema_editor.connection.vendor == 'postgresql':
+            # One rewrite per column; indexes on it are rebuilt by PostgreSQL
+            schema_editor.execute(
+                f'ALTER TABLE {table} ALTER COLUMN {column} TYPE bigint USING round({column} * 100)::bigint;'
+            )
+        else:
+            schema_editor.alter_field(model, decimal_field, cents_field)
+            schema_editor.execute(f'UPDATE {table} SET {column} = ROUND({column} * 100);')
+
+
+def cents_to_decimal(apps, schema_editor):
+    quote = schema_editor.quote_name
+    for model, decimal_field, cents_field in _money_fields(apps):
+        table, column = quote(model._meta.db_table), quote(decimal_field.column)
+        if schema_editor.connection.vendor == 'postgresql':
+            schema_editor.execute(
+                f'ALTER TABLE {table} ALTER COLUMN {column} TYPE numeric(12, 2) USING {column} / 100.0;'
+            )
+        else:
+            schema_editor.alter_field(model, cents_field, decimal_field)
+            schema_editor.execute(f'UPDATE {table} SET {column} = {column} / 100.0;')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalogs', '0018_productcatalog_search_vector'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(decimal_to_cents, cents_to_decimal),
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name='productcatalog',
+                    name='base_price_cif',
+                    field=apps.catalogs.fields.MoneyCentsField(blank=True, help_text='CIF price in USD (optional)', null=True),
+                ),
+                migrations.AlterField(
+                    model_name='productcatalog',
+                    name='base_price_exw',
+                    field=apps.catalogs.fields.MoneyCentsField(help_text='EXW price in USD'),
+                ),
+                migrations.AlterField(
+                    model_name='productcatalog',
+                    name='base_price_fob',
+                    field=apps.catalogs.fields.MoneyCentsField(blank=True, help_text='FOB price in USD (optional)', null=True),
+                ),
+                migrations.AlterField(
+                    model_name='productpricingresult',
+                    name='cif_price_usd',
+                    field=apps.catalogs.fields.MoneyCentsField(blank=True, help_text='CIF price in USD (if target country provided)', null=True),
+                ),
+                migrations.AlterField(
+                    model_name='productpricingresult',
+                    name='cogs_per_unit_idr',
+                    field=apps.catalogs.fields.MoneyCentsField(help_text='Cost of goods sold per unit in IDR'),
+                ),
+                migrations.AlterField(
+                    model_name='productpricingresult',
+                    name='exchange_rate_used',
+                    field=apps.catalogs.fields.MoneyCentsField(help_text='Exchange rate used for calculation'),
+                ),
+                migrations.AlterField(
+                    model_name='productpricingresult',
+                    name='exw_price_usd',
+                    field=apps.catalogs.fields.MoneyCentsField(help_text='EXW price in USD'),
+                ),
+                migrations.AlterField(
+                    model_name='productpricingresult',
+                    name='fob_price_usd',
+                    field=apps.catalogs.fields.MoneyCentsField(help_text='FOB price in USD'),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated manually: PostgreSQL-only GIN index for recommended country containment filters
+
+from django.db import migrations
+
+
+def create_gin_index(apps, schema_editor):
+    # GIN/jsonb_path_ops are PostgreSQL-specific; other backends (SQLite in tests) skip it
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS pmi_rec_countries_gin ON product_market_intelligence '
+        'USING GIN (recommended_countries jsonb_path_ops);'
+    )
+
+
+def drop_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS pmi_rec_countries_gin;')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalogs', '0019_money_cents_columns'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_gin_index, drop_gin_index),
+    ]
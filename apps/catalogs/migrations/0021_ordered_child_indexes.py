@@ -0,0 +1,29 @@
+# Generated by Django 5.0.14 on 2026-10-17 17:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalogs', '0020_productmarketintelligence_countries_gin'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='productcatalogimage',
+            name='cat_img_catalog_sort_idx',
+        ),
+        migrations.AddIndex(
+            model_name='catalogvariantoption',
+            index=models.Index(fields=['variant_type', 'sort_order', 'id'], name='cat_vo_type_sort_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='catalogvarianttype',
+            index=models.Index(fields=['catalog', 'sort_order', 'id'], name='cat_vt_cat_sort_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='productcatalogimage',
+            index=models.Index(fields=['catalog', 'sort_order', 'id'], name='cat_img_cat_sort_id_idx'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated manually: PostgreSQL-only trigger stamping published_at on first publish
+
+from django.db import migrations
+
+
+def create_published_at_trigger(apps, schema_editor):
+    # plpgsql triggers are PostgreSQL-specific; other backends rely on ProductCatalog.save()
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        """
+        CREATE OR REPLACE FUNCTION product_catalogs_stamp_published_at() RETURNS trigger AS $$
+        BEGIN
+            IF NEW.is_published AND NEW.published_at IS NULL THEN
+                NEW.published_at := now();
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    schema_editor.execute(
+        'CREATE TRIGGER cat_published_at_stamp BEFORE INSERT OR UPDATE OF is_published ON product_catalogs '
+        'FOR EACH ROW EXECUTE FUNCTION product_catalogs_stamp_published_at();'
+    )
+
+
+def drop_published_at_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP TRIGGER IF EXISTS cat_published_at_stamp ON product_catalogs;')
+    schema_editor.execute('DROP FUNCTION IF EXISTS product_catalogs_stamp_published_at();')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalogs', '0021_ordered_child_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_published_at_trigger, drop_published_at_trigger),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.0.14 on 2026-10-17 17:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalogs', '0022_productcatalog_published_at_trigger'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='productcatalogimage',
+            index=models.Index(fields=['catalog', '-is_primary', 'sort_order', 'id'], name='cat_img_thumbnail_idx'),
+        ),
+    ]
@@ -7,10 +7,85 @@ Implements:
 - CatalogVariant: Product variants (size, color, flavor, etc.)
 """
 
-from django.db import models
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models, transaction
 from django.utils import timezone
 from apps.products.models import Product
 
+from .bulk import BULK_BATCH_SIZE, load_variants
+from .fields import MoneyCentsField
+
+
+class ProductCatalogQuerySet(models.QuerySet):
+    def with_display(self, available_only=False, include=("images", "variant_types")):
+        """
+        Attach product, images and variant types/options used by catalog serializers.
+
+        With available_only, options flagged unavailable are left out of the
+        prefetch (buyer-facing views); owners still see every option.
+        include limits the nested collections that are prefetched.
+        """
+        options = CatalogVariantOption.objects.order_by("sort_order", "id")
+        if available_only:
+            options = options.filter(is_available=True)
+        lookups = []
+        if "images" in include:
+            lookups.append("images")
+        if "variant_types" in include:
+            lookups.append(
+                models.Prefetch(
+                    "variant_types",
+                    queryset=CatalogVariantType.objects.order_by("sort_order", "id").prefetch_related(
+                        models.Prefetch("options", queryset=options)
+                    ),
+                )
+            )
+        return self.select_related("product").prefetch_related(*lookups)
+
+    def for_listing(self):
+        """
+        Load only the columns list views render, leaving the large JSON and
+        text columns (technical_specs, safety_info, marketing_description) unread.
+        """
+        return self.select_related("product").only(
+            "id",
+            "product__id",
+            "product__name_local",
+            "is_published",
+            "display_name",
+            "min_order_quantity",
+            "unit_type",
+            "base_price_exw",
+            "base_price_fob",
+            "lead_time_days",
+            "available_stock",
+            "tags",
+            "export_description",
+            "primary_image_url",
+            "variant_matrix",
+            "updated_at",
+        )
+
+    def only_related(self, *related_fields):
+        """
+        Keep every catalog column but read only the given columns of joined
+        product-side rows (e.g. "product__business__company_name").
+        search_vector is only used for filtering and is never loaded.
+        """
+        local = [field.name for field in self.model._meta.concrete_fields if field.name != "search_vector"]
+        return self.only(*local, *related_fields)
+
+    def touch(self, **fields):
+        """Bump updated_at so caches keyed on it see nested image/variant changes."""
+        return self.update(updated_at=timezone.now(), **fields)
+
+
+class PublishedCatalogManager(models.Manager.from_queryset(ProductCatalogQuerySet)):
+    """Buyer-facing manager: only published catalogs (served by the partial indexes)."""
+
+    def get_queryset(self):
+        return super().get_queryset().filter(is_published=True)
+
 
 class ProductCatalog(models.Model):
     """
@@ -65,22 +140,16 @@ class ProductCatalog(models.Model):
         help_text="Unit type for ordering"
     )
 
-    # Pricing (from costing calculations)
-    base_price_exw = models.DecimalField(
-        max_digits=12,
-        decimal_places=2,
+    # Pricing (from costing calculations), stored as integer cents
+    base_price_exw = MoneyCentsField(
         help_text="EXW price in USD"
     )
-    base_price_fob = models.DecimalField(
-        max_digits=12,
-        decimal_places=2,
+    base_price_fob = MoneyCentsField(
         null=True,
         blank=True,
         help_text="FOB price in USD (optional)"
     )
-    base_price_cif = models.DecimalField(
-        max_digits=12,
-        decimal_places=2,
+    base_price_cif = MoneyCentsField(
         null=True,
         blank=True,
         help_text="CIF price in USD (optional)"
@@ -103,7 +172,7 @@ class ProductCatalog(models.Model):
     )
 
     # Additional catalog fields
-    lead_time_days = models.PositiveIntegerField(
+    lead_time_days = models.PositiveSmallIntegerField(
         default=14,
         help_text="Production lead time in days"
     )
@@ -117,6 +186,27 @@ class ProductCatalog(models.Model):
         help_text="Tags for search/filter (e.g., ['eco-friendly', 'handmade'])"
     )
 
+    # Full-text search over display_name/marketing_description/export_description,
+    # filled by a PostgreSQL trigger (see migration 0018); stays NULL elsewhere
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    # Denormalized variant picker {type_name: [available option names]}, kept in
+    # sync by CatalogVariantType/CatalogVariantOption
+    variant_matrix = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        help_text="Variant type names mapped to their available option names"
+    )
+
+    # Denormalized thumbnail, kept in sync by ProductCatalogImage
+    primary_image_url = models.URLField(
+        max_length=500,
+        blank=True,
+        editable=False,
+        help_text="URL of the primary (or first) image, for list thumbnails"
+    )
+
     # Timestamps
     published_at = models.DateTimeField(
         null=True,
@@ -126,21 +216,64 @@ class ProductCatalog(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ProductCatalogQuerySet.as_manager()
+    published = PublishedCatalogManager()
+
     class Meta:
         db_table = "product_catalogs"
         ordering = ["-updated_at"]
         verbose_name = "Product Catalog"
         verbose_name_plural = "Product Catalogs"
+        indexes = [
+            # Buyer matching filters published catalogs, then joins product by category
+            models.Index(fields=["is_published", "product"], name="idx_catalog_pub_prod"),
+            # Public browse lists published catalogs newest first (partial: published rows only)
+            models.Index(
+                fields=["-updated_at"],
+                name="cat_pub_updated_idx",
+                condition=models.Q(is_published=True),
+            ),
+            # Public browse min_price/max_price range filter on published rows
+            models.Index(
+                fields=["base_price_exw"],
+                name="cat_pub_price_exw_idx",
+                condition=models.Q(is_published=True),
+            ),
+            # GIN (jsonb_path_ops) on tags for the public tag filter (tags @> [...]) is
+            # PostgreSQL-only, see migration 0011_productcatalog_tags_gin
+            # GIN on search_vector and its update trigger are PostgreSQL-only too,
+            # see migration 0018_productcatalog_search_vector
+        ]
 
     def __str__(self):
         return f"{self.display_name} ({'Published' if self.is_published else 'Draft'})"
 
     def save(self, *args, **kwargs):
-        # Set published_at when first published
+        # Set published_at when first published. On PostgreSQL a trigger does the
+        # same for queryset .update(is_published=True), see migration 0022; this
+        # keeps the instance in sync and covers other backends.
         if self.is_published and not self.published_at:
             self.published_at = timezone.now()
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None and "published_at" not in update_fields:
+                kwargs["update_fields"] = [*update_fields, "published_at"]
         super().save(*args, **kwargs)
 
+    @property
+    def primary_image(self):
+        """Primary (or first) image URL, None when the catalog has no images"""
+        return self.primary_image_url or None
+
+    @property
+    def variant_type_count(self):
+        """Number of variant types, read from the materialized variant_matrix"""
+        return len(self.variant_matrix)
+
+    @property
+    def has_ai_description(self):
+        """Whether an export description has been generated"""
+        return bool(self.export_description and self.export_description.strip())
+
 
 def catalog_image_path(instance, filename):
     """Generate upload path for catalog images: catalog_images/{catalog_id}/{filename}"""
@@ -176,7 +309,7 @@ class ProductCatalogImage(models.Model):
         blank=True,
         help_text="Alt text for accessibility"
     )
-    sort_order = models.PositiveIntegerField(
+    sort_order = models.PositiveSmallIntegerField(
         default=0,
         help_text="Display order (lower = first)"
     )
@@ -191,9 +324,74 @@ class ProductCatalogImage(models.Model):
         ordering = ["sort_order", "id"]
         verbose_name = "Catalog Image"
         verbose_name_plural = "Catalog Images"
+        indexes = [
+            # Ordered image list per catalog, matching Meta.ordering so no sort step is needed
+            models.Index(fields=["catalog", "sort_order", "id"], name="cat_img_cat_sort_id_idx"),
+            # Thumbnail pick in sync_catalog: primary first, then first by order
+            models.Index(fields=["catalog", "-is_primary", "sort_order", "id"], name="cat_img_thumbnail_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["catalog"],
+                condition=models.Q(is_primary=True),
+                name="one_primary_image_per_catalog",
+            ),
+        ]
 
     def __str__(self):
-        return f"Image {self.sort_order} for {self.catalog.display_name}"
+        return f"Image {self.sort_order} (catalog #{self.catalog_id})"
+
+    def save(self, *args, **kwargs):
+        # Only one primary image per catalog: demote the current one first
+        if self.is_primary:
+            ProductCatalogImage.objects.filter(catalog_id=self.catalog_id, is_primary=True).exclude(
+                pk=self.pk
+            ).update(is_primary=False)
+        super().save(*args, **kwargs)
+        self.sync_catalog(self.catalog_id)
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        self.sync_catalog(self.catalog_id)
+        return result
+
+    @classmethod
+    def sync_catalog(cls, catalog_id):
+        """Copy the primary (or first) image URL onto the catalog and bump its updated_at."""
+        thumbnail = cls.objects.filter(catalog_id=catalog_id).order_by("-is_primary", "sort_order", "id").first()
+        ProductCatalog.objects.filter(pk=catalog_id).touch(primary_image_url=thumbnail.url if thumbnail else "")
+
+    @classmethod
+    def bulk_replace(cls, catalog, items):
+        """
+        Replace all images of a catalog with the given field dicts in bulk.
+
+        bulk_create skips save(), so demote every primary but the last one
+        here, the same outcome as saving the images one by one.
+        """
+        images = [cls(catalog=catalog, **item) for item in items]
+        for image in [image for image in images if image.is_primary][:-1]:
+            image.is_primary = False
+
+        with transaction.atomic():
+            cls.objects.filter(catalog=catalog).delete()
+            images = cls.objects.bulk_create(images, batch_size=BULK_BATCH_SIZE)
+            cls.sync_catalog(catalog.pk)
+        return images
+
+    @classmethod
+    def bulk_add(cls, catalog, images):
+        """
+        Append unsaved images to a catalog in one bulk insert and sync the
+        catalog thumbnail once. Callers must not pass a second primary image.
+        """
+        if not images:
+            return images
+        for image in images:
+            image.catalog = catalog
+        images = cls.objects.bulk_create(images, batch_size=BULK_BATCH_SIZE)
+        cls.sync_catalog(catalog.pk)
+        return images
 
     @property
     def url(self):
@@ -237,7 +435,7 @@ class CatalogVariantType(models.Model):
         max_length=100,
         help_text="Display name for this variant type (e.g., 'Warna', 'Ukuran', or custom name)"
     )
-    sort_order = models.PositiveIntegerField(
+    sort_order = models.PositiveSmallIntegerField(
         default=0,
         help_text="Display order"
     )
@@ -248,10 +446,64 @@ class CatalogVariantType(models.Model):
         ordering = ["sort_order", "id"]
         verbose_name = "Catalog Variant Type"
         verbose_name_plural = "Catalog Variant Types"
-        unique_together = ["catalog", "type_name"]
+        indexes = [
+            # Ordered variant type list per catalog
+            models.Index(fields=["catalog", "sort_order", "id"], name="cat_vt_cat_sort_id_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=["catalog", "type_name"], name="uq_variant_type_name_per_catalog"),
+        ]
 
     def __str__(self):
-        return f"{self.catalog.display_name} - {self.type_name}"
+        return f"{self.type_name} (catalog #{self.catalog_id})"
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self.sync_catalog(self.catalog_id)
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        self.sync_catalog(self.catalog_id)
+        return result
+
+    @classmethod
+    def sync_catalog(cls, catalog_id):
+        """Rebuild the catalog's variant_matrix in one joined query and bump its updated_at."""
+        rows = (
+            cls.objects.filter(catalog_id=catalog_id)
+            .order_by("sort_order", "id", "options__sort_order", "options__id")
+            .values_list("type_name", "options__option_name", "options__is_available")
+        )
+        matrix = {}
+        for type_name, option_name, is_available in rows:
+            options = matrix.setdefault(type_name, [])
+            if option_name is not None and is_available:
+                options.append(option_name)
+        ProductCatalog.objects.filter(pk=catalog_id).touch(variant_matrix=matrix)
+
+    @classmethod
+    def bulk_replace(cls, catalog, items):
+        """
+        Replace all variant types of a catalog, with their nested "options",
+        using one bulk insert per table.
+        """
+        items = [dict(item) for item in items]
+        variant_types = [
+            cls(catalog=catalog, **{k: v for k, v in item.items() if k != "options"}) for item in items
+        ]
+
+        with transaction.atomic():
+            cls.objects.filter(catalog=catalog).delete()
+            variant_types = cls.objects.bulk_create(variant_types, batch_size=BULK_BATCH_SIZE)
+            load_variants(
+                [
+                    CatalogVariantOption(variant_type=variant_type, **option)
+                    for variant_type, item in zip(variant_types, items)
+                    for option in item.get("options", [])
+                ]
+            )
+            cls.sync_catalog(catalog.pk)
+        return variant_types
 
 
 class CatalogVariantOption(models.Model):
@@ -269,7 +521,7 @@ class CatalogVariantOption(models.Model):
         max_length=100,
         help_text="Option name (e.g., 'Merah', 'Biru', 'S', 'M', 'L')"
     )
-    sort_order = models.PositiveIntegerField(
+    sort_order = models.PositiveSmallIntegerField(
         default=0,
         help_text="Display order"
     )
@@ -284,11 +536,35 @@ class CatalogVariantOption(models.Model):
         ordering = ["sort_order", "id"]
         verbose_name = "Catalog Variant Option"
         verbose_name_plural = "Catalog Variant Options"
-        unique_together = ["variant_type", "option_name"]
+        indexes = [
+            # Ordered option list per variant type
+            models.Index(fields=["variant_type", "sort_order", "id"], name="cat_vo_type_sort_id_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=["variant_type", "option_name"], name="uq_variant_option_name_per_type"),
+        ]
 
     def __str__(self):
         return f"{self.variant_type.type_name}: {self.option_name}"
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        CatalogVariantType.sync_catalog(self.variant_type.catalog_id)
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        CatalogVariantType.sync_catalog(self.variant_type.catalog_id)
+        return result
+
+
+class ProductMarketIntelligenceQuerySet(models.QuerySet):
+    def recommending(self, country_code):
+        """
+        Results whose recommended_countries include country_code, filtered by
+        PostgreSQL (jsonb containment, GIN-indexed) instead of a Python loop.
+        """
+        return self.filter(recommended_countries__contains=[{"country_code": country_code}])
+
 
 class ProductMarketIntelligence(models.Model):
     """
@@ -343,10 +619,14 @@ class ProductMarketIntelligence(models.Model):
     generated_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ProductMarketIntelligenceQuerySet.as_manager()
+
     class Meta:
         db_table = "product_market_intelligence"
         verbose_name = "Product Market Intelligence"
         verbose_name_plural = "Product Market Intelligence"
+        # GIN (jsonb_path_ops) on recommended_countries for recommending() is
+        # PostgreSQL-only, see migration 0020_productmarketintelligence_countries_gin
 
     def __str__(self):
         return f"Market Intelligence for {self.product.name_local}"
@@ -366,9 +646,7 @@ class ProductPricingResult(models.Model):
     )
 
     # Input parameters
-    cogs_per_unit_idr = models.DecimalField(
-        max_digits=12,
-        decimal_places=2,
+    cogs_per_unit_idr = MoneyCentsField(
         help_text="Cost of goods sold per unit in IDR"
     )
     target_margin_percent = models.DecimalField(
@@ -384,24 +662,16 @@ class ProductPricingResult(models.Model):
     )
 
     # Calculated prices
-    exchange_rate_used = models.DecimalField(
-        max_digits=12,
-        decimal_places=2,
+    exchange_rate_used = MoneyCentsField(
         help_text="Exchange rate used for calculation"
     )
-    exw_price_usd = models.DecimalField(
-        max_digits=12,
-        decimal_places=2,
+    exw_price_usd = MoneyCentsField(
         help_text="EXW price in USD"
     )
-    fob_price_usd = models.DecimalField(
-        max_digits=12,
-        decimal_places=2,
+    fob_price_usd = MoneyCentsField(
         help_text="FOB price in USD"
     )
-    cif_price_usd = models.DecimalField(
-        max_digits=12,
-        decimal_places=2,
+    cif_price_usd = MoneyCentsField(
         null=True,
         blank=True,
         help_text="CIF price in USD (if target country provided)"
@@ -7,11 +7,94 @@ Implements CRUD serializers for:
 - CatalogVariantType & CatalogVariantOption
 """
 
+from django.db import transaction
+from django.db.models import BooleanField, Case, Value, When
+from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
+from apps.products.models import Product
+from core.serializers import CachedFieldsMixin
+from .bulk import load_catalogs, load_variants
 from .models import ProductCatalog, ProductCatalogImage, CatalogVariantType, CatalogVariantOption
 
-
-class CatalogImageSerializer(serializers.ModelSerializer):
+# Field sets are fixed at import time and shared by the catalog serializers below
+_CATALOG_CONTENT_FIELDS = (
+    "display_name",
+    "marketing_description",
+    "export_description",
+    "technical_specs",
+    "safety_info",
+    "min_order_quantity",
+    "unit_type",
+    "base_price_exw",
+    "base_price_fob",
+    "base_price_cif",
+    "lead_time_days",
+    "available_stock",
+    "tags",
+)
+_DETAIL_FIELDS = (
+    "id",
+    "product",
+    "product_name",
+    "product_hs_code",
+    "is_published",
+    *_CATALOG_CONTENT_FIELDS,
+    "published_at",
+    "created_at",
+    "updated_at",
+    "images",
+    "variant_types",
+)
+_LIST_FIELDS = (
+    "id",
+    "product",
+    "product_name",
+    "is_published",
+    "display_name",
+    "min_order_quantity",
+    "unit_type",
+    "base_price_exw",
+    "base_price_fob",
+    "lead_time_days",
+    "available_stock",
+    "tags",
+    "primary_image",
+    "variant_type_count",
+    "has_ai_description",
+    "updated_at",
+)
+# Columns behind _LIST_FIELDS, fetched with .values() by ProductCatalogListSerializer
+_LIST_VALUES = (
+    "id",
+    "product_id",
+    "product__name_local",
+    "is_published",
+    "display_name",
+    "min_order_quantity",
+    "unit_type",
+    "base_price_exw",
+    "base_price_fob",
+    "lead_time_days",
+    "available_stock",
+    "tags",
+    "primary_image_url",
+    "variant_matrix",
+    "updated_at",
+)
+_CREATE_FIELDS = ("product_id", "is_published", *_CATALOG_CONTENT_FIELDS, "images", "variant_types")
+_UPDATE_FIELDS = ("is_published", *_CATALOG_CONTENT_FIELDS)
+# Nested collections of the detail serializer that ?include= can select
+DETAIL_INCLUDES = ("images", "variant_types")
+_PUBLIC_FIELDS = ("id", *_CATALOG_CONTENT_FIELDS, "seller_name", "images", "variant_types", "published_at")
+
+# Dropdown entries for the fixed VARIANT_TYPE_CHOICES, built once
+_PREDEFINED_VARIANT_TYPES = tuple(
+    {"code": code, "label": label} for code, label in CatalogVariantType.VARIANT_TYPE_CHOICES
+)
+_VARIANT_TYPE_CODES = frozenset(code for code, _ in CatalogVariantType.VARIANT_TYPE_CHOICES)
+
+
+class CatalogImageSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for catalog images - supports both file upload and URL"""
 
     # Read-only field that returns the final URL (from uploaded file or external URL)
@@ -34,14 +117,22 @@ class CatalogImageSerializer(serializers.ModelSerializer):
     def get_url(self, obj):
         """Return the image URL - either from uploaded file or external URL"""
         if obj.image:
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(obj.image.url)
-            return obj.image.url
+            url = obj.image.url
+            base_uri = self._get_base_uri()
+            if base_uri and url.startswith("/"):
+                return f"{base_uri}{url}"
+            return url
         return obj.image_url
 
+    def _get_base_uri(self):
+        """Request scheme and host, resolved once per serialization and shared by nested images"""
+        if "_base_uri" not in self.context:
+            request = self.context.get("request")
+            self.context["_base_uri"] = request.build_absolute_uri("/")[:-1] if request else None
+        return self.context["_base_uri"]
+
 
-class CatalogVariantOptionSerializer(serializers.ModelSerializer):
+class CatalogVariantOptionSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for variant options (e.g., Merah, Biru for Color)"""
 
     class Meta:
@@ -73,13 +164,15 @@ class CatalogVariantTypeSerializer(serializers.ModelSerializer):
         )
         read_only_fields = ("id", "created_at")
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Prefetch the nested options."""
+        return queryset.prefetch_related("options")
+
     @staticmethod
     def get_predefined_types():
-        """Return list of predefined variant types for dropdown"""
-        return [
-            {"code": code, "label": label}
-            for code, label in CatalogVariantType.VARIANT_TYPE_CHOICES
-        ]
+        """Return list of predefined variant types for dropdown (shared, do not mutate)"""
+        return _PREDEFINED_VARIANT_TYPES
 
 
 class ProductCatalogSerializer(serializers.ModelSerializer):
@@ -99,33 +192,28 @@ class ProductCatalogSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = ProductCatalog
-        fields = (
-            "id",
-            "product",
-            "product_name",
-            "product_hs_code",
-            "is_published",
-            "display_name",
-            "marketing_description",
-            "export_description",
-            "technical_specs",
-            "safety_info",
-            "min_order_quantity",
-            "unit_type",
-            "base_price_exw",
-            "base_price_fob",
-            "base_price_cif",
-            "lead_time_days",
-            "available_stock",
-            "tags",
-            "published_at",
-            "created_at",
-            "updated_at",
-            "images",
-            "variant_types",
-        )
+        fields = _DETAIL_FIELDS
         read_only_fields = ("id", "published_at", "created_at", "updated_at")
 
+    def __init__(self, *args, include=DETAIL_INCLUDES, **kwargs):
+        super().__init__(*args, **kwargs)
+        for name in DETAIL_INCLUDES:
+            if name not in include:
+                self.fields.pop(name)
+
+    @classmethod
+    def setup_eager_loading(cls, queryset, available_only=False, include=DETAIL_INCLUDES):
+        """
+        Join/prefetch everything this serializer reads: product, enrichment, images, variants.
+        available_only leaves unavailable variant options out (buyer views);
+        include limits the nested collections, as in the serializer itself.
+        """
+        return (
+            queryset.with_display(available_only=available_only, include=include)
+            .select_related("product__enrichment")
+            .only_related("product__name_local", "product__enrichment__hs_code_recommendation")
+        )
+
 
 class ProductCatalogListSerializer(serializers.ModelSerializer):
     """
@@ -134,66 +222,130 @@ class ProductCatalogListSerializer(serializers.ModelSerializer):
     """
 
     product_name = serializers.CharField(source="product.name_local", read_only=True)
-    primary_image = serializers.SerializerMethodField()
-    variant_type_count = serializers.SerializerMethodField()
-    has_ai_description = serializers.SerializerMethodField()
+    # Model properties over denormalized columns, no per-row queries
+    primary_image = serializers.ReadOnlyField()
+    variant_type_count = serializers.ReadOnlyField()
+    has_ai_description = serializers.ReadOnlyField()
 
     class Meta:
         model = ProductCatalog
-        fields = (
-            "id",
-            "product",
-            "product_name",
-            "is_published",
-            "display_name",
-            "min_order_quantity",
-            "unit_type",
-            "base_price_exw",
-            "base_price_fob",
-            "lead_time_days",
-            "available_stock",
-            "tags",
-            "primary_image",
-            "variant_type_count",
-            "has_ai_description",
-            "updated_at",
+        fields = _LIST_FIELDS
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Plain dict rows of the listed columns (see _LIST_VALUES), skipping model
+        instantiation; images and variants are read from denormalized fields.
+        has_ai_description is computed in SQL so export_description is not sent.
+        """
+        return queryset.values(
+            *_LIST_VALUES,
+            has_ai_description=Case(
+                When(export_description__regex=r"\S", then=Value(True)),
+                default=Value(False),
+                output_field=BooleanField(),
+            ),
         )
 
-    def get_primary_image(self, obj):
-        """Get the primary image URL (from uploaded file or external URL)"""
-        primary = obj.images.filter(is_primary=True).first()
-        if primary:
-            return primary.url  # Uses the model's url property
-        first = obj.images.first()
-        return first.url if first else None
-
-    def get_variant_type_count(self, obj):
-        """Get count of variant types"""
-        return obj.variant_types.count()
-
-    def get_has_ai_description(self, obj):
-        """Check if catalog has AI-generated description"""
-        return bool(obj.export_description and obj.export_description.strip())
+    def to_representation(self, instance):
+        """
+        Fast path for the dict rows from setup_eager_loading: direct key reads
+        instead of DRF's generic per-field loop, which dominates large list
+        pages. Decimal and datetime values still go through their bound fields
+        for identical output. Model instances take the generic path.
+        """
+        if not isinstance(instance, dict):
+            return super().to_representation(instance)
+
+        row = instance
+        fields = self.fields
+
+        def represent(name, value):
+            return None if value is None else fields[name].to_representation(value)
+
+        return {
+            "id": row["id"],
+            "product": row["product_id"],
+            "product_name": row["product__name_local"],
+            "is_published": row["is_published"],
+            "display_name": row["display_name"],
+            "min_order_quantity": represent("min_order_quantity", row["min_order_quantity"]),
+            "unit_type": row["unit_type"],
+            "base_price_exw": represent("base_price_exw", row["base_price_exw"]),
+            "base_price_fob": represent("base_price_fob", row["base_price_fob"]),
+            "lead_time_days": row["lead_time_days"],
+            "available_stock": row["available_stock"],
+            "tags": row["tags"],
+            # Same as the ProductCatalog properties, computed from the row
+            "primary_image": row["primary_image_url"] or None,
+            "variant_type_count": len(row["variant_matrix"]),
+            "has_ai_description": row["has_ai_description"],
+            "updated_at": represent("updated_at", row["updated_at"]),
+        }
 
 
 class VariantOptionInputSerializer(serializers.Serializer):
     """Serializer for variant option input when creating catalog"""
     option_name = serializers.CharField(max_length=100)
-    sort_order = serializers.IntegerField(default=0, required=False)
+    sort_order = serializers.IntegerField(default=0, required=False, min_value=0, max_value=32767)
     is_available = serializers.BooleanField(default=True, required=False)
 
 
+@extend_schema_field({"type": "string", "enum": [code for code, _ in CatalogVariantType.VARIANT_TYPE_CHOICES]})
+class VariantTypeCodeField(serializers.CharField):
+    """
+    Variant type code checked against a module-level frozenset.
+
+    Unlike ChoiceField it builds no choices dicts when the field is constructed
+    or deep-copied for each serializer instance.
+    """
+
+    default_error_messages = {"invalid_choice": '"{input}" is not a valid choice.'}
+
+    def to_internal_value(self, data):
+        value = super().to_internal_value(data)
+        if value not in _VARIANT_TYPE_CODES:
+            self.fail("invalid_choice", input=data)
+        return value
+
+
 class VariantTypeInputSerializer(serializers.Serializer):
     """Serializer for variant type input when creating catalog"""
-    type_code = serializers.ChoiceField(
-        choices=CatalogVariantType.VARIANT_TYPE_CHOICES,
-        default="custom"
-    )
+    type_code = VariantTypeCodeField(default="custom")
     type_name = serializers.CharField(max_length=100)
-    sort_order = serializers.IntegerField(default=0, required=False)
+    sort_order = serializers.IntegerField(default=0, required=False, min_value=0, max_value=32767)
     options = VariantOptionInputSerializer(many=True, required=False)
 
 
+class ProductCatalogBulkCreateSerializer(serializers.ListSerializer):
+    """
+    Creates many catalogs at once (ProductCatalogCreateSerializer with many=True).
+    Every product must belong to the requesting user and not have a catalog yet.
+    """
+
+    def validate(self, attrs):
+        product_ids = [item["product_id"] for item in attrs]
+        if len(set(product_ids)) != len(product_ids):
+            raise serializers.ValidationError("Each product can only appear once.")
+
+        available = set(
+            Product.objects.filter(
+                id__in=product_ids,
+                business__user=self.context["request"].user,
+                catalog__isnull=True,
+            ).values_list("id", flat=True)
+        )
+        unavailable = [product_id for product_id in product_ids if product_id not in available]
+        if unavailable:
+            raise serializers.ValidationError(
+                f"Products not found, not owned by you or already cataloged: {unavailable}"
+            )
+        return attrs
+
+    def create(self, validated_data):
+        return load_catalogs(validated_data)
+
+
 class ProductCatalogCreateSerializer(serializers.ModelSerializer):
     """
     Serializer for creating a new catalog entry.
@@ -205,53 +357,23 @@ class ProductCatalogCreateSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = ProductCatalog
-        fields = (
-            "product_id",
-            "is_published",
-            "display_name",
-            "marketing_description",
-            "export_description",
-            "technical_specs",
-            "safety_info",
-            "min_order_quantity",
-            "unit_type",
-            "base_price_exw",
-            "base_price_fob",
-            "base_price_cif",
-            "lead_time_days",
-            "available_stock",
-            "tags",
-            "images",
-            "variant_types",
-        )
+        fields = _CREATE_FIELDS
+        list_serializer_class = ProductCatalogBulkCreateSerializer
 
     def create(self, validated_data):
         images_data = validated_data.pop("images", [])
         variant_types_data = validated_data.pop("variant_types", [])
         product_id = validated_data.pop("product_id")
 
-        # Create catalog
-        catalog = ProductCatalog.objects.create(
-            product_id=product_id,
-            **validated_data
-        )
-
-        # Create images
-        for image_data in images_data:
-            ProductCatalogImage.objects.create(catalog=catalog, **image_data)
-
-        # Create variant types and options
-        for vt_data in variant_types_data:
-            options_data = vt_data.pop("options", [])
-            variant_type = CatalogVariantType.objects.create(
-                catalog=catalog,
-                **vt_data
+        # Catalog and its nested rows land together or not at all
+        with transaction.atomic():
+            catalog = ProductCatalog.objects.create(
+                product_id=product_id,
+                **validated_data
             )
-            for opt_data in options_data:
-                CatalogVariantOption.objects.create(
-                    variant_type=variant_type,
-                    **opt_data
-                )
+
+            ProductCatalogImage.bulk_replace(catalog, images_data)
+            CatalogVariantType.bulk_replace(catalog, variant_types_data)
 
         return catalog
 
@@ -264,38 +386,15 @@ class ProductCatalogUpdateSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = ProductCatalog
-        fields = (
-            "is_published",
-            "display_name",
-            "marketing_description",
-            "export_description",
-            "technical_specs",
-            "safety_info",
-            "min_order_quantity",
-            "unit_type",
-            "base_price_exw",
-            "base_price_fob",
-            "base_price_cif",
-            "lead_time_days",
-            "available_stock",
-            "tags",
-        )
-        extra_kwargs = {
-            "is_published": {"required": False},
-            "display_name": {"required": False},
-            "marketing_description": {"required": False},
-            "export_description": {"required": False},
-            "technical_specs": {"required": False},
-            "safety_info": {"required": False},
-            "min_order_quantity": {"required": False},
-            "unit_type": {"required": False},
-            "base_price_exw": {"required": False},
-            "base_price_fob": {"required": False},
-            "base_price_cif": {"required": False},
-            "lead_time_days": {"required": False},
-            "available_stock": {"required": False},
-            "tags": {"required": False},
-        }
+        fields = _UPDATE_FIELDS
+        extra_kwargs = {field: {"required": False} for field in _UPDATE_FIELDS}
+
+    def update(self, instance, validated_data):
+        """Update catalog fields, writing only the columns that changed."""
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=[*validated_data, "updated_at"])
+        return instance
 
 
 class CatalogImageCreateSerializer(serializers.ModelSerializer):
@@ -360,17 +459,19 @@ class CatalogVariantTypeCreateSerializer(serializers.ModelSerializer):
         catalog_id = validated_data.pop("catalog_id")
         options_data = validated_data.pop("options", [])
 
-        variant_type = CatalogVariantType.objects.create(
-            catalog_id=catalog_id,
-            **validated_data
-        )
-
-        for opt_data in options_data:
-            CatalogVariantOption.objects.create(
-                variant_type=variant_type,
-                **opt_data
+        with transaction.atomic():
+            variant_type = CatalogVariantType.objects.create(
+                catalog_id=catalog_id,
+                **validated_data
             )
 
+            if options_data:
+                # One bulk insert instead of a save() (and matrix rebuild) per option
+                load_variants(
+                    [CatalogVariantOption(variant_type=variant_type, **opt_data) for opt_data in options_data]
+                )
+                CatalogVariantType.sync_catalog(catalog_id)
+
         return variant_type
 
 
@@ -411,23 +512,13 @@ class PublicCatalogSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = ProductCatalog
-        fields = (
-            "id",
-            "display_name",
-            "marketing_description",
-            "export_description",
-            "technical_specs",
-            "safety_info",
-            "min_order_quantity",
-            "unit_type",
-            "base_price_exw",
-            "base_price_fob",
-            "base_price_cif",
-            "lead_time_days",
-            "available_stock",
-            "tags",
-            "seller_name",
-            "images",
-            "variant_types",
-            "published_at",
+        fields = _PUBLIC_FIELDS
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join/prefetch seller, images and available variant options."""
+        return (
+            queryset.with_display(available_only=True)
+            .select_related("product__business")
+            .only_related("product__business__company_name")
         )
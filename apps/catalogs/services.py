@@ -18,20 +18,52 @@ Implements:
    - Upload images to Supabase Storage
 """
 
+import hashlib
 import json
 import logging
-import re
 import uuid
+from collections.abc import Mapping
 from decimal import Decimal
 from pathlib import Path
 from typing import Dict, Optional
 
 from django.conf import settings
+from django.core.cache import cache
 from django.core.files.storage import default_storage
 from openai import OpenAI
 
+from core.services.ai_service import extract_json_object
+from core.services.http import get_kolosal_http_client
+
 logger = logging.getLogger(__name__)
 
+AI_RESPONSE_CACHE_TIMEOUT = 3600  # seconds
+# Higher temperatures are sampled on purpose, so their answers are not reused
+AI_RESPONSE_CACHE_MAX_TEMPERATURE = 0.2
+
+
+def regenerate_requested(data) -> bool:
+    """True when a request body asks for a fresh AI answer ("regenerate": true/"1")."""
+    if not isinstance(data, Mapping):
+        return False
+    return str(data.get("regenerate", "")).lower() in ("1", "true")
+
+
+# Estimated CIF/FOB multiplier per destination region
+_SHIPPING_REGIONS = (
+    (1.12, ("SG", "MY", "TH", "VN", "PH", "BN", "MM", "LA", "KH")),  # Southeast Asia
+    (1.18, ("JP", "KR", "CN", "TW", "HK")),  # East Asia
+    (1.15, ("IN", "BD", "PK", "LK", "NP")),  # South Asia
+    (1.22, ("AE", "SA", "QA", "KW", "BH", "OM", "EG", "TR")),  # Middle East
+    (1.28, ("DE", "NL", "FR", "GB", "IT", "ES", "BE", "PL", "AT", "SE")),  # Europe
+    (1.30, ("US", "CA", "MX")),  # North America
+    (1.20, ("AU", "NZ")),  # Australia/Oceania
+    (1.35, ("ZA", "NG", "KE", "GH", "TZ")),  # Africa
+    (1.38, ("BR", "AR", "CL", "CO", "PE")),  # South America
+)
+SHIPPING_MULTIPLIERS = {code: multiplier for multiplier, codes in _SHIPPING_REGIONS for code in codes}
+DEFAULT_SHIPPING_MULTIPLIER = 1.25
+
 
 class CatalogAIService:
     """
@@ -47,13 +79,16 @@ class CatalogAIService:
         self.client = OpenAI(
             api_key=api_key.strip(),
             base_url=settings.KOLOSAL_BASE_URL,
+            http_client=get_kolosal_http_client(),
         )
         # Use model name directly from settings (same as other services)
         # Don't use model mapping - use the name as-is from settings
         self.model = settings.KOLOSAL_MODEL
         logger.info(f"CatalogAIService initialized - Model: {self.model}")
 
-    def _call_ai(self, prompt: str, system_prompt: str = None, temperature: float = 0.1) -> str:
+    def _call_ai(
+        self, prompt: str, system_prompt: str = None, temperature: float = 0.1, cache_bypass: bool = False
+    ) -> str:
         """
         Make a call to Kolosal AI API.
         
@@ -64,10 +99,23 @@ class CatalogAIService:
             prompt: The user prompt
             system_prompt: Optional system prompt for context
             temperature: Temperature for AI response (default 0.1 for consistency)
+            cache_bypass: Skip the cached answer for an identical prompt (it is still refreshed)
             
         Returns:
             The AI response text
         """
+        cache_key = None
+        if temperature <= AI_RESPONSE_CACHE_MAX_TEMPERATURE:
+            digest = hashlib.blake2b(
+                f"{self.model}|{temperature}|{system_prompt or ''}|{prompt}".encode(), digest_size=16
+            ).hexdigest()
+            cache_key = f"catalog_ai:{digest}"
+            if not cache_bypass:
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    logger.debug("AI response served from cache")
+                    return cached
+
         messages = []
         
         if system_prompt:
@@ -90,6 +138,8 @@ class CatalogAIService:
             )
             result = response.choices[0].message.content.strip()
             logger.debug(f"AI API response received: {result[:100]}...")
+            if cache_key:
+                cache.set(cache_key, result, AI_RESPONSE_CACHE_TIMEOUT)
             return result
         except Exception as e:
             logger.error(f"Kolosal AI API error: {e}")
@@ -112,6 +162,7 @@ class CatalogAIService:
         weight_gross: float = None,
         category: str = "",
         is_food_product: bool = False,
+        cache_bypass: bool = False,
     ) -> Dict:
         """
         AI 1: Generate International Product Description
@@ -182,16 +233,13 @@ Berikan output dalam format JSON yang valid."""
 
         try:
             logger.info(f"Calling AI for product: {product_name}")
-            response = self._call_ai(prompt, system_prompt)
+            response = self._call_ai(prompt, system_prompt, cache_bypass=cache_bypass)
             logger.info(f"AI response received, length: {len(response) if response else 0}")
             logger.debug(f"AI raw response: {response[:500] if response else 'None'}...")
 
             # Extract JSON from response
-            json_match = re.search(r'\{[\s\S]*\}', response)
-            if json_match:
-                json_str = json_match.group()
-                logger.debug(f"JSON extracted, length: {len(json_str)}")
-                result = json.loads(json_str)
+            result = extract_json_object(response)
+            if result is not None:
                 logger.info(f"JSON parsed successfully, keys: {list(result.keys())}")
                 return {
                     "success": True,
@@ -232,6 +280,7 @@ Berikan output dalam format JSON yang valid."""
         category: str = "",
         current_price_usd: float = None,
         production_capacity: int = None,
+        cache_bypass: bool = False,
     ) -> Dict:
         """
         AI 2: Market Intelligence
@@ -289,12 +338,11 @@ ATURAN:
 
         try:
             # Use same temperature as successful KolosalAIService (0.1)
-            response = self._call_ai(prompt, system_prompt, temperature=0.1)
+            response = self._call_ai(prompt, system_prompt, temperature=0.1, cache_bypass=cache_bypass)
 
             # Extract JSON from response
-            json_match = re.search(r'\{[\s\S]*\}', response)
-            if json_match:
-                result = json.loads(json_match.group())
+            result = extract_json_object(response)
+            if result is not None:
                 return {
                     "success": True,
                     "data": result
@@ -328,6 +376,7 @@ ATURAN:
         target_country_code: str = None,
         dimensions: dict = None,
         weight_gross: float = None,
+        cache_bypass: bool = False,
     ) -> Dict:
         """
         AI 3: Catalog Pricing
@@ -357,7 +406,7 @@ ATURAN:
         exchange_rate = 16000.0  # Default fallback
         if price_service:
             try:
-                rate = price_service.get_exchange_rate()
+                rate = price_service.get_cached_exchange_rate()
                 exchange_rate = float(rate) if rate else 16000.0
             except:
                 pass
@@ -399,7 +448,7 @@ Format: paragraf singkat 3-4 kalimat."""
 
         pricing_insight = ""
         try:
-            pricing_insight = self._call_ai(prompt, system_prompt)
+            pricing_insight = self._call_ai(prompt, system_prompt, cache_bypass=cache_bypass)
         except Exception as e:
             logger.warning(f"Could not get pricing insight: {e}")
             pricing_insight = "Unable to generate pricing insight at this time."
@@ -427,36 +476,7 @@ Format: paragraf singkat 3-4 kalimat."""
 
     def _get_shipping_multiplier(self, country_code: str) -> float:
         """Get estimated shipping multiplier based on destination region."""
-        # Southeast Asia
-        if country_code in ["SG", "MY", "TH", "VN", "PH", "BN", "MM", "LA", "KH"]:
-            return 1.12
-        # East Asia
-        elif country_code in ["JP", "KR", "CN", "TW", "HK"]:
-            return 1.18
-        # South Asia
-        elif country_code in ["IN", "BD", "PK", "LK", "NP"]:
-            return 1.15
-        # Middle East
-        elif country_code in ["AE", "SA", "QA", "KW", "BH", "OM", "EG", "TR"]:
-            return 1.22
-        # Europe
-        elif country_code in ["DE", "NL", "FR", "GB", "IT", "ES", "BE", "PL", "AT", "SE"]:
-            return 1.28
-        # North America
-        elif country_code in ["US", "CA", "MX"]:
-            return 1.30
-        # Australia/Oceania
-        elif country_code in ["AU", "NZ"]:
-            return 1.20
-        # Africa
-        elif country_code in ["ZA", "NG", "KE", "GH", "TZ"]:
-            return 1.35
-        # South America
-        elif country_code in ["BR", "AR", "CL", "CO", "PE"]:
-            return 1.38
-        # Default
-        else:
-            return 1.25
+        return SHIPPING_MULTIPLIERS.get(country_code, DEFAULT_SHIPPING_MULTIPLIER)
 
 
 # Singleton instance
@@ -523,9 +543,6 @@ class CatalogStorageService:
 
         if self.client:
             try:
-                file.seek(0)
-                file_content = file.read()
-
                 # Determine content type
                 content_type = getattr(file, 'content_type', None)
                 if not content_type:
@@ -536,14 +553,10 @@ class CatalogStorageService:
                     "upsert": "true"
                 }
 
-                logger.info(f"Uploading catalog image to Supabase: {storage_path} ({len(file_content)} bytes)")
+                logger.info(f"Uploading catalog image to Supabase: {storage_path} ({file.size} bytes)")
 
                 # Upload to Supabase
-                response = self.client.storage.from_(self.bucket_name).upload(
-                    path=storage_path,
-                    file=file_content,
-                    file_options=file_options
-                )
+                response = self._upload_to_bucket(file, storage_path, file_options)
 
                 # Check for errors in response
                 if isinstance(response, dict) and "error" in response:
@@ -566,6 +579,22 @@ class CatalogStorageService:
             logger.warning("Supabase not available. Image should be stored locally via ImageField.")
             return None
 
+    def _upload_to_bucket(self, file, storage_path: str, file_options: dict):
+        """
+        Send the upload to the Supabase bucket.
+
+        Uploads Django spooled to disk (above FILE_UPLOAD_MAX_MEMORY_SIZE) are
+        streamed from their temporary file in chunks; smaller ones are already
+        in memory and are sent as bytes.
+        """
+        bucket = self.client.storage.from_(self.bucket_name)
+        if hasattr(file, "temporary_file_path"):
+            with open(file.temporary_file_path(), "rb") as stream:
+                return bucket.upload(path=storage_path, file=stream, file_options=file_options)
+
+        file.seek(0)
+        return bucket.upload(path=storage_path, file=file.read(), file_options=file_options)
+
     def _upload_local(self, file, storage_path: str) -> str:
         """
         Fallback to local filesystem storage.
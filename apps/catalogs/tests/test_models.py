@@ -0,0 +1,217 @@
+"""
+Tests for Product Catalog Models
+"""
+
+from decimal import Decimal
+
+import pytest
+from django.db import IntegrityError
+from django.db.models import IntegerField
+from django.db.models.functions import Cast
+
+from apps.catalogs.models import CatalogVariantOption, CatalogVariantType, ProductCatalog, ProductCatalogImage
+from apps.catalogs.serializers import ProductCatalogListSerializer
+from apps.products.tests.factories import ProductFactory
+
+
+@pytest.mark.django_db
+class TestProductCatalogImagePrimary:
+    """Only one primary image per catalog"""
+
+    def setup_method(self):
+        self.catalog = ProductCatalog.objects.create(
+            product=ProductFactory(), display_name="Teak Chair", base_price_exw=Decimal("20.00")
+        )
+
+    def test_new_primary_demotes_previous(self):
+        first = ProductCatalogImage.objects.create(
+            catalog=self.catalog, image_url="https://example.com/1.jpg", is_primary=True
+        )
+        second = ProductCatalogImage.objects.create(
+            catalog=self.catalog, image_url="https://example.com/2.jpg", sort_order=1, is_primary=True
+        )
+
+        first.refresh_from_db()
+        assert first.is_primary is False
+        assert list(self.catalog.images.filter(is_primary=True)) == [second]
+
+    def test_primary_image_url_follows_primary_and_deletes(self):
+        first = ProductCatalogImage.objects.create(catalog=self.catalog, image_url="https://example.com/1.jpg")
+        second = ProductCatalogImage.objects.create(
+            catalog=self.catalog, image_url="https://example.com/2.jpg", sort_order=1, is_primary=True
+        )
+        self.catalog.refresh_from_db()
+        assert self.catalog.primary_image_url == "https://example.com/2.jpg"
+
+        second.delete()
+        self.catalog.refresh_from_db()
+        assert self.catalog.primary_image_url == first.image_url
+
+        first.delete()
+        self.catalog.refresh_from_db()
+        assert self.catalog.primary_image_url == ""
+
+    def test_constraint_rejects_bulk_duplicates(self):
+        ProductCatalogImage.objects.create(catalog=self.catalog, image_url="https://example.com/1.jpg", is_primary=True)
+
+        with pytest.raises(IntegrityError):
+            ProductCatalogImage.objects.bulk_create(
+                [ProductCatalogImage(catalog=self.catalog, image_url="https://example.com/2.jpg", is_primary=True)]
+            )
+
+
+@pytest.mark.django_db
+class TestProductCatalogPublish:
+    """Publishing with update_fields still stamps published_at"""
+
+    def test_publish_with_update_fields_sets_published_at(self):
+        catalog = ProductCatalog.objects.create(
+            product=ProductFactory(), display_name="Teak Chair", base_price_exw=Decimal("20.00")
+        )
+        # Concurrent change the stale instance does not know about
+        ProductCatalog.objects.filter(id=catalog.id).update(display_name="Rattan Chair")
+
+        catalog.is_published = True
+        catalog.save(update_fields=["is_published", "updated_at"])
+
+        catalog.refresh_from_db()
+        assert catalog.is_published is True
+        assert catalog.published_at is not None
+        assert catalog.display_name == "Rattan Chair"
+
+
+@pytest.mark.django_db
+class TestBulkReplace:
+    """Images and variant types are replaced with bulk inserts"""
+
+    def setup_method(self):
+        self.catalog = ProductCatalog.objects.create(
+            product=ProductFactory(), display_name="Teak Chair", base_price_exw=Decimal("20.00")
+        )
+
+    def test_images_replace_existing_and_keep_last_primary(self):
+        ProductCatalogImage.objects.create(catalog=self.catalog, image_url="https://example.com/old.jpg")
+
+        ProductCatalogImage.bulk_replace(
+            self.catalog,
+            [
+                {"image_url": "https://example.com/1.jpg", "is_primary": True},
+                {"image_url": "https://example.com/2.jpg", "sort_order": 1, "is_primary": True},
+            ],
+        )
+
+        images = list(self.catalog.images.all())
+        assert [image.image_url for image in images] == ["https://example.com/1.jpg", "https://example.com/2.jpg"]
+        assert [image.is_primary for image in images] == [False, True]
+        self.catalog.refresh_from_db()
+        assert self.catalog.primary_image_url == "https://example.com/2.jpg"
+
+    def test_images_appended_with_one_insert(self, django_assert_num_queries):
+        ProductCatalogImage.objects.create(catalog=self.catalog, image_url="https://example.com/old.jpg")
+        images = [
+            ProductCatalogImage(image_url=f"https://example.com/{idx}.jpg", sort_order=idx + 1) for idx in range(3)
+        ]
+
+        # insert, thumbnail pick, catalog touch
+        with django_assert_num_queries(3):
+            ProductCatalogImage.bulk_add(self.catalog, images)
+
+        assert self.catalog.images.count() == 4
+        self.catalog.refresh_from_db()
+        assert self.catalog.primary_image_url == "https://example.com/old.jpg"
+
+    def test_variant_types_created_with_options(self, django_assert_max_num_queries):
+        items = [
+            {
+                "type_code": "color",
+                "type_name": "Warna",
+                "options": [{"option_name": "Merah"}, {"option_name": "Biru"}],
+            },
+            {"type_code": "size", "type_name": "Ukuran", "sort_order": 1, "options": [{"option_name": "S"}]},
+        ]
+
+        with django_assert_max_num_queries(7):
+            CatalogVariantType.bulk_replace(self.catalog, items)
+
+        assert list(self.catalog.variant_types.values_list("type_name", flat=True)) == ["Warna", "Ukuran"]
+        assert CatalogVariantOption.objects.filter(variant_type__catalog=self.catalog).count() == 3
+        assert items[0]["options"][0] == {"option_name": "Merah"}
+        self.catalog.refresh_from_db()
+        assert self.catalog.variant_matrix == {"Warna": ["Merah", "Biru"], "Ukuran": ["S"]}
+
+    def test_variant_type_save_bumps_catalog(self):
+        before = self.catalog.updated_at
+
+        CatalogVariantType.objects.create(catalog=self.catalog, type_name="Warna")
+
+        self.catalog.refresh_from_db()
+        assert self.catalog.updated_at > before
+
+
+@pytest.mark.django_db
+class TestProductCatalogForListing:
+    """List querysets leave the wide columns unread"""
+
+    def test_large_columns_deferred(self):
+        ProductCatalog.objects.create(
+            product=ProductFactory(),
+            display_name="Teak Chair",
+            base_price_exw=Decimal("20.00"),
+            technical_specs={"material": "teak"},
+        )
+
+        catalog = ProductCatalog.objects.for_listing().get()
+
+        assert {"technical_specs", "safety_info", "marketing_description"} <= catalog.get_deferred_fields()
+        assert catalog.product.name_local
+
+
+@pytest.mark.django_db
+class TestVariantMatrix:
+    """variant_matrix mirrors the available variant options"""
+
+    def test_matrix_follows_option_changes(self):
+        catalog = ProductCatalog.objects.create(
+            product=ProductFactory(), display_name="Teak Chair", base_price_exw=Decimal("20.00")
+        )
+        variant_type = CatalogVariantType.objects.create(catalog=catalog, type_name="Warna")
+        red = CatalogVariantOption.objects.create(variant_type=variant_type, option_name="Merah")
+        CatalogVariantOption.objects.create(variant_type=variant_type, option_name="Biru", sort_order=1)
+        CatalogVariantType.objects.create(catalog=catalog, type_name="Ukuran", sort_order=1)
+
+        red.is_available = False
+        red.save()
+
+        catalog.refresh_from_db()
+        assert catalog.variant_matrix == {"Warna": ["Biru"], "Ukuran": []}
+
+        variant_type.delete()
+        catalog.refresh_from_db()
+        assert catalog.variant_matrix == {"Ukuran": []}
+
+
+@pytest.mark.django_db
+class TestMoneyCentsField:
+    """Prices are stored as integer cents and read back as Decimals"""
+
+    def test_round_trip_and_lookups(self):
+        catalog = ProductCatalog.objects.create(
+            product=ProductFactory(), display_name="Teak Chair", base_price_exw=Decimal("20.55"), base_price_fob="21.1"
+        )
+
+        stored = ProductCatalog.objects.filter(pk=catalog.pk)
+        assert stored.values_list("base_price_exw", flat=True).get() == Decimal("20.55")
+        assert stored.values_list(Cast("base_price_fob", IntegerField()), flat=True).get() == 2110
+        assert ProductCatalog.objects.filter(base_price_exw__gte="20.55").exists()
+        assert not ProductCatalog.objects.filter(base_price_exw__gt=Decimal("20.55")).exists()
+
+    def test_serializer_keeps_decimal_representation(self):
+        catalog = ProductCatalog.objects.create(
+            product=ProductFactory(), display_name="Teak Chair", base_price_exw=Decimal("20.50")
+        )
+        catalog.refresh_from_db()
+
+        data = ProductCatalogListSerializer(catalog).data
+
+        assert data["base_price_exw"] == "20.50"
+        assert data["base_price_fob"] is None
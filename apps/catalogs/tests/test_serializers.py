@@ -0,0 +1,96 @@
+"""
+Tests for Product Catalog Serializers
+"""
+
+from decimal import Decimal
+
+import pytest
+from rest_framework import serializers
+from rest_framework.test import APIRequestFactory
+
+from apps.catalogs.models import CatalogVariantType, ProductCatalog, ProductCatalogImage
+from apps.catalogs.serializers import (
+    CatalogImageSerializer,
+    ProductCatalogListSerializer,
+    ProductCatalogSerializer,
+    VariantTypeInputSerializer,
+)
+from apps.products.tests.factories import ProductFactory
+
+
+@pytest.mark.django_db
+class TestProductCatalogListSerializer:
+    """The values() row representation matches DRF's generic one for the model"""
+
+    def test_matches_generic_representation(self):
+        catalog = ProductCatalog.objects.create(
+            product=ProductFactory(),
+            display_name="Teak Chair",
+            min_order_quantity=Decimal("10.50"),
+            base_price_exw=Decimal("20.00"),
+            tags=["teak", "chair"],
+            export_description="  ",
+            is_published=True,
+        )
+        ProductCatalogImage.objects.create(catalog=catalog, image_url="https://example.com/1.jpg")
+        CatalogVariantType.objects.create(catalog=catalog, type_name="Warna")
+        ProductCatalog.objects.create(
+            product=ProductFactory(),
+            display_name="Teak Table",
+            base_price_exw=Decimal("40.00"),
+            base_price_fob=Decimal("45.25"),
+            export_description="Solid teak table",
+        )
+
+        rows = ProductCatalogListSerializer.setup_eager_loading(ProductCatalog.objects.all())
+        catalogs = ProductCatalog.objects.select_related("product")
+        assert len(rows) == 2
+        assert [row["has_ai_description"] for row in rows] == [True, False]
+        for row, catalog in zip(rows, catalogs):
+            serializer = ProductCatalogListSerializer()
+            assert serializer.to_representation(row) == serializers.ModelSerializer.to_representation(
+                serializer, catalog
+            )
+
+
+class TestVariantTypeInputSerializer:
+    """type_code accepts only the predefined variant type codes"""
+
+    def test_valid_code_and_default(self):
+        serializer = VariantTypeInputSerializer(
+            data=[{"type_code": "size", "type_name": "Ukuran"}, {"type_name": "Motif"}], many=True
+        )
+
+        assert serializer.is_valid(), serializer.errors
+        assert [item["type_code"] for item in serializer.validated_data] == ["size", "custom"]
+
+    def test_unknown_code_rejected(self):
+        serializer = VariantTypeInputSerializer(data={"type_code": "texture", "type_name": "Tekstur"})
+
+        assert not serializer.is_valid()
+        assert serializer.errors["type_code"] == ['"texture" is not a valid choice.']
+
+
+@pytest.mark.django_db
+class TestCatalogImageSerializer:
+    """Cached image fields stay bound to each serializer's own request"""
+
+    def test_base_uri_per_request(self, settings):
+        settings.ALLOWED_HOSTS = ["a.example.com", "b.example.com"]
+        catalog = ProductCatalog.objects.create(
+            product=ProductFactory(), display_name="Teak Chair", base_price_exw=Decimal("20.00")
+        )
+        image = ProductCatalogImage.objects.create(catalog=catalog, image="catalogs/upload.jpg")
+        factory = APIRequestFactory()
+
+        urls = [
+            CatalogImageSerializer(image, context={"request": factory.get("/", HTTP_HOST=host)}).data["url"]
+            for host in ("a.example.com", "b.example.com")
+        ]
+        nested = ProductCatalogSerializer(catalog).data["images"][0]["url"]
+
+        assert urls == [
+            "http://a.example.com/media/catalogs/upload.jpg",
+            "http://b.example.com/media/catalogs/upload.jpg",
+        ]
+        assert nested == "/media/catalogs/upload.jpg"
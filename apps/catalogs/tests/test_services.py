@@ -0,0 +1,127 @@
+"""
+Tests for Product Catalog Services
+"""
+
+import io
+import json
+from types import SimpleNamespace
+
+import pytest
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile, TemporaryUploadedFile
+
+from apps.catalogs.services import (
+    DEFAULT_SHIPPING_MULTIPLIER,
+    SHIPPING_MULTIPLIERS,
+    _SHIPPING_REGIONS,
+    CatalogAIService,
+    CatalogStorageService,
+)
+from core.services.ai_service import extract_json_object
+
+
+class TestExtractJsonObject:
+    """JSON objects are picked out of free-form AI responses"""
+
+    def test_object_inside_prose(self):
+        response = 'Berikut hasilnya: {"a": {"b": "} {"}, "c": [1, 2]} Semoga membantu {ok}'
+
+        assert extract_json_object(response) == {"a": {"b": "} {"}, "c": [1, 2]}
+
+    def test_skips_braces_before_object(self):
+        assert extract_json_object('Format {nama}: {"nama": "Kursi"}') == {"nama": "Kursi"}
+
+    def test_no_object(self):
+        assert extract_json_object("Tidak ada data") is None
+
+    def test_invalid_object_raises(self):
+        with pytest.raises(json.JSONDecodeError):
+            extract_json_object('{"a": 1,}')
+
+    def test_malformed_outer_object_not_replaced_by_nested(self):
+        with pytest.raises(json.JSONDecodeError):
+            extract_json_object('{"description": "x", "dims": {"l": 1}, }')
+
+
+class TestShippingMultipliers:
+    """Region table flattens to one multiplier per country"""
+
+    def test_each_country_in_one_region(self):
+        codes = [code for _, region in _SHIPPING_REGIONS for code in region]
+
+        assert len(codes) == len(SHIPPING_MULTIPLIERS)
+        assert SHIPPING_MULTIPLIERS["SG"] == 1.12
+        assert SHIPPING_MULTIPLIERS["US"] == 1.30
+        assert SHIPPING_MULTIPLIERS.get("IS", DEFAULT_SHIPPING_MULTIPLIER) == 1.25
+
+
+class TestCatalogAIServiceCache:
+    """Identical low-temperature prompts reuse the previous AI answer"""
+
+    @pytest.fixture
+    def service(self, settings, monkeypatch):
+        settings.KOLOSAL_API_KEY = "test-key"
+        cache.clear()
+        service = CatalogAIService()
+        service.calls = []
+
+        def create(**kwargs):
+            service.calls.append(kwargs)
+            content = f"answer {len(service.calls)}"
+            return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+        monkeypatch.setattr(service.client.chat.completions, "create", create)
+        return service
+
+    def test_identical_prompt_cached(self, service):
+        first = service._call_ai("Deskripsi kursi jati", "system")
+        second = service._call_ai("Deskripsi kursi jati", "system")
+        other = service._call_ai("Deskripsi meja jati", "system")
+
+        assert first == second == "answer 1"
+        assert other == "answer 2"
+        assert len(service.calls) == 2
+
+    def test_bypass_and_high_temperature_call_api(self, service):
+        service._call_ai("Deskripsi kursi jati")
+        refreshed = service._call_ai("Deskripsi kursi jati", cache_bypass=True)
+        service._call_ai("Ide nama produk", temperature=0.9)
+        service._call_ai("Ide nama produk", temperature=0.9)
+
+        assert refreshed == "answer 2"
+        assert service._call_ai("Deskripsi kursi jati") == "answer 2"
+        assert len(service.calls) == 4
+
+
+class TestCatalogStorageServiceUpload:
+    """Spooled uploads are streamed from disk, in-memory ones sent as bytes"""
+
+    @pytest.fixture
+    def service(self, settings):
+        settings.SUPABASE_URL = ""
+        service = CatalogStorageService()
+        service.uploads = []
+
+        def upload(path, file, file_options):
+            service.uploads.append(file if isinstance(file, bytes) else type(file))
+            return {"Key": path}
+
+        bucket = SimpleNamespace(upload=upload, get_public_url=lambda path: f"https://cdn.example.com/{path}")
+        service.client = SimpleNamespace(storage=SimpleNamespace(from_=lambda name: bucket))
+        return service
+
+    def test_temporary_file_streamed(self, service):
+        upload = TemporaryUploadedFile("chair.jpg", "image/jpeg", 4, None)
+        upload.write(b"jpeg")
+        upload.flush()
+
+        url = service.upload_image(upload, 7)
+        upload.close()
+
+        assert url.startswith("https://cdn.example.com/catalogs/7/")
+        assert service.uploads == [io.BufferedReader]
+
+    def test_in_memory_file_sent_as_bytes(self, service):
+        service.upload_image(SimpleUploadedFile("chair.jpg", b"jpeg", content_type="image/jpeg"), 7)
+
+        assert service.uploads == [b"jpeg"]
@@ -0,0 +1,428 @@
+"""
+Tests for Product Catalog Views
+"""
+
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.business_profiles.models import BusinessProfile
+from apps.catalogs.services import CatalogAIService
+from apps.catalogs.models import CatalogVariantOption, CatalogVariantType, ProductCatalog, ProductCatalogImage
+from apps.products.tests.factories import ProductEnrichmentFactory, ProductFactory, UserFactory
+from apps.users.models import UserRole
+
+
+def _create_catalog(product, idx):
+    catalog = ProductCatalog.objects.create(
+        product=product,
+        display_name=f"Teak Chair {idx}",
+        base_price_exw=Decimal("20.00"),
+        is_published=True,
+    )
+    ProductCatalogImage.objects.create(catalog=catalog, image_url=f"https://example.com/{idx}-1.jpg")
+    ProductCatalogImage.objects.create(
+        catalog=catalog, image_url=f"https://example.com/{idx}-2.jpg", sort_order=1, is_primary=True
+    )
+    for type_idx, type_name in enumerate(["Warna", "Ukuran"]):
+        variant_type = CatalogVariantType.objects.create(catalog=catalog, type_name=type_name, sort_order=type_idx)
+        CatalogVariantOption.objects.create(variant_type=variant_type, option_name="A")
+        CatalogVariantOption.objects.create(variant_type=variant_type, option_name="B", sort_order=1)
+    return catalog
+
+
+@pytest.mark.django_db
+class TestCatalogListQueries:
+    """Catalog list endpoints run a constant number of queries"""
+
+    def setup_method(self):
+        self.client = APIClient()
+        cache.clear()
+
+    def test_owner_list_query_count_independent_of_catalog_count(self, django_assert_num_queries):
+        first = ProductFactory()
+        business = first.business
+        for idx in range(4):
+            product = first if idx == 0 else ProductFactory(business=business)
+            _create_catalog(product, idx)
+        self.client.force_authenticate(user=business.user)
+
+        # count, catalogs + product
+        with django_assert_num_queries(2):
+            response = self.client.get("/api/v1/catalogs/")
+
+        assert response.status_code == status.HTTP_200_OK
+        row = response.data["results"][0]
+        assert row["primary_image"].endswith("-2.jpg")
+        assert row["variant_type_count"] == 2
+
+    def test_public_list_query_count_independent_of_catalog_count(self, django_assert_num_queries):
+        for idx in range(4):
+            _create_catalog(ProductFactory(), idx)
+
+        # count, page, then catalogs + seller, images, variant types, options for cache misses
+        with django_assert_num_queries(6):
+            response = self.client.get("/api/v1/catalogs/public/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["results"]) == 4
+        assert [len(vt["options"]) for vt in response.data["results"][0]["variant_types"]] == [2, 2]
+
+    def test_public_list_served_from_cache(self, django_assert_num_queries):
+        catalogs = [_create_catalog(ProductFactory(), idx) for idx in range(3)]
+        first = self.client.get("/api/v1/catalogs/public/").data["results"]
+        ProductCatalog.objects.filter(id=catalogs[0].id).touch(display_name="Teak Stool")
+
+        # count, page, then one reload for the changed catalog
+        with django_assert_num_queries(6):
+            response = self.client.get("/api/v1/catalogs/public/")
+        with django_assert_num_queries(2):
+            again = self.client.get("/api/v1/catalogs/public/")
+
+        results = response.data["results"]
+        assert [row["id"] for row in results] == [catalogs[0].id, *[row["id"] for row in first[:-1]]]
+        assert results[0]["display_name"] == "Teak Stool"
+        assert again.data["results"] == results
+
+    def test_public_list_hides_unavailable_options(self):
+        catalog = _create_catalog(ProductFactory(), 0)
+        CatalogVariantOption.objects.filter(variant_type__catalog=catalog, option_name="A").update(is_available=False)
+
+        response = self.client.get("/api/v1/catalogs/public/")
+
+        options = response.data["results"][0]["variant_types"][0]["options"]
+        assert [option["option_name"] for option in options] == ["B"]
+
+    def test_public_list_search_matches_display_name(self):
+        _create_catalog(ProductFactory(), 0)
+        _create_catalog(ProductFactory(), 1)
+
+        response = self.client.get("/api/v1/catalogs/public/", {"search": "chair 1"})
+
+        assert [row["display_name"] for row in response.data["results"]] == ["Teak Chair 1"]
+
+    def test_owner_detail_keeps_unavailable_options(self):
+        catalog = _create_catalog(ProductFactory(), 0)
+        CatalogVariantOption.objects.filter(variant_type__catalog=catalog, option_name="A").update(is_available=False)
+        self.client.force_authenticate(user=catalog.product.business.user)
+
+        response = self.client.get(f"/api/v1/catalogs/{catalog.id}/")
+
+        options = response.data["variant_types"][0]["options"]
+        assert [option["option_name"] for option in options] == ["A", "B"]
+
+    def test_create_rejects_sort_order_beyond_smallint(self):
+        product = ProductFactory()
+        self.client.force_authenticate(user=product.business.user)
+
+        response = self.client.post(
+            "/api/v1/catalogs/",
+            {
+                "product": product.id,
+                "display_name": "Teak Chair",
+                "base_price_exw": "20.00",
+                "variant_types": [{"type_name": "Ukuran", "sort_order": 40000}],
+            },
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not ProductCatalog.objects.exists()
+
+    def test_owner_detail_query_count(self, django_assert_num_queries):
+        catalog = _create_catalog(ProductFactory(), 0)
+        self.client.force_authenticate(user=catalog.product.business.user)
+
+        # catalog + product + enrichment, images, variant types, options
+        with django_assert_num_queries(4):
+            response = self.client.get(f"/api/v1/catalogs/{catalog.id}/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["product_hs_code"] is None
+
+    def test_owner_detail_include_subset(self, django_assert_num_queries):
+        catalog = _create_catalog(ProductFactory(), 0)
+        self.client.force_authenticate(user=catalog.product.business.user)
+
+        # catalog + product + enrichment, images
+        with django_assert_num_queries(2):
+            response = self.client.get(f"/api/v1/catalogs/{catalog.id}/", {"include": "images"})
+        bare = self.client.get(f"/api/v1/catalogs/{catalog.id}/", {"include": ""})
+
+        assert len(response.data["images"]) == 2
+        assert "variant_types" not in response.data
+        assert "images" not in bare.data and "variant_types" not in bare.data
+        assert bare.data["display_name"] == "Teak Chair 0"
+
+    def test_buyer_detail_query_count(self, django_assert_num_queries):
+        catalog = _create_catalog(ProductFactory(), 0)
+        ProductEnrichmentFactory(product=catalog.product, hs_code_recommendation="94036000")
+        CatalogVariantOption.objects.filter(variant_type__catalog=catalog, option_name="A").update(is_available=False)
+        self.client.force_authenticate(user=UserFactory(role=UserRole.BUYER))
+
+        # catalog + product + enrichment, images, variant types, available options
+        with django_assert_num_queries(4):
+            response = self.client.get(f"/api/v1/catalogs/{catalog.id}/")
+
+        assert response.data["product_hs_code"] == "94036000"
+        assert [option["option_name"] for option in response.data["variant_types"][0]["options"]] == ["B"]
+
+
+@pytest.mark.django_db
+class TestCatalogBulkCreate:
+    """POST /catalogs/bulk/ creates many catalogs with one insert per table"""
+
+    url = "/api/v1/catalogs/bulk/"
+
+    def setup_method(self):
+        self.client = APIClient()
+
+    def _item(self, product, **extra):
+        return {
+            "product_id": product.id,
+            "display_name": f"Rattan Basket {product.id}",
+            "base_price_exw": "12.50",
+            "images": [
+                {"image_url": "https://example.com/a.jpg"},
+                {"image_url": "https://example.com/b.jpg", "sort_order": 1, "is_primary": True},
+            ],
+            "variant_types": [
+                {"type_name": "Ukuran", "sort_order": 1, "options": [{"option_name": "L"}]},
+                {
+                    "type_name": "Warna",
+                    "options": [{"option_name": "Hitam", "sort_order": 1}, {"option_name": "Coklat"}],
+                },
+            ],
+            **extra,
+        }
+
+    def test_creates_catalogs_with_children(self, django_assert_max_num_queries):
+        first = ProductFactory()
+        products = [first, ProductFactory(business=first.business), ProductFactory(business=first.business)]
+        self.client.force_authenticate(user=first.business.user)
+
+        payload = [self._item(product, is_published=True) for product in products]
+        # ownership check, savepoint, 4 inserts, response list
+        with django_assert_max_num_queries(9):
+            response = self.client.post(self.url, payload, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert len(response.data["data"]) == 3
+        catalog = ProductCatalog.objects.get(product=products[0])
+        assert catalog.base_price_exw == Decimal("12.50")
+        assert catalog.published_at is not None
+        assert catalog.primary_image_url == "https://example.com/b.jpg"
+        assert catalog.variant_matrix == {"Warna": ["Coklat", "Hitam"], "Ukuran": ["L"]}
+        assert catalog.images.count() == 2
+        assert CatalogVariantOption.objects.filter(variant_type__catalog=catalog).count() == 3
+
+    def test_rejects_products_of_other_users(self):
+        own, other = ProductFactory(), ProductFactory()
+        self.client.force_authenticate(user=own.business.user)
+
+        response = self.client.post(self.url, [self._item(own), self._item(other)], format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not ProductCatalog.objects.exists()
+
+    def test_duplicate_variant_names_roll_back_everything(self):
+        product = ProductFactory()
+        self.client.force_authenticate(user=product.business.user)
+        item = self._item(product)
+        item["variant_types"].append({"type_name": "Warna"})
+
+        response = self.client.post(self.url, [item], format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not ProductCatalog.objects.exists()
+
+
+@pytest.mark.django_db
+class TestCatalogImageUrls:
+    """Uploaded image URLs are absolutized against the request host"""
+
+    def test_uploaded_and_external_urls(self):
+        catalog = _create_catalog(ProductFactory(), 0)
+        ProductCatalogImage.objects.create(catalog=catalog, image="catalogs/upload.jpg", sort_order=2)
+        client = APIClient()
+        client.force_authenticate(user=catalog.product.business.user)
+
+        response = client.get(f"/api/v1/catalogs/{catalog.id}/images/")
+
+        assert [image["url"] for image in response.data["data"]] == [
+            "https://example.com/0-1.jpg",
+            "https://example.com/0-2.jpg",
+            "http://testserver/media/catalogs/upload.jpg",
+        ]
+
+
+@pytest.mark.django_db
+class TestPublicCatalogDetailCache:
+    """Public catalog detail is cached until the catalog or its children change"""
+
+    def setup_method(self):
+        self.client = APIClient()
+        cache.clear()
+
+    def test_repeat_request_served_from_cache(self, django_assert_num_queries):
+        catalog = _create_catalog(ProductFactory(), 0)
+        url = f"/api/v1/catalogs/public/{catalog.id}/"
+        self.client.get(url)
+
+        # fingerprint only
+        with django_assert_num_queries(1):
+            response = self.client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["data"]["display_name"] == "Teak Chair 0"
+
+    def test_option_change_invalidates_cache(self):
+        catalog = _create_catalog(ProductFactory(), 0)
+        url = f"/api/v1/catalogs/public/{catalog.id}/"
+        self.client.get(url)
+
+        option = CatalogVariantOption.objects.get(
+            variant_type__catalog=catalog, variant_type__sort_order=0, option_name="A"
+        )
+        option.is_available = False
+        option.save()
+
+        options = self.client.get(url).data["data"]["variant_types"][0]["options"]
+        assert [option["option_name"] for option in options] == ["B"]
+
+    def test_company_rename_invalidates_cache(self):
+        catalog = _create_catalog(ProductFactory(), 0)
+        url = f"/api/v1/catalogs/public/{catalog.id}/"
+        self.client.get(url)
+        self.client.get("/api/v1/catalogs/public/")
+
+        stamp = ProductCatalog.objects.get(pk=catalog.pk).updated_at
+        profile = BusinessProfile.objects.get(pk=catalog.product.business_id)
+        profile.save()
+        unchanged = ProductCatalog.objects.get(pk=catalog.pk).updated_at
+        profile.company_name = "PT Jati Baru"
+        profile.save()
+
+        assert unchanged == stamp
+        assert self.client.get(url).data["data"]["seller_name"] == "PT Jati Baru"
+        assert self.client.get("/api/v1/catalogs/public/").data["results"][0]["seller_name"] == "PT Jati Baru"
+
+    def test_unpublished_catalog_not_found(self):
+        catalog = _create_catalog(ProductFactory(), 0)
+        ProductCatalog.objects.filter(id=catalog.id).update(is_published=False)
+
+        response = self.client.get(f"/api/v1/catalogs/public/{catalog.id}/")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestVariantNameUniqueness:
+    """Duplicate variant names are rejected by the DB constraint as a 400"""
+
+    def setup_method(self):
+        self.client = APIClient()
+
+    def test_duplicate_variant_type_name(self):
+        catalog = _create_catalog(ProductFactory(), 0)
+        self.client.force_authenticate(user=catalog.product.business.user)
+
+        response = self.client.post(
+            f"/api/v1/catalogs/{catalog.id}/variant-types/", {"type_name": "Warna"}, format="json"
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "type_name" in response.data["errors"]
+        assert catalog.variant_types.count() == 2
+
+    def test_duplicate_variant_option_name(self):
+        catalog = _create_catalog(ProductFactory(), 0)
+        variant_type = catalog.variant_types.first()
+        self.client.force_authenticate(user=catalog.product.business.user)
+
+        response = self.client.post(
+            f"/api/v1/catalogs/{catalog.id}/variant-types/{variant_type.id}/options/",
+            {"option_name": "A"},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "option_name" in response.data["errors"]
+
+    def test_variant_type_with_duplicate_options_rolled_back(self):
+        catalog = _create_catalog(ProductFactory(), 0)
+        self.client.force_authenticate(user=catalog.product.business.user)
+
+        response = self.client.post(
+            f"/api/v1/catalogs/{catalog.id}/variant-types/",
+            {"type_name": "Bahan", "options": [{"option_name": "Jati"}, {"option_name": "Jati"}]},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not catalog.variant_types.filter(type_name="Bahan").exists()
+
+    def test_variant_type_options_bulk_inserted(self):
+        catalog = _create_catalog(ProductFactory(), 0)
+        self.client.force_authenticate(user=catalog.product.business.user)
+
+        response = self.client.post(
+            f"/api/v1/catalogs/{catalog.id}/variant-types/",
+            {"type_name": "Bahan", "options": [{"option_name": "Jati"}, {"option_name": "Mahoni", "sort_order": 1}]},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        catalog.refresh_from_db()
+        assert catalog.variant_matrix["Bahan"] == ["Jati", "Mahoni"]
+
+
+@pytest.mark.django_db
+class TestCatalogAIDescriptionRegenerate:
+    """Identical description requests reuse the cached AI answer unless regenerate is set"""
+
+    def setup_method(self):
+        self.client = APIClient()
+
+    @pytest.fixture
+    def calls(self, settings, monkeypatch):
+        settings.KOLOSAL_API_KEY = "test-key"
+        cache.clear()
+        service = CatalogAIService()
+        calls = []
+
+        def create(**kwargs):
+            calls.append(kwargs)
+            content = f'{{"export_buyer_description": "answer {len(calls)}"}}'
+            return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+        monkeypatch.setattr(service.client.chat.completions, "create", create)
+        monkeypatch.setattr("apps.catalogs.services._catalog_ai_service", service)
+        return calls
+
+    def test_regenerate_skips_cached_answer(self, calls):
+        catalog = _create_catalog(ProductFactory(), 0)
+        self.client.force_authenticate(user=catalog.product.business.user)
+        url = f"/api/v1/catalogs/{catalog.id}/ai/description/"
+
+        first = self.client.post(url, {}, format="json")
+        repeat = self.client.post(url, {}, format="json")
+        regenerated = self.client.post(url, {"regenerate": True}, format="json")
+
+        assert first.data["data"]["export_description"] == "answer 1"
+        assert repeat.data["data"]["export_description"] == "answer 1"
+        assert regenerated.data["data"]["export_description"] == "answer 2"
+        assert len(calls) == 2
+
+    def test_list_body_is_not_a_regenerate_request(self, calls):
+        catalog = _create_catalog(ProductFactory(), 0)
+        self.client.force_authenticate(user=catalog.product.business.user)
+
+        response = self.client.post(f"/api/v1/catalogs/{catalog.id}/ai/market-intelligence/", [], format="json")
+
+        assert response.status_code == 200
+        assert len(calls) == 1
@@ -3,6 +3,7 @@ URL Configuration for Product Catalog Module
 
 Endpoints:
 - GET/POST   /catalogs/                                     - List/Create catalogs
+- POST       /catalogs/bulk/                                - Create many catalogs at once
 - GET/PUT/DELETE /catalogs/:id/                             - Catalog detail
 - GET/POST   /catalogs/:id/images/                          - List/Add images
 - PUT/DELETE /catalogs/:id/images/:image_id/                - Update/Delete image
@@ -25,6 +26,7 @@ from django.urls import path
 
 from .views import (
     CatalogListCreateView,
+    CatalogBulkCreateView,
     CatalogDetailView,
     CatalogImageListCreateView,
     CatalogImageDetailView,
@@ -45,6 +47,7 @@ app_name = "catalogs"
 urlpatterns = [
     # Catalog CRUD (authenticated)
     path("", CatalogListCreateView.as_view(), name="catalog-list-create"),
+    path("bulk/", CatalogBulkCreateView.as_view(), name="catalog-bulk-create"),
     path("<int:catalog_id>/", CatalogDetailView.as_view(), name="catalog-detail"),
 
     # Catalog Images
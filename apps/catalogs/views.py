@@ -9,18 +9,22 @@ Implements CRUD endpoints for:
 """
 
 import logging
+from django.core.cache import cache
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
+from django.http import Http404
 from django.shortcuts import get_object_or_404
-from django.db import models
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import IntegrityError, connection, models, transaction
 
 from apps.products.models import Product
 from .models import ProductCatalog, ProductCatalogImage, CatalogVariantType, CatalogVariantOption
 from .serializers import (
+    DETAIL_INCLUDES,
     ProductCatalogSerializer,
     ProductCatalogListSerializer,
     ProductCatalogCreateSerializer,
@@ -36,6 +40,9 @@ from .serializers import (
 
 logger = logging.getLogger(__name__)
 
+PUBLIC_CATALOG_CACHE_TIMEOUT = 3600  # seconds
+BULK_CREATE_MAX_ITEMS = 1000
+
 
 class CatalogPagination(PageNumberPagination):
     page_size = 10
@@ -66,9 +73,9 @@ class CatalogListCreateView(APIView):
         user = request.user
 
         # Get user's business profile products
-        catalogs = ProductCatalog.objects.filter(
+        catalogs = ProductCatalogListSerializer.setup_eager_loading(ProductCatalog.objects).filter(
             product__business__user=user
-        ).select_related("product").prefetch_related("images", "variant_types__options")
+        )
 
         # Filter by published status if provided
         is_published = request.query_params.get("is_published")
@@ -160,6 +167,7 @@ class CatalogListCreateView(APIView):
             if uploaded_images:
                 storage_service = get_catalog_storage_service()
                 max_size = 10 * 1024 * 1024  # 10MB
+                new_images = []
                 
                 for idx, image_file in enumerate(uploaded_images):
                     # Validate file size
@@ -173,15 +181,14 @@ class CatalogListCreateView(APIView):
                         supabase_url = storage_service.upload_image(image_file, catalog.id)
                         
                         if supabase_url:
-                            # Create image record with Supabase URL
-                            ProductCatalogImage.objects.create(
-                                catalog=catalog,
+                            # Image record with Supabase URL, inserted with the others below
+                            new_images.append(ProductCatalogImage(
                                 image_url=supabase_url,
                                 alt_text=request.data.get(f"alt_text_{idx}", ""),
                                 sort_order=idx,
                                 is_primary=(idx == 0)  # First image is primary
-                            )
-                            logger.info(f"Image {idx+1} uploaded and saved for catalog {catalog.id}")
+                            ))
+                            logger.info(f"Image {idx+1} uploaded for catalog {catalog.id}")
                         else:
                             logger.warning(f"Image {idx+1} upload returned None, skipping")
                     except ValueError as e:
@@ -191,9 +198,11 @@ class CatalogListCreateView(APIView):
                     except Exception as e:
                         logger.error(f"Failed to upload image {idx+1}: {e}")
                         # Continue with other images
+
+                ProductCatalogImage.bulk_add(catalog, new_images)
             
-            # Refresh catalog to include new images
-            catalog.refresh_from_db()
+            # Reload catalog with its new images, prefetched for the response
+            catalog = ProductCatalogSerializer.setup_eager_loading(ProductCatalog.objects).get(pk=catalog.pk)
             response_serializer = ProductCatalogSerializer(catalog)
             return Response(
                 {
@@ -210,6 +219,58 @@ class CatalogListCreateView(APIView):
         )
 
 
+class CatalogBulkCreateView(APIView):
+    """
+    POST: Create many catalogs from a JSON array (seller onboarding)
+
+    Each item takes the same fields as POST /catalogs/ with images given as
+    image_url. Catalogs, images and variants are inserted with one bulk insert
+    per table; large variant option batches are streamed with COPY.
+    """
+
+    permission_classes = [IsAuthenticated]
+    parser_classes = [JSONParser]
+
+    def post(self, request):
+        """Create catalogs in bulk, all or nothing"""
+        serializer = ProductCatalogCreateSerializer(
+            data=request.data,
+            many=True,
+            allow_empty=False,
+            max_length=BULK_CREATE_MAX_ITEMS,
+            context={"request": request},
+        )
+        if not serializer.is_valid():
+            return Response(
+                {"success": False, "message": "Validation failed", "errors": serializer.errors},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            catalogs = serializer.save()
+        except IntegrityError:
+            return Response(
+                {
+                    "success": False,
+                    "message": "Validation failed",
+                    "errors": {"variant_types": ["Variant type and option names must be unique per catalog"]},
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        created = ProductCatalogListSerializer.setup_eager_loading(ProductCatalog.objects).filter(
+            id__in=[catalog.id for catalog in catalogs]
+        )
+        return Response(
+            {
+                "success": True,
+                "message": f"{len(catalogs)} catalogs created successfully",
+                "data": ProductCatalogListSerializer(created, many=True).data,
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
+
 class CatalogDetailView(APIView):
     """
     GET: Get catalog detail
@@ -220,29 +281,45 @@ class CatalogDetailView(APIView):
     permission_classes = [IsAuthenticated]
     parser_classes = [MultiPartParser, FormParser, JSONParser]
 
-    def get_catalog(self, catalog_id, user):
-        """Helper to get catalog with ownership check or published catalog for buyers"""
+    def get_catalog(self, catalog_id, user, include=DETAIL_INCLUDES):
+        """
+        Helper to get catalog with ownership check or published catalog for buyers.
+        include selects the nested collections to prefetch.
+        """
         from apps.users.models import UserRole
         
         # If user is BUYER, allow access to published catalogs
         if user.role == UserRole.BUYER:
+            # Buyers can only view published catalogs
             return get_object_or_404(
-                ProductCatalog.objects.select_related("product").prefetch_related("images", "variant_types__options"),
+                ProductCatalogSerializer.setup_eager_loading(
+                    ProductCatalog.published, available_only=True, include=include
+                ),
                 id=catalog_id,
-                is_published=True,  # Buyers can only view published catalogs
             )
         
         # For UMKM/others, check ownership
         return get_object_or_404(
-            ProductCatalog.objects.select_related("product").prefetch_related("images", "variant_types__options"),
+            ProductCatalogSerializer.setup_eager_loading(ProductCatalog.objects, include=include),
             id=catalog_id,
             product__business__user=user,
         )
 
     def get(self, request, catalog_id):
-        """Get catalog detail"""
-        catalog = self.get_catalog(catalog_id, request.user)
-        serializer = ProductCatalogSerializer(catalog)
+        """
+        Get catalog detail.
+
+        ?include=images,variant_types picks the nested collections to embed
+        (both when omitted, none when empty).
+        """
+        include = request.query_params.get("include")
+        if include is None:
+            include = DETAIL_INCLUDES
+        else:
+            include = tuple(name for name in include.split(",") if name in DETAIL_INCLUDES)
+
+        catalog = self.get_catalog(catalog_id, request.user, include=include)
+        serializer = ProductCatalogSerializer(catalog, include=include)
         return Response(serializer.data)
 
     def put(self, request, catalog_id):
@@ -266,7 +343,8 @@ class CatalogDetailView(APIView):
                 status_code=status.HTTP_403_FORBIDDEN
             )
         
-        catalog = self.get_catalog(catalog_id, request.user)
+        # No nested prefetch: the response reloads the catalog after the update
+        catalog = self.get_catalog(catalog_id, request.user, include=())
 
         # Handle new image uploads
         data = request.data.copy()
@@ -308,6 +386,7 @@ class CatalogDetailView(APIView):
                 max_sort_order = catalog.images.aggregate(
                     max_order=models.Max("sort_order")
                 )["max_order"] or -1
+                new_images = []
                 
                 for idx, image_file in enumerate(uploaded_images):
                     # Validate file size
@@ -321,15 +400,14 @@ class CatalogDetailView(APIView):
                         supabase_url = storage_service.upload_image(image_file, catalog.id)
                         
                         if supabase_url:
-                            # Create image record with Supabase URL
-                            ProductCatalogImage.objects.create(
-                                catalog=catalog,
+                            # Image record with Supabase URL, inserted with the others below
+                            new_images.append(ProductCatalogImage(
                                 image_url=supabase_url,
                                 alt_text=request.data.get(f"alt_text_{idx}", ""),
                                 sort_order=max_sort_order + idx + 1,
                                 is_primary=False  # Don't change primary on update
-                            )
-                            logger.info(f"New image {idx+1} uploaded and saved for catalog {catalog.id}")
+                            ))
+                            logger.info(f"New image {idx+1} uploaded for catalog {catalog.id}")
                         else:
                             logger.warning(f"Image {idx+1} upload returned None, skipping")
                     except ValueError as e:
@@ -337,9 +415,11 @@ class CatalogDetailView(APIView):
                         logger.error(f"Image {idx+1} validation failed: {e}")
                     except Exception as e:
                         logger.error(f"Failed to upload image {idx+1}: {e}")
+
+                ProductCatalogImage.bulk_add(catalog, new_images)
             
-            # Refresh catalog to include new images
-            catalog.refresh_from_db()
+            # Reload catalog with its new images, prefetched for the response
+            catalog = ProductCatalogSerializer.setup_eager_loading(ProductCatalog.objects).get(pk=catalog.pk)
             response_serializer = ProductCatalogSerializer(catalog)
             return Response(
                 {
@@ -370,7 +450,7 @@ class CatalogDetailView(APIView):
                 status_code=status.HTTP_403_FORBIDDEN
             )
         
-        catalog = self.get_catalog(catalog_id, request.user)
+        catalog = self.get_catalog(catalog_id, request.user, include=())
         catalog_id = catalog.id
         catalog.delete()
 
@@ -629,7 +709,7 @@ class CatalogVariantTypeListCreateView(APIView):
             id=catalog_id,
             product__business__user=request.user,
         )
-        variant_types = catalog.variant_types.prefetch_related("options").all()
+        variant_types = CatalogVariantTypeSerializer.setup_eager_loading(catalog.variant_types.all())
         serializer = CatalogVariantTypeSerializer(variant_types, many=True)
 
         # Also return predefined types for dropdown
@@ -654,7 +734,19 @@ class CatalogVariantTypeListCreateView(APIView):
 
         serializer = CatalogVariantTypeCreateSerializer(data=data)
         if serializer.is_valid():
-            variant_type = serializer.save()
+            # Name uniqueness is enforced by uq_variant_type_name_per_catalog, not a pre-check SELECT
+            try:
+                with transaction.atomic():
+                    variant_type = serializer.save()
+            except IntegrityError:
+                return Response(
+                    {
+                        "success": False,
+                        "message": "Validation failed",
+                        "errors": {"type_name": ["Variant type with this name already exists in this catalog"]},
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
             response_serializer = CatalogVariantTypeSerializer(variant_type)
             return Response(
                 {
@@ -762,7 +854,19 @@ class CatalogVariantOptionListCreateView(APIView):
 
         serializer = CatalogVariantOptionCreateSerializer(data=data)
         if serializer.is_valid():
-            option = serializer.save()
+            # Name uniqueness is enforced by uq_variant_option_name_per_type, not a pre-check SELECT
+            try:
+                with transaction.atomic():
+                    option = serializer.save()
+            except IntegrityError:
+                return Response(
+                    {
+                        "success": False,
+                        "message": "Validation failed",
+                        "errors": {"option_name": ["Option with this name already exists for this variant type"]},
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
             response_serializer = CatalogVariantOptionSerializer(option)
             return Response(
                 {
@@ -837,6 +941,25 @@ class CatalogVariantOptionDetailView(APIView):
 # ============================================================
 
 
+def _public_catalog_data(catalogs):
+    """
+    PublicCatalogSerializer data for catalogs carrying only id and updated_at,
+    in the given order. Each catalog version is cached on its own, so only
+    cache misses are loaded (with prefetches) and serialized.
+    """
+    keys = {catalog.id: f"public_catalog:{catalog.id}:{catalog.updated_at.timestamp()}" for catalog in catalogs}
+    data = cache.get_many(keys.values())
+    missing = [catalog_id for catalog_id, key in keys.items() if key not in data]
+    if missing:
+        loaded = list(PublicCatalogSerializer.setup_eager_loading(ProductCatalog.published).filter(id__in=missing))
+        # One ListSerializer binds a single child for all rows
+        rows = PublicCatalogSerializer(loaded, many=True).data
+        fresh = {keys[catalog.id]: row for catalog, row in zip(loaded, rows)}
+        cache.set_many(fresh, PUBLIC_CATALOG_CACHE_TIMEOUT)
+        data.update(fresh)
+    return [data[keys[catalog.id]] for catalog in catalogs if keys[catalog.id] in data]
+
+
 class PublicCatalogListView(APIView):
     """
     GET: List all published catalogs (public, no auth required)
@@ -847,13 +970,19 @@ class PublicCatalogListView(APIView):
 
     def get(self, request):
         """List all published catalogs for buyers"""
-        catalogs = ProductCatalog.objects.filter(
-            is_published=True
-        ).select_related("product__business").prefetch_related("images", "variant_types__options")
+        # Page over id/updated_at only; rows are served from the per-catalog cache
+        catalogs = ProductCatalog.published.only("id", "updated_at")
 
-        # Search by display name
+        # Full-text search on PostgreSQL (GIN-indexed search_vector), display name match elsewhere
         search = request.query_params.get("search")
-        if search:
+        if search and connection.vendor == "postgresql":
+            query = SearchQuery(search, config="english", search_type="websearch")
+            catalogs = (
+                catalogs.filter(search_vector=query)
+                .annotate(rank=SearchRank(models.F("search_vector"), query))
+                .order_by("-rank", "-updated_at")
+            )
+        elif search:
             catalogs = catalogs.filter(display_name__icontains=search)
 
         # Filter by tags
@@ -873,8 +1002,7 @@ class PublicCatalogListView(APIView):
         paginator = self.pagination_class()
         page = paginator.paginate_queryset(catalogs, request)
 
-        serializer = PublicCatalogSerializer(page, many=True)
-        return paginator.get_paginated_response(serializer.data)
+        return paginator.get_paginated_response(_public_catalog_data(page))
 
 
 class PublicCatalogDetailView(APIView):
@@ -886,13 +1014,13 @@ class PublicCatalogDetailView(APIView):
 
     def get(self, request, catalog_id):
         """Get catalog detail for buyers"""
-        catalog = get_object_or_404(
-            ProductCatalog.objects.select_related("product__business").prefetch_related("images", "variant_types__options"),
-            id=catalog_id,
-            is_published=True,
-        )
-        serializer = PublicCatalogSerializer(catalog)
-        return Response({"success": True, "data": serializer.data})
+        # Cheap fingerprint first; updated_at also moves on image/variant changes
+        catalog = get_object_or_404(ProductCatalog.published.only("id", "updated_at"), id=catalog_id)
+        data = _public_catalog_data([catalog])
+        if not data:
+            raise Http404
+
+        return Response({"success": True, "data": data[0]})
 
 
 # ============================================================
@@ -900,7 +1028,7 @@ class PublicCatalogDetailView(APIView):
 # ============================================================
 
 from .models import ProductMarketIntelligence, ProductPricingResult
-from .services import get_catalog_ai_service
+from .services import get_catalog_ai_service, regenerate_requested
 
 
 class CatalogAIDescriptionView(APIView):
@@ -913,6 +1041,7 @@ class CatalogAIDescriptionView(APIView):
     - safety_sheet: Material/Food safety info (flexible JSON)
 
     Optional: save_to_catalog=true to auto-save to catalog fields
+    Optional: regenerate=true to skip the cached answer for an unchanged product
     """
 
     permission_classes = [IsAuthenticated]
@@ -939,6 +1068,7 @@ class CatalogAIDescriptionView(APIView):
                 weight_gross=float(product.weight_gross) if product.weight_gross else None,
                 category=str(product.category_id) if product.category_id else "",
                 is_food_product=self._is_food_product(product),
+                cache_bypass=regenerate_requested(request.data),
             )
 
             if result.get("success"):
@@ -956,7 +1086,7 @@ class CatalogAIDescriptionView(APIView):
                     catalog.export_description = response_data["export_description"]
                     catalog.technical_specs = response_data["technical_specs"]
                     catalog.safety_info = response_data["safety_info"]
-                    catalog.save()
+                    catalog.save(update_fields=["export_description", "technical_specs", "safety_info", "updated_at"])
 
                     return Response({
                         "success": True,
@@ -1069,6 +1199,7 @@ class CatalogMarketIntelligenceView(APIView):
                 category=str(product.category_id) if product.category_id else "",
                 current_price_usd=float(catalog.base_price_exw) if catalog.base_price_exw else None,
                 production_capacity=None,
+                cache_bypass=regenerate_requested(request.data),
             )
 
             if result.get("success"):
@@ -1204,6 +1335,7 @@ class CatalogPricingView(APIView):
                 target_country_code=target_country_code,
                 dimensions=product.dimensions_l_w_h,
                 weight_gross=float(product.weight_gross) if product.weight_gross else None,
+                cache_bypass=regenerate_requested(request.data),
             )
 
             if result.get("success"):
@@ -1227,7 +1359,7 @@ class CatalogPricingView(APIView):
                 catalog.base_price_exw = pr.exw_price_usd
                 catalog.base_price_fob = pr.fob_price_usd
                 catalog.base_price_cif = pr.cif_price_usd
-                catalog.save()
+                catalog.save(update_fields=["base_price_exw", "base_price_fob", "base_price_cif", "updated_at"])
 
                 return Response({
                     "success": True,
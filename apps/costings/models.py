@@ -4,9 +4,13 @@ Costing Model for ExportReady.AI Module 4
 Stores cost breakdown and pricing calculations for products.
 """
 
+from django.core.cache import cache
 from django.db import models
 from apps.products.models import Product
 
+# Cache key of the latest rate (PriceCalculatorService.get_cached_exchange_rate)
+EXCHANGE_RATE_CACHE_KEY = "costings:exchange_rate"
+
 
 class Costing(models.Model):
     """
@@ -157,5 +161,14 @@ class ExchangeRate(models.Model):
         verbose_name_plural = "Exchange Rates"
         ordering = ["-updated_at"]
     
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        cache.delete(EXCHANGE_RATE_CACHE_KEY)
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        cache.delete(EXCHANGE_RATE_CACHE_KEY)
+        return result
+
     def __str__(self):
         return f"IDR/USD: {self.rate} ({self.source}) - {self.updated_at.strftime('%Y-%m-%d %H:%M')}"
@@ -11,9 +11,10 @@ Services:
 
 import logging
 from decimal import Decimal
+from django.core.cache import cache
 from django.utils import timezone
 from django.conf import settings
-from .models import ExchangeRate
+from .models import EXCHANGE_RATE_CACHE_KEY, ExchangeRate
 
 # Import KolosalAI for pricing recommendations
 try:
@@ -23,6 +24,8 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+EXCHANGE_RATE_CACHE_TIMEOUT = 900  # seconds
+
 
 class PriceCalculatorService:
     """
@@ -96,6 +99,19 @@ class PriceCalculatorService:
             logger.warning("Failed to fetch exchange rate, using fallback rate 15800")
             return Decimal("15800.00")
     
+    @staticmethod
+    def get_cached_exchange_rate():
+        """
+        get_exchange_rate() memoized for EXCHANGE_RATE_CACHE_TIMEOUT.
+
+        Saving or deleting an ExchangeRate clears the cached value.
+        """
+        rate = cache.get(EXCHANGE_RATE_CACHE_KEY)
+        if rate is None:
+            rate = PriceCalculatorService.get_exchange_rate()
+            cache.set(EXCHANGE_RATE_CACHE_KEY, rate, EXCHANGE_RATE_CACHE_TIMEOUT)
+        return rate
+
     @staticmethod
     def fetch_live_exchange_rate():
         """
@@ -56,6 +56,17 @@ class TestPriceCalculatorService:
         
         assert cif is None
 
+    def test_cached_exchange_rate_cleared_on_save(self, django_assert_num_queries):
+        """Cached rate skips the lookup until an ExchangeRate is saved"""
+        first = PriceCalculatorService.get_cached_exchange_rate()
+        with django_assert_num_queries(0):
+            assert PriceCalculatorService.get_cached_exchange_rate() == first
+
+        ExchangeRateFactory(rate=Decimal("16250.00"))
+
+        assert first == Decimal("15800.00")
+        assert PriceCalculatorService.get_cached_exchange_rate() == Decimal("16250.00")
+
 
 @pytest.mark.django_db
 class TestContainerOptimizerService:
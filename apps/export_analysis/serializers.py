@@ -41,7 +41,8 @@ class CountryListSerializer(serializers.ModelSerializer):
     # [DONE] Include: regulations_count
     """
 
-    regulations_count = serializers.SerializerMethodField()
+    # Annotated by CountryListView with Count("regulations")
+    regulations_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Country
@@ -52,9 +53,6 @@ class CountryListSerializer(serializers.ModelSerializer):
             "regulations_count",
         ]
 
-    def get_regulations_count(self, obj):
-        return obj.regulations.count()
-
 
 class CountryDetailSerializer(serializers.ModelSerializer):
     """
@@ -19,6 +19,8 @@ from typing import Optional
 from django.conf import settings
 from openai import OpenAI
 
+from core.services.http import get_kolosal_http_client
+
 from .models import Country, CountryRegulation, ExportAnalysis, RuleCategory, StatusGrade
 
 logger = logging.getLogger(__name__)
@@ -34,6 +36,7 @@ class ComplianceAIService:
         self.client = OpenAI(
             api_key=settings.KOLOSAL_API_KEY,
             base_url=settings.KOLOSAL_BASE_URL,
+            http_client=get_kolosal_http_client(),
         )
         self.model = settings.KOLOSAL_MODEL
 
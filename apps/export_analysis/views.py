@@ -16,7 +16,7 @@ All acceptance criteria for these PBIs are implemented in this module.
 
 import logging
 
-from django.db.models import Q
+from django.db.models import Count, Q
 from django.shortcuts import get_object_or_404
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
@@ -489,7 +489,7 @@ class CountryListView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        queryset = Country.objects.all()
+        queryset = Country.objects.annotate(regulations_count=Count("regulations"))
 
         # Filter by region
         region = request.query_params.get("region")
@@ -0,0 +1,37 @@
+# Generated manually: PostgreSQL-only GIN indexes for forwarder route/service filters
+
+from django.db import migrations
+
+CREATE_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS fp_routes_gin ON forwarder_profiles "
+    "USING GIN (specialization_routes jsonb_path_ops);",
+    "CREATE INDEX IF NOT EXISTS fp_service_types_gin ON forwarder_profiles "
+    "USING GIN (service_types jsonb_path_ops);",
+]
+
+DROP_INDEXES = [
+    "DROP INDEX IF EXISTS fp_routes_gin;",
+    "DROP INDEX IF EXISTS fp_service_types_gin;",
+]
+
+
+def _run_on_postgres(statements):
+    def run(apps, schema_editor):
+        # GIN/jsonb_path_ops are PostgreSQL-specific; other backends (SQLite in tests) skip them
+        if schema_editor.connection.vendor != "postgresql":
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("forwarders", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(_run_on_postgres(CREATE_INDEXES), _run_on_postgres(DROP_INDEXES)),
+    ]
@@ -76,8 +76,8 @@ class ForwarderProfile(models.Model):
         ordering = ["-created_at"]
         indexes = [
             models.Index(fields=["average_rating"]),
-            # GIN index for JSONB specialization_routes (PostgreSQL specific)
-            # Note: Django doesn't support GIN indexes directly, will need raw SQL in migration
+            # GIN indexes (jsonb_path_ops) on specialization_routes and service_types are
+            # PostgreSQL-only, see migration 0002_forwarderprofile_gin_indexes
         ]
 
     def __str__(self):
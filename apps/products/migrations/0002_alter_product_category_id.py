@@ -0,0 +1,18 @@
+# Generated by Django 5.0.14 on 2026-10-17 15:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='product',
+            name='category_id',
+            field=models.IntegerField(db_index=True),
+        ),
+    ]
@@ -11,7 +11,7 @@ class Product(models.Model):
         BusinessProfile, on_delete=models.CASCADE, related_name="products"
     )
     name_local = models.CharField(max_length=255)
-    category_id = models.IntegerField()
+    category_id = models.IntegerField(db_index=True)
     description_local = models.TextField()
     material_composition = models.TextField(blank=True)
     production_technique = models.CharField(max_length=50, blank=True)
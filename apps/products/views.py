@@ -30,7 +30,7 @@ from rest_framework.pagination import PageNumberPagination
 
 from apps.users.models import UserRole
 from apps.catalogs.models import ProductMarketIntelligence, ProductPricingResult
-from apps.catalogs.services import CatalogAIService
+from apps.catalogs.services import CatalogAIService, regenerate_requested
 from core.services import KolosalAIService
 from core.responses import created_response
 from core.exceptions import ForbiddenException, NotFoundException
@@ -396,6 +396,7 @@ class ProductCatalogDescriptionView(APIView):
 
     Request body (optional):
     - is_food_product: bool (default: false) - affects safety_info content
+    - regenerate: bool (default: false) - skip the cached AI answer for an unchanged product
 
     Response:
     - success: true
@@ -447,6 +448,7 @@ class ProductCatalogDescriptionView(APIView):
                 weight_gross=float(product.weight_gross) if product.weight_gross else None,
                 category=str(product.category_id) if product.category_id else "",
                 is_food_product=is_food_product,
+                cache_bypass=regenerate_requested(request.data),
             )
 
             logger.info(f"AI result: success={result.get('success')}, has_data={bool(result.get('data'))}")
@@ -583,7 +585,8 @@ class ProductPricingView(APIView):
                 target_margin_percent=float(target_margin_percent),
                 material_composition=product.material_composition,
                 target_country_code=target_country_code,
-                weight_gross=float(product.weight_gross) if product.weight_gross else 1.0
+                weight_gross=float(product.weight_gross) if product.weight_gross else 1.0,
+                cache_bypass=regenerate_requested(request.data),
             )
 
             if not result.get("success"):
@@ -0,0 +1,24 @@
+# Generated by Django 5.0.14 on 2026-10-17 16:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0002_alter_user_role"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="rank_cache",
+            field=models.PositiveSmallIntegerField(
+                blank=True,
+                default=None,
+                help_text="Denormalized BusinessProfile.certification_count (null = no business profile)",
+                null=True,
+                verbose_name="rank cache",
+            ),
+        ),
+    ]
@@ -66,6 +66,7 @@ class User(AbstractBaseUser, PermissionsMixin):
         - password: Hashed password (inherited from AbstractBaseUser)
         - full_name: User's full name
         - role: User role (Admin or UMKM)
+        - rank_cache: Denormalized business profile rank, kept in sync by BusinessProfile
         - created_at: Timestamp when user was created
         - is_active: Whether the user account is active
         - is_staff: Whether the user can access admin site
@@ -86,6 +87,13 @@ class User(AbstractBaseUser, PermissionsMixin):
         choices=UserRole.choices,
         default=UserRole.UMKM,
     )
+    rank_cache = models.PositiveSmallIntegerField(
+        "rank cache",
+        null=True,
+        blank=True,
+        default=None,
+        help_text="Denormalized BusinessProfile.certification_count (null = no business profile)",
+    )
     created_at = models.DateTimeField("created at", auto_now_add=True)
     updated_at = models.DateTimeField("updated at", auto_now=True)
 
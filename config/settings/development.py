@@ -27,7 +27,7 @@ EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
 
 # Allow browsable API in development
 REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = (  # noqa: F405
-    "rest_framework.renderers.JSONRenderer",
+    "core.renderers.ORJSONRenderer",
     "rest_framework.renderers.BrowsableAPIRenderer",
 )
 
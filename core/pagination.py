@@ -2,6 +2,11 @@
 Custom Pagination Classes for ExportReady.AI API
 """
 
+import hashlib
+
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 
@@ -73,3 +78,66 @@ class StandardResultsSetPagination(PageNumberPagination):
             },
         }
 
+
+class CachedCountPaginator(Paginator):
+    """
+    Paginator that caches the total object count.
+
+    The first page always recomputes and stores the count, so later pages
+    reuse it instead of running SELECT COUNT(*) again.
+    """
+
+    def __init__(self, object_list, per_page, cache_key=None, cache_timeout=60, refresh=False, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.cache_key = cache_key
+        self.cache_timeout = cache_timeout
+        self.refresh = refresh
+
+    @cached_property
+    def count(self):
+        if self.cache_key is None:
+            return super().count
+
+        if not self.refresh:
+            cached_count = cache.get(self.cache_key)
+            if cached_count is not None:
+                return cached_count
+
+        count = super().count
+        cache.set(self.cache_key, count, self.cache_timeout)
+        return count
+
+
+class CachedCountPagination(PageNumberPagination):
+    """
+    Page number pagination that caches the count per user and filter set.
+
+    Page 1 always refreshes the count; other pages may lag behind inserts
+    and deletes by up to count_cache_timeout seconds.
+    """
+
+    count_cache_timeout = 60
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self._count_cache_key = self.get_count_cache_key(request)
+        self._refresh_count = request.query_params.get(self.page_query_param, "1") == "1"
+        return super().paginate_queryset(queryset, request, view)
+
+    def django_paginator_class(self, object_list, per_page):
+        return CachedCountPaginator(
+            object_list,
+            per_page,
+            cache_key=self._count_cache_key,
+            cache_timeout=self.count_cache_timeout,
+            refresh=self._refresh_count,
+        )
+
+    def get_count_cache_key(self, request):
+        """Build a cache key from the path, user and filters (page and page size excluded)."""
+        params = sorted(
+            (key, value)
+            for key, value in request.query_params.lists()
+            if key not in (self.page_query_param, self.page_size_query_param)
+        )
+        digest = hashlib.md5(repr((request.path, params)).encode()).hexdigest()
+        return f"pagination-count:{request.user.pk}:{digest}"
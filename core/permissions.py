@@ -17,6 +17,9 @@ from rest_framework.permissions import BasePermission
 
 from apps.users.models import UserRole
 
+# Role sets are built once at import; membership is a hash lookup per request
+ADMIN_OR_UMKM_ROLES = frozenset({UserRole.ADMIN, UserRole.UMKM})
+
 
 class IsAdmin(BasePermission):
     """
@@ -110,7 +113,7 @@ class IsAdminOrUMKM(BasePermission):
         return (
             request.user
             and request.user.is_authenticated
-            and request.user.role in [UserRole.ADMIN, UserRole.UMKM]
+            and request.user.role in ADMIN_OR_UMKM_ROLES
         )
 
 
@@ -153,6 +156,8 @@ def role_required(allowed_roles):
         permission_classes = [role_required([UserRole.ADMIN, UserRole.UMKM])]
     """
 
+    allowed = frozenset(allowed_roles)
+
     class RolePermission(BasePermission):
         message = f"Only users with roles {allowed_roles} can perform this action."
 
@@ -160,7 +165,7 @@ def role_required(allowed_roles):
             return (
                 request.user
                 and request.user.is_authenticated
-                and request.user.role in allowed_roles
+                and request.user.role in allowed
             )
 
     return RolePermission
@@ -0,0 +1,38 @@
+"""
+Custom Renderers for ExportReady.AI API
+"""
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that encodes with orjson when it is installed.
+
+    orjson serializes dicts, lists, strings and numbers in C; anything else
+    (Decimal, datetimes, lazy translations, querysets, ...) goes through DRF's own
+    JSONEncoder, so the payload matches JSONRenderer's. Indented output for
+    the browsable API is left to JSONRenderer.
+    """
+
+    _fallback = JSONEncoder().default
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b""
+        # Datetimes go through the fallback too, keeping DRF's "...123Z" format
+        ret = orjson.dumps(
+            data,
+            default=self._fallback,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+        # Escape the JS line terminators as JSONRenderer does, so the body is safe inside <script>
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
@@ -2,8 +2,10 @@
 Standardized API Response Helpers for ExportReady.AI
 """
 
+from django.http import StreamingHttpResponse
 from rest_framework import status
 from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
 
 
 def success_response(data=None, message="Success", status_code=status.HTTP_200_OK):
@@ -99,3 +101,22 @@ def conflict_response(message="Resource already exists"):
     """
     return error_response(message=message, status_code=status.HTTP_409_CONFLICT)
 
+
+def streaming_success_response(queryset, serializer_class, message="Success", chunk_size=500):
+    """
+    Create a standardized success response streamed row by row.
+
+    Iterates the queryset in chunks instead of loading it all, for large
+    unpaginated exports. Produces the same shape as success_response().
+    """
+
+    def generate():
+        encoder = JSONEncoder()
+        yield '{"success": true, "message": %s, "data": [' % encoder.encode(message)
+        for index, obj in enumerate(queryset.iterator(chunk_size=chunk_size)):
+            if index:
+                yield ","
+            yield encoder.encode(serializer_class(obj).data)
+        yield "]}"
+
+    return StreamingHttpResponse(generate(), content_type="application/json")
@@ -0,0 +1,28 @@
+"""
+Shared Serializer Helpers for ExportReady.AI API
+"""
+
+import copy
+
+
+class CachedFieldsMixin:
+    """
+    Cache the fields built by get_fields() per serializer class.
+
+    ModelSerializer.get_fields() introspects the model on every instantiation,
+    which adds up on list endpoints. The fields are built once per class and
+    each serializer instance gets shallow copies, so binding a field to its
+    parent never touches the cached originals.
+
+    Only use on serializers whose fields do not depend on context or
+    instance state.
+    """
+
+    _fields_cache = {}
+
+    def get_fields(self):
+        cls = type(self)
+        cached = CachedFieldsMixin._fields_cache.get(cls)
+        if cached is None:
+            cached = CachedFieldsMixin._fields_cache.setdefault(cls, super().get_fields())
+        return {name: copy.copy(field) for name, field in cached.items()}
@@ -17,13 +17,16 @@ Implements AI Services for Product Enrichment:
 # - Output: sku_generated (string)
 """
 
+import json
 import logging
 import re
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
 
 from django.conf import settings
 from openai import OpenAI
 
+from .http import get_kolosal_http_client
+
 # Import HS Code loader
 try:
     from apps.products.utils.hs_code_loader import get_hs_loader
@@ -32,6 +35,37 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+_JSON_DECODER = json.JSONDecoder()
+
+# "N. kw1, kw2" line in a batch keyword response
+NUMBERED_LINE_RE = re.compile(r"\s*(\d+)\s*[.):-]\s*(.*)")
+
+
+def extract_json_object(text: str):
+    """
+    Parse the first JSON object embedded in an AI response.
+
+    Decodes from the first "{" with the C JSON scanner, which stops at the
+    matching brace (quotes and escapes included), so prose after the object is
+    ignored. A "{" that fails right away (e.g. "{nama}" in prose) is skipped
+    for the next one; an object that fails further in raises its
+    JSONDecodeError rather than falling back to one nested inside it.
+    Returns None when the text has no "{".
+    """
+    start = text.find("{")
+    error = None
+    while start != -1:
+        try:
+            return _JSON_DECODER.raw_decode(text, start)[0]
+        except json.JSONDecodeError as e:
+            if e.pos > start + 1:
+                raise
+            error = error or e
+            start = text.find("{", start + 1)
+    if error:
+        raise error
+    return None
+
 
 class KolosalAIService:
     """
@@ -48,6 +82,7 @@ class KolosalAIService:
         self.client = OpenAI(
             api_key=api_key.strip(),
             base_url=settings.KOLOSAL_BASE_URL,
+            http_client=get_kolosal_http_client(),
         )
         self.model = settings.KOLOSAL_MODEL
         self.hs_loader = get_hs_loader() if get_hs_loader else None
@@ -328,6 +363,76 @@ ATURAN:
             "hs_code_from_ai": hs_from_ai,  # Status apakah HS code dari AI atau fallback
         }
 
+    def extract_keywords(self, spec: str) -> List[str]:
+        """
+        Extract keywords from a single spec text.
+
+        Args:
+            spec: Specification text
+
+        Returns:
+            List of lowercase keywords
+        """
+        prompt = f"Ekstrak kata kunci penting dari spesifikasi berikut (berikan hanya kata kunci, pisahkan dengan koma):\n\n{spec}"
+        system_prompt = "Kamu adalah ahli yang mengekstrak kata kunci dari spesifikasi produk. Berikan hanya kata kunci yang relevan, pisahkan dengan koma."
+
+        response = self._call_ai(prompt, system_prompt)
+        return [k.strip().lower() for k in response.split(",") if k.strip()]
+
+    def extract_keywords_batch(self, specs: List[str]) -> List[List[str]]:
+        """
+        Extract keywords from multiple spec texts in a single AI call.
+
+        Specs are packed into one numbered prompt so N buyer requests cost one
+        round trip instead of N.
+
+        Args:
+            specs: List of specification texts
+
+        Returns:
+            List of lowercase keyword lists, aligned with ``specs``.
+            Specs the AI did not answer for get an empty list.
+        """
+        if not specs:
+            return []
+        if len(specs) == 1:
+            return [self.extract_keywords(specs[0])]
+
+        system_prompt = "Kamu adalah ahli yang mengekstrak kata kunci dari spesifikasi produk. Berikan hanya kata kunci yang relevan, pisahkan dengan koma."
+
+        prompt_parts = [
+            "Untuk setiap spesifikasi berikut, keluarkan kata kunci penting pada baris terpisah "
+            "diawali dengan nomor spesifikasi (contoh: '1. kata1, kata2').",
+            "",
+        ]
+        for idx, spec in enumerate(specs, start=1):
+            prompt_parts.append(f"{idx}. {spec}")
+
+        response = self._call_ai("\n".join(prompt_parts), system_prompt)
+        return self._parse_numbered_keywords(response, len(specs))
+
+    @staticmethod
+    def _parse_numbered_keywords(text: str, count: int) -> List[List[str]]:
+        """
+        Parse "N. kw1, kw2" lines from a batch keyword response.
+
+        Args:
+            text: Raw AI response
+            count: Number of specs that were sent
+
+        Returns:
+            List of keyword lists with ``count`` entries
+        """
+        results = [[] for _ in range(count)]
+        for line in (text or "").splitlines():
+            match = NUMBERED_LINE_RE.match(line)
+            if not match:
+                continue
+            idx = int(match.group(1)) - 1
+            if 0 <= idx < count:
+                results[idx] = [k.strip().lower() for k in match.group(2).split(",") if k.strip()]
+        return results
+
     def get_market_intelligence(
         self,
         product_name: str,
@@ -345,9 +450,6 @@ ATURAN:
         Returns:
             Dict with market intelligence data
         """
-        import json
-        import re
-        
         # Validate and sanitize inputs
         product_name = str(product_name or "").strip()[:200]
         description = str(description or "").strip()[:500]
@@ -393,9 +495,8 @@ ATURAN:
             response = self._call_ai(prompt, system_prompt)
 
             # Extract JSON from response
-            json_match = re.search(r'\{[\s\S]*\}', response)
-            if json_match:
-                result = json.loads(json_match.group())
+            result = extract_json_object(response)
+            if result is not None:
                 return {
                     "success": True,
                     "data": result
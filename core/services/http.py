@@ -0,0 +1,26 @@
+"""
+Shared HTTP client for Kolosal AI
+
+The AI services are built per request, and each OpenAI() otherwise opens its
+own connection pool (new TCP + TLS handshake per call). Passing this client
+keeps one pool of keep-alive connections to Kolosal for the whole process.
+"""
+
+import atexit
+
+import httpx
+from openai import DefaultHttpxClient
+
+KOLOSAL_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=30.0)
+
+_http_client = None
+
+
+def get_kolosal_http_client() -> httpx.Client:
+    """Get or create the process-wide pooled httpx client for OpenAI(http_client=...)."""
+    global _http_client
+    if _http_client is None:
+        # DefaultHttpxClient keeps the SDK's own defaults (timeouts, redirects)
+        _http_client = DefaultHttpxClient(limits=KOLOSAL_HTTP_LIMITS)
+        atexit.register(_http_client.close)
+    return _http_client
@@ -0,0 +1,21 @@
+"""
+Tests for Custom Renderers
+"""
+
+from decimal import Decimal
+
+from rest_framework.renderers import JSONRenderer
+
+from core.renderers import ORJSONRenderer
+
+
+class TestORJSONRenderer:
+    """orjson output matches DRF's JSONRenderer byte for byte"""
+
+    def test_line_separators_escaped(self):
+        data = {"text": "baris satu\u2028dua\u2029", "price": Decimal("12.50")}
+
+        rendered = ORJSONRenderer().render(data)
+
+        assert rendered == JSONRenderer().render(data)
+        assert b"\\u2028" in rendered and b"\\u2029" in rendered